@@ -0,0 +1,66 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+"""Import time benchmark of yasc packages.
+
+Imports every package in fresh interpreters and reports the median import
+time and the heavy optional modules it pulled in, which should be none.
+Exits with an error if an import is slower than ``--max-seconds`` or loads
+a heavy module, so that it can guard against regressions. Run it with::
+
+    python benchmarks/bench_import.py --repeat 5 --max-seconds 1.5
+
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PACKAGES = ["yasc.scorecard", "yasc.eda", "yasc.data", "yasc.preprocessing"]
+# Only imported when plotting or modelling
+HEAVY = ["matplotlib", "seaborn", "sklearn", "scipy", "pkg_resources"]
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {!r} if name in sys.modules]
+print(json.dumps([elapsed, heavy]))
+"""
+
+
+def measure(package, repeat):
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(package, HEAVY)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, heavy = json.loads(out)
+        times.append(elapsed)
+    return statistics.median(times), heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    for package in PACKAGES:
+        elapsed, heavy = measure(package, args.repeat)
+        print(
+            "{:<20} {:.3f} s  heavy modules: {}".format(
+                package, elapsed, ", ".join(heavy) or "none"
+            )
+        )
+        if heavy or (args.max_seconds and elapsed > args.max_seconds):
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
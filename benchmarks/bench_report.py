@@ -0,0 +1,65 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+"""Throughput benchmark of report rendering.
+
+Bins the numeric columns of the german credit data, copied to make as many
+variables as asked, then renders their binning plots with a loop over
+:func:`woebinplot` and with :func:`plot_report`, and reports charts per
+second. Run it with::
+
+    python benchmarks/bench_report.py --variables 200 --jobs -1
+
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from yasc.data import german_data  # noqa: E402
+from yasc.scorecard import mono_bin_frame, woebinplot  # noqa: E402
+from yasc.scorecard.util import plot_report  # noqa: E402
+
+
+def build_bin_stats(n_variables):
+    data = german_data()
+    base, _ = mono_bin_frame(data, "Creditability", duplicates="drop")
+    base = [bin_stat for bin_stat in base.values() if len(bin_stat) > 1]
+    return {
+        "var{}".format(i): base[i % len(base)] for i in range(n_variables)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--variables", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+    bin_stats = build_bin_stats(args.variables)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start = time.perf_counter()
+        for var, bin_stat in bin_stats.items():
+            fig, _, _ = woebinplot(bin_stat, figsize=(12, 4.5))
+            fig.savefig(os.path.join(tmpdir, "{}.png".format(var)))
+            plt.close(fig)
+        elapsed = time.perf_counter() - start
+        print("woebinplot loop: {:.1f} charts/s".format(len(bin_stats) / elapsed))
+
+        for target, n_jobs in [("png", args.jobs), ("report.pdf", None)]:
+            start = time.perf_counter()
+            plot_report(bin_stats, os.path.join(tmpdir, target), n_jobs=n_jobs)
+            elapsed = time.perf_counter() - start
+            print(
+                "plot_report {}: {:.1f} charts/s".format(
+                    target, len(bin_stats) / elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
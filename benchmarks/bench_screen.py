@@ -0,0 +1,57 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+"""Benchmark of IV screening.
+
+Draws random features, some of them predictive and some with missing
+values, then computes their IV with a loop over :func:`mono_bin` and with
+:func:`screen_iv`, both with the same fixed quantile buckets, and reports
+columns per second. Run it with::
+
+    python benchmarks/bench_screen.py --rows 1000000 --columns 200 --jobs -1
+
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from yasc.scorecard import mono_bin, screen_iv
+
+
+def build_data(n_rows, n_columns, seed=0):
+    rng = np.random.RandomState(seed)
+    y = rng.randint(0, 2, n_rows)
+    X = rng.randn(n_rows, n_columns).astype(np.float32)
+    X[:, ::10] += 0.3 * y[:, None]
+    X[rng.rand(n_rows) < 0.1, 1::5] = np.nan
+    data = pd.DataFrame(X, columns=["x{}".format(i) for i in range(n_columns)])
+    data["target"] = y
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--loop-columns", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+    data = build_data(args.rows, args.columns)
+    columns = list(data.columns[:-1])
+
+    start = time.perf_counter()
+    for col in columns[: args.loop_columns]:
+        mono_bin(
+            data.target, data[col], n=np.linspace(0, 1, 21), duplicates="drop"
+        )
+    elapsed = time.perf_counter() - start
+    print("mono_bin loop: {:.1f} columns/s".format(args.loop_columns / elapsed))
+
+    start = time.perf_counter()
+    screen_iv(data, "target", bins=20, n_jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+    print("screen_iv: {:.1f} columns/s".format(len(columns) / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+"""Latency benchmark of the scoring server.
+
+Starts a server on a Unix socket with a score card of the german credit
+data, loaded from an artifact, then sends requests from concurrent clients
+and reports latency percentiles and throughput. Run it with::
+
+    python benchmarks/bench_server.py --clients 32 --requests 500 --batch 1
+
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import (
+    Scorecard,
+    WoeTransformer,
+    save_artifact,
+    start_server,
+)
+
+
+def build_scorecard():
+    data = german_data()
+    X = data.drop(columns="Creditability")
+    woe = WoeTransformer().fit(X, data.Creditability)
+    coef = np.full(len(woe.bin_stats_), 0.5)
+    records = X.to_dict(orient="records")
+    return Scorecard.from_woe_transformer(woe, coef, -0.85), records
+
+
+async def client(path, records, n_requests, batch, latencies):
+    reader, writer = await asyncio.open_unix_connection(path, limit=2 ** 24)
+    rng = np.random.RandomState(len(latencies))
+    for _ in range(n_requests):
+        picked = [records[i] for i in rng.randint(len(records), size=batch)]
+        if batch == 1:
+            request = {"record": picked[0]}
+        else:
+            request = {"records": picked}
+        line = json.dumps(request).encode() + b"\n"
+        start = time.perf_counter()
+        writer.write(line)
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        assert "error" not in response, response
+    writer.close()
+
+
+async def main(args):
+    card, records = build_scorecard()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "yasc.sock")
+        artifact = os.path.join(tmpdir, "card.npy")
+        save_artifact(card, artifact)
+        server = await start_server(artifact, path=path)
+        latencies = []
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            client(path, records, args.requests, args.batch, latencies)
+            for _ in range(args.clients)
+        ])
+        elapsed = time.perf_counter() - start
+        server.close()
+        await server.wait_closed()
+
+    latencies = np.array(latencies) * 1e6
+    print(
+        "{} clients x {} requests of {} record(s)".format(
+            args.clients, args.requests, args.batch
+        )
+    )
+    print("p50: {:.0f} us".format(np.percentile(latencies, 50)))
+    print("p99: {:.0f} us".format(np.percentile(latencies, 99)))
+    print("records/s: {:.0f}".format(len(latencies) * args.batch / elapsed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
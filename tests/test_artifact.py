@@ -0,0 +1,38 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import os
+import tempfile
+
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import (
+    Scorecard,
+    WoeTransformer,
+    load_artifact,
+    save_artifact,
+)
+
+
+def test_artifact():
+    data = german_data()
+    X = data[["DurationInMonth", "CreditAmount", "Purpose"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    card = Scorecard.from_woe_transformer(
+        woe, [0.9, 0.8, 0.7], -0.85, dtype=np.int16
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "card.npy")
+        save_artifact(card, path)
+        loaded = load_artifact(path)
+        np.testing.assert_array_equal(loaded.score(X), card.score(X))
+        assert loaded.points["Purpose"].dtype == np.int16
+        assert not loaded.cuts["CreditAmount"].flags.writeable
+
+        path = os.path.join(tmpdir, "bin_stats.npy")
+        save_artifact(woe.bin_stats_, path)
+        loaded = load_artifact(path, mmap_mode=None)
+    assert list(loaded) == list(woe.bin_stats_)
+    for col, bin_stat in woe.bin_stats_.items():
+        pd.testing.assert_frame_equal(loaded[col], bin_stat)
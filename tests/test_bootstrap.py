@@ -0,0 +1,44 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from yasc.data import german_data
+from yasc.scorecard import mono_bin
+from yasc.scorecard.util import bootstrap_iv, bootstrap_metrics
+
+
+def test_bootstrap_metrics():
+    rng = np.random.RandomState(0)
+    labels = rng.randint(0, 2, 1000)
+    preds = labels + rng.randn(1000)
+    ci = bootstrap_metrics(preds, labels, n_boot=120, random_state=0)
+
+    assert ci.estimate.auc == pytest.approx(roc_auc_score(labels, preds))
+    assert (ci.lower < ci.estimate).all() and (ci.estimate < ci.upper).all()
+    pd.testing.assert_frame_equal(
+        ci, bootstrap_metrics(preds, labels, 120, n_jobs=2, random_state=0)
+    )
+    # Ties are kept together, as when rows are resampled
+    scores = np.round(preds)
+    tied = bootstrap_metrics(scores, labels, n_boot=10, random_state=0)
+    assert tied.estimate.auc == pytest.approx(roc_auc_score(labels, scores))
+
+
+def test_bootstrap_iv():
+    data = german_data()
+    bin_stat = mono_bin(data.Creditability, data.DurationInMonth, n=5)
+    ci = bootstrap_iv(bin_stat, n_boot=200, random_state=0)
+
+    assert ci.estimate.iv == pytest.approx(bin_stat.iv_sum.iloc[0])
+    assert ci.lower.iv < ci.estimate.iv < ci.upper.iv
+
+    assert ci.n_dropped.iv == 0
+
+    # Small buckets, some replicates have no bad case in a bucket
+    small = bin_stat.copy()
+    small["bad_count"] = [1, 2, 3, 2, 1][: len(small)]
+    ci = bootstrap_iv(small, n_boot=200, random_state=0)
+    assert 0 < ci.n_dropped.iv < 200
+    assert np.isfinite(ci[["lower", "upper", "std"]].values).all()
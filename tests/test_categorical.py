@@ -0,0 +1,44 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import CategoricalBinning, WoeTransformer
+
+
+def test_categorical_binning():
+    data = german_data()
+    cb = CategoricalBinning(data.Creditability, data.Purpose, max_bins=4)
+    bin_stat = cb.bin_stat()
+
+    assert len(bin_stat) <= 4
+    assert bin_stat.total.sum() == len(data)
+    assert bin_stat.woe.is_monotonic_increasing
+    woe = cb.transform(data.Purpose)
+    expected = dict(zip(bin_stat.index, bin_stat.woe))
+    assert len(np.unique(woe)) == len(bin_stat)
+    assert set(np.round(woe, 8)) == set(np.round(list(expected.values()), 8))
+
+
+def test_categorical_binning_rare_levels():
+    np.random.seed(0)
+    X = pd.Series(np.random.choice(["a", "b", "c"], 10000))
+    X[:20] = ["rare{}".format(i) for i in range(20)]
+    Y = (np.random.rand(10000) < X.map({"a": 0.1, "b": 0.3}).fillna(0.5))
+    cb = CategoricalBinning(Y.astype(int), X, min_level_size=0.01)
+
+    assert len(cb.levels) == 3
+    woe = cb.transform(["rare0", "unseen", None], fill_value=-9)
+    assert woe[0] == woe[1] == cb.woe[-1]
+    assert woe[2] == -9
+
+
+def test_woe_transformer_categorical():
+    data = german_data()
+    X = data[["Purpose", "DurationInMonth"]]
+    woe = WoeTransformer(dtype=np.float32).fit(X, data.Creditability)
+    result = woe.transform(X)
+
+    assert list(result.columns) == ["Purpose", "DurationInMonth"]
+    assert (result.dtypes == np.float32).all()
+    assert "Purpose" in woe.categorical_
@@ -0,0 +1,27 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import chimerge_bin
+from yasc.scorecard._chimerge import _chimerge_breaks
+
+
+def test_chimerge_bin():
+    data = german_data()
+    bin_stat = chimerge_bin(
+        data.Creditability, data.CreditAmount, max_bins=4, min_size=0.1
+    )
+
+    assert len(bin_stat) <= 4
+    assert (bin_stat.total >= 100).all()
+    assert bin_stat.total.sum() == len(data)
+    assert bin_stat.bad_count.sum() == 300
+
+
+def test_chimerge_breaks():
+    # identical bad rates are merged, different ones are kept apart
+    bad = np.array([10, 10, 10, 90, 90])
+    total = np.array([100, 100, 100, 100, 100])
+    breaks = _chimerge_breaks(bad, total, max_bins=10, min_size=0)
+    assert list(breaks) == [3, 5]
+    assert list(_chimerge_breaks(bad, total, max_bins=1)) == [5]
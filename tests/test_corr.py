@@ -0,0 +1,62 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+
+from yasc.eda import corr_analysis, corr_pairs  # noqa: E402
+
+
+def _data():
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.randn(500, 12), columns=list("abcdefghijkl"))
+    data["m"] = data.a + 0.3 * rng.randn(500)
+    data["n"] = -data.b + 0.5 * rng.randn(500)
+    data.loc[::7, "a"] = np.nan
+    data.loc[::5, "n"] = np.nan
+    data["const"] = 1.0
+    return data
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_corr_pairs_threshold(method):
+    data = _data()
+    pairs = corr_pairs(data, method=method, threshold=0, block_size=4)
+    # Every pair once, but those of the constant column
+    assert len(pairs) == 14 * 13 // 2
+    expected = data.drop(columns="const").corr(method)
+    if method == "spearman":
+        # Ranks are computed over the present values of every column
+        expected = data.drop(columns="const").rank().corr()
+    for var1, var2, corr in pairs.itertuples(index=False):
+        assert corr == pytest.approx(expected.loc[var1, var2], abs=1e-5)
+    assert np.all(np.diff(np.abs(pairs["corr"])) <= 0)
+
+    strong = corr_pairs(data, method=method, threshold=0.5)
+    assert {frozenset(pair) for pair in zip(strong.var1, strong.var2)} == {
+        frozenset("am"), frozenset("bn")
+    }
+
+
+def test_corr_pairs_top_k():
+    data = _data()
+    pairs = corr_pairs(data, top_k=2, block_size=5, n_jobs=2)
+    assert list(pairs.var1.unique()) == list(data.columns[:-1])
+    assert (pairs.groupby("var1").size() == 2).all()
+    top = pairs.groupby("var1", sort=False).first()
+    assert top.loc["a", "var2"] == "m" and top.loc["n", "var2"] == "b"
+    with pytest.raises(ValueError):
+        corr_pairs(data)
+
+
+def test_corr_analysis_subset():
+    data = _data()
+    corr, ax = corr_analysis(data, max_features=4)
+    assert sorted(corr.columns) == ["a", "b", "m", "n"]
+    # Clustered, so that correlated columns are next to each other
+    order = "".join(corr.columns)
+    assert "am" in order or "ma" in order
+    assert "bn" in order or "nb" in order
@@ -0,0 +1,34 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import FineClassing, mono_bin
+
+
+def test_fine_classing():
+    data = german_data()
+    fc = FineClassing(data.Creditability, data.AgeInYears)
+    assert fc.bin_stat().total.sum() == len(data)
+    assert len(fc.bin_stat()) == fc.n_fine
+
+    bin_stat = fc.cut([28, 38]).bin_stat()
+    expected = mono_bin(data.Creditability, data.AgeInYears, duplicates="drop")
+    pd.testing.assert_frame_equal(bin_stat, expected)
+
+    fc.reset().merge(0, 2)
+    assert len(fc.bin_stat()) == fc.n_fine - 2
+    fc.split(20)
+    assert fc.bin_stat()["max"].iloc[0] == 20
+
+
+def test_fine_classing_monotonize():
+    np.random.seed(0)
+    X = np.random.randn(10000)
+    Y = (np.random.rand(10000) < 1 / (1 + np.exp(-X))).astype(int)
+    fc = FineClassing(Y, X, n=200)
+    woe = fc.monotonize().bin_stat().woe
+
+    assert woe.is_monotonic_increasing and woe.is_unique
+    assert fc.monotonize(increasing=False).bin_stat().shape[0] == 1
+    np.testing.assert_allclose(fc.iv, fc.bin_stat().iv_sum.iloc[0])
@@ -0,0 +1,30 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "package", ["yasc.scorecard", "yasc.eda", "yasc.data", "yasc.preprocessing"]
+)
+def test_import_is_light(package):
+    heavy = ["matplotlib", "seaborn", "sklearn", "scipy", "pkg_resources"]
+    code = "import sys, {}; print([m for m in {!r} if m in sys.modules])"
+    out = subprocess.run(
+        [sys.executable, "-c", code.format(package, heavy)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert out.strip() == "[]"
+
+
+def test_lazy_plots():
+    import yasc.scorecard
+    from yasc.scorecard import util
+
+    assert yasc.scorecard.rocplot is util.rocplot
+    assert "plot_report" in dir(yasc.scorecard)
+    with pytest.raises(AttributeError):
+        yasc.scorecard.no_such_function
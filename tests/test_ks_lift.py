@@ -0,0 +1,41 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+
+from yasc.scorecard.util._util import compute_ks_lift
+
+
+def test_compute_ks_lift():
+    rng = np.random.RandomState(0)
+    preds = rng.rand(1000)
+    labels = (rng.rand(1000) < preds).astype(int)
+    df = compute_ks_lift(preds, labels, tile_num=10)
+
+    assert list(df.columns) == [
+        "tile", "good", "bad", "good_distri", "bad_distri", "bad_rate",
+        "cum_bad_rate", "lift", "cum_good", "cum_bad", "ks",
+    ]
+    assert len(df) == 11
+    # The top tile holds the 100 highest predictions
+    top = np.argsort(-preds)[:100]
+    assert df.bad[1] == labels[top].sum()
+    assert df.good[1:].sum() + df.bad[1:].sum() == 1000
+    np.testing.assert_allclose(df.tile[1:], np.arange(1, 11) / 10)
+    assert np.isnan(df.lift[0]) and df.lift.iloc[-1] == 1.0
+
+    per_row = compute_ks_lift(preds, labels)
+    assert len(per_row) == 1001
+    assert per_row.ks.max() >= df.ks.max()
+
+
+def test_compute_ks_lift_tie_aware():
+    rng = np.random.RandomState(0)
+    preds = rng.randint(0, 7, 1000)
+    labels = rng.randint(0, 2, 1000)
+    df = compute_ks_lift(preds, labels, tile_num=10, tie_aware=True)
+
+    counts = np.bincount(preds)[::-1]
+    sizes = (df.good + df.bad)[1:].values
+    assert sizes.sum() == 1000
+    # Tiles end where predictions change, holding whole runs of ties
+    assert set(np.cumsum(sizes)) <= set(np.cumsum(counts))
+    np.testing.assert_allclose(df.tile[1:], np.cumsum(sizes) / 1000)
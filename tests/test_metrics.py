@@ -0,0 +1,100 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import roc_auc_score, roc_curve
+
+from yasc.scorecard.util import (
+    MetricAccumulator,
+    compare_models,
+    segment_metrics,
+)
+from yasc.scorecard.util._util import compute_ks_lift
+
+
+def test_metric_accumulator():
+    rng = np.random.RandomState(0)
+    preds = rng.rand(10000)
+    labels = (rng.rand(10000) < preds).astype(int)
+    shards = [
+        MetricAccumulator().update(preds[i::4], labels[i::4]) for i in range(4)
+    ]
+    acc = shards[0]
+    for shard in shards[1:]:
+        acc.merge(shard)
+
+    fpr, tpr, _ = roc_curve(labels, preds)
+    bounds = acc.error_bounds()
+    assert acc.count == 10000
+    assert abs(acc.auc() - roc_auc_score(labels, preds)) <= bounds["auc"]
+    assert 0 <= np.max(tpr - fpr) - acc.ks() <= bounds["ks"]
+    assert acc.gini() == pytest.approx(2 * acc.auc() - 1)
+    with pytest.raises(ValueError):
+        acc.merge(MetricAccumulator(bins=10))
+
+
+def test_metric_accumulator_integer():
+    rng = np.random.RandomState(0)
+    points = rng.randint(300, 900, 10000)
+    labels = (rng.rand(10000) < (900 - points) / 800).astype(int)
+    acc = MetricAccumulator(integer=True, ascending=True)
+    acc.update(points[:5000], labels[:5000])
+    acc.merge(
+        MetricAccumulator(integer=True, ascending=True).update(
+            np.append(points[5000:], np.nan), np.append(labels[5000:], 1)
+        )
+    )
+
+    fpr, tpr, _ = roc_curve(labels, -points)
+    assert acc.missing_bad == 1
+    assert acc.auc() == pytest.approx(roc_auc_score(labels, -points))
+    assert acc.ks() == pytest.approx(np.max(tpr - fpr))
+    pd.testing.assert_frame_equal(
+        acc.lift_table(10),
+        compute_ks_lift(
+            points, labels, ascending=True, tile_num=10, tie_aware=True
+        ),
+    )
+
+
+def test_segment_metrics():
+    rng = np.random.RandomState(0)
+    preds = rng.randint(0, 50, 5000)
+    labels = (rng.rand(5000) < preds / 100).astype(int)
+    month = rng.randint(1, 4, 5000)
+    channel = rng.choice(["web", "shop"], 5000)
+    metrics = segment_metrics(
+        preds, labels, [pd.Series(month, name="month"), channel]
+    )
+
+    assert metrics.index.names == [0, 1]
+    assert len(metrics) == 6 and metrics.total.sum() == 5000
+    for (m, c), row in metrics.iterrows():
+        mask = (month == m) & (channel == c)
+        fpr, tpr, _ = roc_curve(labels[mask], preds[mask])
+        assert row.auc == pytest.approx(
+            roc_auc_score(labels[mask], preds[mask])
+        )
+        assert row.ks == pytest.approx(np.max(tpr - fpr))
+        assert row.bad == labels[mask].sum()
+
+
+def test_compare_models():
+    rng = np.random.RandomState(0)
+    labels = rng.randint(0, 2, 1000)
+    scores = pd.DataFrame(
+        {"champion": labels + rng.randn(1000), "challenger": rng.randn(1000)}
+    )
+    table, lift_tables, _ = compare_models(
+        scores, labels, n_jobs=2, plot=True
+    )
+
+    assert list(table.index) == ["champion", "challenger"]
+    for name in scores:
+        assert table.auc[name] == pytest.approx(
+            roc_auc_score(labels, scores[name])
+        )
+        pd.testing.assert_frame_equal(
+            lift_tables[name], compute_ks_lift(scores[name], labels, tile_num=10)
+        )
+    assert table.ks.champion > table.ks.challenger
@@ -0,0 +1,108 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+import pytest
+
+from yasc.data import german_data
+from yasc.scorecard import mono_bin, mono_bin_counts, mono_bin_frame
+from yasc.scorecard._bin import _optimal_breaks
+
+
+def test_mono_bin():
+    data = german_data()
+    bin_stat = mono_bin(
+        data.Creditability, data.DurationInMonth, duplicates="drop"
+    )
+
+    assert list(bin_stat.columns) == [
+        "min", "max", "bad_count", "good_count", "total", "bad_rate",
+        "good_rate", "woe", "iv", "iv_sum", "bins",
+    ]
+    assert list(bin_stat.total) == [359, 411, 230]
+    assert list(bin_stat.bad_count) == [76, 122, 102]
+    assert bin_stat.bins.iloc[0] == "[-inf, 12, 24, 72, inf]"
+    np.testing.assert_allclose(bin_stat.iv_sum.iloc[0], 0.168117, atol=1e-6)
+
+
+def test_mono_bin_matches_qcut():
+    np.random.seed(0)
+    X = pd.Series(np.random.randn(5000))
+    Y = pd.Series((np.random.rand(5000) < 1 / (1 + np.exp(-X))).astype(int))
+    bin_stat = mono_bin(Y, X)
+
+    bucket = pd.qcut(X, len(bin_stat))
+    expected = Y.groupby(bucket).agg(["sum", "count"])
+    assert (bin_stat.index == expected.index).all()
+    assert list(bin_stat.bad_count) == list(expected["sum"])
+    assert list(bin_stat.total) == list(expected["count"])
+    assert bin_stat.woe.is_monotonic_increasing
+
+
+def test_mono_bin_frame():
+    data = german_data()
+    columns = ["DurationInMonth", "CreditAmount", "AgeInYears"]
+    bin_stats, timings = mono_bin_frame(
+        data, "Creditability", columns=columns, duplicates="drop", n_jobs=2
+    )
+
+    assert list(bin_stats) == columns
+    assert list(timings.index) == columns
+    assert (timings >= 0).all()
+    # the target column is left untouched
+    assert data.Creditability[0] == "good"
+    for col in columns:
+        pd.testing.assert_frame_equal(
+            bin_stats[col],
+            mono_bin(data.Creditability.copy(), data[col], duplicates="drop"),
+        )
+
+
+def test_mono_bin_counts():
+    data = german_data()
+    table = (
+        data.groupby("CreditAmount")
+        .Creditability.value_counts()
+        .unstack(fill_value=0)
+        .reset_index()
+        .sample(frac=1, random_state=0)  # counts need not be sorted
+    )
+    bin_stat = mono_bin_counts(
+        table.CreditAmount, table.bad, table.good, duplicates="drop"
+    )
+
+    pd.testing.assert_frame_equal(
+        bin_stat,
+        mono_bin(data.Creditability, data.CreditAmount, duplicates="drop"),
+    )
+
+
+def test_mono_bin_optimal():
+    data = german_data()
+    quantile = mono_bin(
+        data.Creditability, data.DurationInMonth, duplicates="drop"
+    )
+    optimal = mono_bin(
+        data.Creditability, data.DurationInMonth, n=5, method="optimal",
+        min_size=0.1,
+    )
+
+    assert list(optimal.columns) == list(quantile.columns)
+    assert len(optimal) <= 5
+    assert (optimal.total >= 100).all()
+    assert optimal.total.sum() == len(data)
+    assert optimal.woe.is_monotonic_increasing
+    assert optimal.iv_sum.iloc[0] >= quantile.iv_sum.iloc[0]
+
+
+def test_optimal_breaks_monotonic():
+    bad, total = np.array([5, 5, 11]), np.array([5, 21, 43])
+    # Pooling the first two buckets first leaves a single bin of IV 0
+    breaks = _optimal_breaks(bad, total, 21, 48, max_bins=10, min_size=0.2)
+    assert list(breaks) == [2, 3]
+
+    data = german_data()
+    with pytest.raises(ValueError):
+        mono_bin(
+            data.Creditability, data.DurationInMonth, n=[0, 0.5, 1],
+            method="optimal",
+        )
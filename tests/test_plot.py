@@ -0,0 +1,99 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import matplotlib
+
+matplotlib.use("Agg")
+
+import os  # noqa: E402
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from sklearn.metrics import roc_auc_score, roc_curve  # noqa: E402
+
+from yasc.data import german_data  # noqa: E402
+from yasc.scorecard import mono_bin_frame  # noqa: E402
+from yasc.scorecard.util import (  # noqa: E402
+    ksplot,
+    plot_report,
+    rocplot,
+    woebinplot,
+)
+from yasc.scorecard.util._check import binary_labels  # noqa: E402
+from yasc.scorecard.util._report import _roc  # noqa: E402
+from yasc.scorecard.util._util import _decimate  # noqa: E402
+
+
+def _data(n=200000):
+    rng = np.random.RandomState(0)
+    labels = rng.randint(0, 2, n)
+    preds = 1 / (1 + np.exp(-(labels + rng.randn(n))))
+    return preds, labels
+
+
+def test_decimate():
+    preds, labels = _data()
+    fpr, tpr, _ = roc_curve(labels, preds, drop_intermediate=False)
+    picked = _decimate(fpr, tpr, max_points=1000, tolerance=1e-3, keep=[7])
+    assert len(picked) <= 1000
+    assert picked[0] == 0 and picked[-1] == len(fpr) - 1 and 7 in picked
+    assert np.all(np.diff(picked) > 0)
+    # Every point left out is close to the drawn curve
+    drawn = np.interp(fpr, fpr[picked], tpr[picked])
+    assert np.abs(drawn - tpr).max() < 0.01
+
+    assert len(_decimate(fpr, tpr, max_points=10)) <= 10
+    assert len(_decimate(fpr[:5], tpr[:5])) == 5
+
+
+def test_plots_decimated():
+    preds, labels = _data()
+    roc_auc, ax = rocplot(labels, preds)
+    assert np.isclose(roc_auc, roc_auc_score(labels, preds))
+    assert len(ax.get_lines()[0].get_xdata()) <= 1000
+
+    df, ax = ksplot(preds, labels, n=None)
+    assert len(df) == len(preds) + 1
+    assert all(len(line.get_xdata()) <= 1000 for line in ax.get_lines()[:3])
+    assert ax.texts[0].get_text().startswith("ks={:.4f}".format(df.ks.max()))
+
+
+def test_plot_report(tmp_path):
+    data = german_data()
+    bin_stats, _ = mono_bin_frame(
+        data, "Creditability", columns=["DurationInMonth", "AgeInYears"],
+        duplicates="drop",
+    )
+    fig, ax1, _ = woebinplot(bin_stats["AgeInYears"])
+    assert ax1.get_title().startswith("iv: ")
+    plt.close(fig)
+
+    preds = np.random.RandomState(0).rand(len(data))
+    n_figures = len(plt.get_fignums())
+    paths = plot_report(
+        bin_stats, str(tmp_path / "png"), preds, data.Creditability
+    )
+    assert [os.path.basename(path) for path in paths] == [
+        "woebin_DurationInMonth.png", "woebin_AgeInYears.png", "roc.png",
+        "ks.png",
+    ]
+    assert all(os.path.getsize(path) > 0 for path in paths)
+
+    pdf = str(tmp_path / "report.pdf")
+    assert plot_report(bin_stats, pdf, stacked=True) == [pdf]
+    with open(pdf, "rb") as f:
+        assert f.read().count(b"/Type /Page ") == 2
+    # No figure is left to pyplot
+    assert len(plt.get_fignums()) == n_figures
+
+
+def test_plot_report_scores(tmp_path):
+    data = german_data()
+    labels = binary_labels(data.Creditability)
+    probs = data.DurationInMonth / data.DurationInMonth.max()
+    # Scores are high for good cases, the ROC curve is the one of probs
+    _, _, roc_auc = _roc(-probs, labels, is_prob=False)
+    assert roc_auc > 0.5
+    assert np.isclose(roc_auc, _roc(probs, labels, is_prob=True)[2])
+    paths = plot_report(
+        {}, str(tmp_path), -probs, data.Creditability, is_prob=False
+    )
+    assert [os.path.basename(path) for path in paths] == ["roc.png", "ks.png"]
@@ -0,0 +1,129 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+import pandas as pd
+import pytest
+
+from yasc.data import german_data
+from yasc.eda._sketch import HyperLogLog, SpaceSaving
+from yasc.eda import (
+    ColumnProfile,
+    categorical_stat,
+    describe,
+    numeric_stat,
+    profile_data,
+)
+
+
+def _data():
+    data = german_data()
+    data.loc[::7, "DurationInMonth"] = np.nan
+    data.loc[::11, "Purpose"] = None
+    return data
+
+
+def test_describe():
+    data = _data()
+    result = describe(data)
+    assert list(result.index[:4]) == ["dtype", "type", "#missing",
+                                      "missing_rate"]
+    assert result.loc["#missing", "DurationInMonth"] == 143
+    expected = data.describe(include="all")
+    pd.testing.assert_frame_equal(
+        result.iloc[4:].astype(object), expected.astype(object)
+    )
+    pd.testing.assert_frame_equal(
+        numeric_stat(data, [0.1, 0.9]),
+        data.describe([0.1, 0.9], include=np.number),
+    )
+    pd.testing.assert_frame_equal(
+        categorical_stat(data).astype(object),
+        data.describe(include=object).astype(object),
+    )
+
+
+def test_profile_chunks():
+    data = _data()
+    chunks = [data[i : i + 150] for i in range(0, len(data), 150)]
+    profile = profile_data(iter(chunks))
+    assert profile.n_rows == len(data)
+    # Few distinct values, so that percentiles are exact
+    pd.testing.assert_frame_equal(numeric_stat(profile), numeric_stat(data))
+    pd.testing.assert_frame_equal(
+        categorical_stat(profile), categorical_stat(data)
+    )
+    pd.testing.assert_frame_equal(
+        describe(profile_data(data, n_jobs=2)), describe(data)
+    )
+    # Labels of mixed types
+    mixed = pd.DataFrame({"a": [1.0, 2.0], 1: [3.0, 4.0], "c": ["x", "y"]})
+    assert list(profile_data(mixed, n_jobs=2).columns) == ["a", 1, "c"]
+
+
+def test_column_profile_approximate():
+    rng = np.random.RandomState(0)
+    x = rng.randn(100000)
+    profile = ColumnProfile(max_size=200)
+    for chunk in np.array_split(x, 20):
+        profile.update(pd.Series(chunk))
+    assert len(profile.values) <= 200
+    assert profile.count == len(x)
+    assert np.isclose(profile.mean, x.mean())
+    assert np.isclose(profile.std, x.std(ddof=1))
+    assert profile.mins[0] == x.min() and profile.values[-1] == x.max()
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        rank = np.searchsorted(np.sort(x), profile.quantile(q)) / len(x)
+        assert abs(rank - q) < 0.01
+
+    # Missing values only do not decide whether the column is numeric
+    profile = ColumnProfile().update(pd.Series([np.nan, np.nan]))
+    profile.update(pd.Series(["a", "b", "a"]))
+    assert not profile.numeric and profile.missing == 2
+    with pytest.raises(TypeError):
+        profile.update(pd.Series([1.0]))
+
+
+def test_hyperloglog():
+    values = np.arange(200000).astype(str).astype(object)
+    sketch = HyperLogLog().update(values[:120000])
+    sketch.merge(HyperLogLog().update(values[80000:]))
+    error = abs(sketch.estimate() / len(values) - 1)
+    assert error < 4 * sketch.relative_error
+    assert round(HyperLogLog().update(["a", "b", "a"]).estimate()) == 2
+
+
+def test_space_saving():
+    rng = np.random.RandomState(0)
+    values = pd.Series(rng.zipf(1.5, 100000)).astype(str)
+    summary = SpaceSaving(capacity=50)
+    for chunk in np.array_split(values, 10):
+        summary.update(chunk)
+    assert len(summary.counts) == 50
+    true = values.value_counts().reindex(summary.counts.index)
+    # Counts are upper bounds, counts minus errors lower bounds
+    assert (true <= summary.counts).all()
+    assert (true >= summary.counts - summary.errors).all()
+    assert summary.top()[0] == values.value_counts().index[0]
+
+
+def test_categorical_stat_approximate():
+    data = _data()
+    chunks = [data[i : i + 300] for i in range(0, len(data), 300)]
+    result = categorical_stat(profile_data(iter(chunks), approximate=True))
+    expected = categorical_stat(data)
+    assert list(result.index) == [
+        "count", "unique", "top", "freq", "unique_error", "freq_error",
+    ]
+    pd.testing.assert_frame_equal(
+        result.loc[["count", "unique", "top", "freq"]].astype(object),
+        expected.astype(object),
+    )
+    assert (result.loc["freq_error"] == 0).all()
+
+    # Ties of the top value go to the first value seen in both modes
+    dates = pd.DataFrame(
+        {"date": pd.date_range("2020-01-01", periods=100).astype(str)[::-1]}
+    )
+    chunks = [dates[i : i + 30] for i in range(0, len(dates), 30)]
+    for approximate in [False, True]:
+        profile = profile_data(iter(chunks), approximate=approximate)
+        assert categorical_stat(profile).loc["top", "date"] == "2020-04-09"
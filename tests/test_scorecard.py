@@ -0,0 +1,51 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+import pytest
+
+from yasc.data import german_data
+from yasc.scorecard import Scorecard, WoeTransformer, mono_bin
+
+
+def test_scorecard():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears", "Purpose"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    coef = [0.9, 0.8, 0.7]
+    card = Scorecard.from_woe_transformer(
+        woe, coef, -0.85, base_score=600, base_odds=50, pdo=20
+    )
+
+    factor = 20 / np.log(2)
+    log_odds = -0.85 + woe.transform(X).values @ np.array(coef)
+    expected = 600 - factor * np.log(50) - factor * log_odds
+    np.testing.assert_allclose(card.score(X), expected)
+    assert len(card.points_table()) == 4 + 4 + 12
+
+
+def test_scorecard_int16_and_missing():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    card = Scorecard.from_woe_transformer(
+        woe, [0.9, 0.8], -0.85, dtype=np.int16
+    )
+    scores = card.score(X.values)
+
+    assert scores.dtype == np.int16
+    assert (scores == card.score(X)).all()
+    missing = card.score(pd.DataFrame({
+        "DurationInMonth": [np.nan], "AgeInYears": [np.nan]
+    }))
+    assert missing[0] == card.base_points
+
+
+def test_scorecard_not_finite():
+    data = german_data()
+    bin_stat = mono_bin(
+        data.Creditability, data.DurationInMonth, duplicates="drop"
+    )
+    # A bin without bad cases
+    bin_stat.iloc[0, bin_stat.columns.get_loc("woe")] = -np.inf
+    with pytest.raises(ValueError, match="DurationInMonth"):
+        Scorecard({"DurationInMonth": bin_stat}, [0.9], dtype=np.int16)
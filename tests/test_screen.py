@@ -0,0 +1,54 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import mono_bin, screen_iv
+
+
+def test_screen_iv_matches_mono_bin():
+    data = german_data()
+    result = screen_iv(data, "Creditability", bins=10, n_jobs=2)
+    assert list(result.columns) == ["iv", "ks", "missing_rate", "buckets"]
+    assert result.index[0] == "DurationInMonth"
+    assert result.iv.is_monotonic_decreasing
+    for col in result.index:
+        bin_stat = mono_bin(
+            data.Creditability.copy(), data[col],
+            n=np.linspace(0, 1, 11), duplicates="drop",
+        )
+        np.testing.assert_allclose(
+            result.loc[col, "iv"], bin_stat.iv_sum.iloc[0]
+        )
+        assert result.loc[col, "buckets"] == len(bin_stat)
+
+
+def test_screen_iv_missing():
+    rng = np.random.RandomState(0)
+    n = 20000
+    y = rng.randint(0, 2, n)
+    x = rng.randn(n) + 0.5 * y
+    x[rng.rand(n) < 0.2] = np.nan
+    data = pd.DataFrame(
+        {"x": x, "x32": x.astype(np.float32), "empty": np.nan, "target": y}
+    )
+    result = screen_iv(data, "target")
+    np.testing.assert_allclose(result.loc["x", "iv"], result.loc["x32", "iv"])
+    np.testing.assert_allclose(
+        result.loc["x", "missing_rate"], np.isnan(x).mean()
+    )
+    assert result.loc["empty", "missing_rate"] == 1
+    assert result.index[-1] == "empty"
+
+    # KS over the quantile buckets of present values
+    present = data[~np.isnan(x)]
+    counts = present.groupby(pd.qcut(present.x, 20)).target.agg(
+        ["sum", "count"]
+    )
+    cum_bad = counts["sum"].cumsum() / counts["sum"].sum()
+    cum_good = (counts["count"] - counts["sum"]).cumsum() / (
+        counts["count"] - counts["sum"]
+    ).sum()
+    np.testing.assert_allclose(
+        result.loc["x", "ks"], (cum_bad - cum_good).abs().max()
+    )
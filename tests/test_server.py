@@ -0,0 +1,93 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import asyncio
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import (
+    CategoricalBinning,
+    Scorecard,
+    ScoringEngine,
+    WoeTransformer,
+    start_server,
+)
+
+
+def _scorecard():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears", "Purpose"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    card = Scorecard.from_woe_transformer(woe, [0.9, 0.8, 0.7], -0.85)
+    return card, X
+
+
+def test_scoring_engine():
+    card, X = _scorecard()
+    records = X.head(100).to_dict(orient="records")
+    engine = ScoringEngine(card, n_reasons=2)
+    single = [engine.score_record(record) for record in records]
+    scores, reasons = engine.score_records(records)
+
+    np.testing.assert_allclose([s for s, _ in single], card.score(X.head(100)))
+    np.testing.assert_allclose(scores, [s for s, _ in single])
+    assert reasons == [r for _, r in single]
+    assert all(len(r) <= 2 for r in reasons)
+
+
+def test_scoring_engine_missing_categorical():
+    data = german_data()
+    # Rare levels are pooled, so they do not score as missing values
+    binning = CategoricalBinning(
+        data.Creditability, data.Purpose, min_level_size=0.05
+    )
+    card = Scorecard({"Purpose": binning}, [0.9], -0.85)
+    assert card.points["Purpose"][-2] != card.points["Purpose"][-1]
+    X = data[["Purpose"]].head(100).copy()
+    X.loc[X.index[::3], "Purpose"] = np.nan
+    records = X.to_dict(orient="records")
+    engine = ScoringEngine(card)
+    single = [engine.score_record(record)[0] for record in records]
+    scores, _ = engine.score_records(records)
+
+    np.testing.assert_allclose(scores, single)
+    np.testing.assert_allclose(single, card.score(X))
+
+
+def test_server():
+    card, X = _scorecard()
+    record = X.iloc[0].to_dict()
+
+    async def exchange(path):
+        server = await start_server(card, path=path)
+        reader, writer = await asyncio.open_unix_connection(path)
+        responses = []
+        huge = dict(record, DurationInMonth=10 ** 400)
+        requests = [
+            {"record": record, "id": 7},
+            {"records": [record]},
+            {},
+            {"records": [huge] * 64},
+            {"record": record},
+        ]
+        for request in requests:
+            writer.write(json.dumps(request).encode() + b"\n")
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        single, batch, invalid, overflow, after = asyncio.run(
+            exchange(os.path.join(tmpdir, "yasc.sock"))
+        )
+    assert single["id"] == 7
+    np.testing.assert_allclose(single["score"], card.score(X.head(1))[0])
+    assert batch["reasons"] == [single["reasons"]]
+    assert "error" in invalid
+    # The connection is still served after an error
+    assert overflow["error"].startswith("OverflowError")
+    assert after["score"] == single["score"]
@@ -0,0 +1,40 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import BinningSketch, mono_bin, mono_bin_chunks
+
+
+def test_mono_bin_chunks_exact():
+    data = german_data()
+    chunks = (data[i:i + 100] for i in range(0, len(data), 100))
+    bin_stats = mono_bin_chunks(chunks, "Creditability")
+
+    for col, bin_stat in bin_stats.items():
+        expected = mono_bin(
+            data.Creditability.copy(), data[col], duplicates="drop"
+        )
+        pd.testing.assert_frame_equal(bin_stat, expected)
+
+
+def test_binning_sketch_merge():
+    np.random.seed(0)
+    X = np.random.randn(200000)
+    Y = (np.random.rand(200000) < 1 / (1 + np.exp(-X))).astype(int)
+    sketches = [BinningSketch(max_size=500) for _ in range(4)]
+    for i, sketch in enumerate(sketches):
+        sketch.update(X[i::4], Y[i::4])
+        assert len(sketch.values) <= 500
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    bin_stat = sketch.mono_bin()
+    expected = mono_bin(pd.Series(Y), pd.Series(X))
+
+    assert sketch.count == 200000
+    assert len(bin_stat) == len(expected)
+    np.testing.assert_allclose(bin_stat.total, expected.total, rtol=0.05)
+    np.testing.assert_allclose(
+        bin_stat.iv_sum.iloc[0], expected.iv_sum.iloc[0], rtol=0.05
+    )
@@ -0,0 +1,45 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import sqlite3
+
+import numpy as np
+import pytest
+
+from yasc.data import german_data
+from yasc.scorecard import (
+    Scorecard,
+    WoeTransformer,
+    scorecard_sql,
+    verify_sql,
+)
+
+
+def test_scorecard_sql():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears", "Purpose"]].copy()
+    woe = WoeTransformer().fit(X, data.Creditability)
+    X.loc[::7, "AgeInYears"] = np.nan
+    X.loc[::5, "Purpose"] = None
+    X.loc[::11, "Purpose"] = "o'unseen"
+
+    for dtype in [np.float64, np.int16]:
+        card = Scorecard.from_woe_transformer(
+            woe, [0.9, 0.8, 0.7], -0.85, dtype=dtype
+        )
+        verify_sql(card, X)
+
+    with sqlite3.connect(":memory:") as con:
+        X.to_sql("applications", con)
+        con.execute(scorecard_sql(card, "applications", view="scores"))
+        scores = con.execute("SELECT score FROM scores").fetchall()
+    con.close()
+    np.testing.assert_array_equal([s for s, in scores], card.score(X))
+
+
+def test_scorecard_sql_not_finite():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    card = Scorecard.from_woe_transformer(woe, [0.9, 0.8], -0.85)
+    card.points["AgeInYears"][0] = np.inf
+    with pytest.raises(ValueError, match="AgeInYears"):
+        scorecard_sql(card)
@@ -0,0 +1,37 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from yasc.data import german_data
+from yasc.scorecard import WoeTransformer, mono_bin
+
+
+def test_woe_transformer():
+    data = german_data()
+    X = data[["DurationInMonth", "AgeInYears"]]
+    woe = WoeTransformer().fit(X, data.Creditability)
+    result = woe.transform(X)
+
+    assert list(result.columns) == list(X.columns)
+    bin_stat = mono_bin(
+        data.Creditability.copy(), data.DurationInMonth, duplicates="drop"
+    )
+    bucket = pd.cut(data.DurationInMonth, [-np.inf, 12, 24, np.inf])
+    expected = bucket.cat.codes.map(dict(enumerate(bin_stat.woe)))
+    np.testing.assert_allclose(result.DurationInMonth, expected)
+
+
+def test_woe_transformer_missing_and_dtype():
+    data = german_data()
+    X = data[["DurationInMonth"]]
+    woe = WoeTransformer(dtype=np.float32, fill_value=-1).fit(
+        X, data.Creditability
+    )
+    new = pd.DataFrame({"DurationInMonth": [np.nan, 0, 12, 12.5, 1000]})
+    result = woe.transform(new).DurationInMonth
+
+    assert result.dtype == np.float32
+    assert result[0] == -1
+    assert result[1] == result[2] == woe.woe_["DurationInMonth"][0]
+    assert result[3] == woe.woe_["DurationInMonth"][1]
+    assert result[4] == woe.woe_["DurationInMonth"][-1]
@@ -1,4 +1,6 @@
 # Author: Liqiang Du <keris.du@gmail.com>
+from ._corr import corr_pairs
+from ._profile import ColumnProfile, DataProfile, profile_data
 from ._utils import (
     categorical_stat,
     corr_analysis,
@@ -0,0 +1,521 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import (
+    is_bool_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+)
+from pandas.io.formats.format import format_percentiles
+
+from ._sketch import HyperLogLog, SpaceSaving
+from ..scorecard.util._parallel import effective_n_jobs
+
+
+__all__ = ["ColumnProfile", "DataProfile", "profile_data"]
+
+# Values of a chunk counted at once in approximate mode
+_BATCH_SIZE = 2 ** 20
+
+
+def _merge_dtypes(a, b, numeric):
+    """Return the dtype of a column of chunks of dtypes `a` and `b`."""
+    if a == b:
+        return a
+    if numeric:
+        try:
+            return np.promote_types(a, b)
+        except TypeError:
+            pass
+    return np.dtype(object)
+
+
+def _lerp(a, b, t):
+    """Interpolate between `a` and `b` as :func:`numpy.percentile` does."""
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+class ColumnProfile:
+    """Mergeable one pass summary of a column.
+
+    Numeric columns, but boolean ones, are summarized by their count, mean
+    and sum of squared deviations, updated chunk by chunk with Welford's
+    method, and a sorted table of at most `max_size` buckets of values with
+    their counts, as in :class:`yasc.scorecard.BinningSketch`. Buckets are
+    only merged when chunks are, so minimum and maximum are always exact
+    and percentiles are exact for a single chunk, or while there are at
+    most `max_size` distinct values, approximate afterwards. Other columns
+    are summarized by the counts of their values, or, in approximate mode,
+    by a HyperLogLog estimate of their number of distinct values and a
+    Space-Saving summary of their most frequent values, so
+    that memory is bounded however many distinct values there are.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of buckets of values of a numeric column, and of
+        values counted in approximate mode, by default 2000
+    approximate : bool, optional
+        Whether to summarize values of columns which are not numeric with
+        sketches, by default False
+    """
+
+    def __init__(self, max_size=2000, approximate=False):
+        self.max_size = max_size
+        self.approximate = approximate
+        self.dtype = None
+        self.numeric = None
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.values = np.empty(0)
+        self.mins = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.value_counts = pd.Series(dtype=np.int64)
+        if approximate:
+            self.distinct = HyperLogLog()
+            self.top_values = SpaceSaving(max_size)
+
+    def update(self, values):
+        """Add a chunk of values of the column.
+
+        Parameters
+        ----------
+        values : Series
+            Values of the column.
+
+        Returns
+        -------
+        ColumnProfile
+            The profile itself.
+        """
+        values = pd.Series(values)
+        missing = values.isnull()
+        other = ColumnProfile(self.max_size, self.approximate)
+        other.dtype = values.dtype
+        other.numeric = is_numeric_dtype(values.dtype) and not is_bool_dtype(
+            values.dtype
+        )
+        other.missing = int(missing.sum())
+        known = values[~missing]
+        other.count = len(known)
+        if other.numeric:
+            x = known.to_numpy(dtype=np.float64)
+            if len(x):
+                other.mean = x.mean()
+                other.m2 = float(np.sum((x - other.mean) ** 2))
+            other.values, counts = np.unique(x, return_counts=True)
+            other.mins = other.values
+            other.counts = counts.astype(np.int64)
+        elif self.approximate:
+            # Counting values by batches bounds the memory of a chunk too
+            for start in range(0, len(known), _BATCH_SIZE):
+                batch = known.iloc[start : start + _BATCH_SIZE]
+                other.distinct.update(batch.values)
+                other.top_values.update(batch)
+        else:
+            other.value_counts = known.value_counts(sort=False)
+        return self.merge(other)
+
+    def merge(self, other):
+        """Merge another profile of the column, e.g. of another chunk.
+
+        Parameters
+        ----------
+        other : ColumnProfile
+            The profile to merge.
+
+        Returns
+        -------
+        ColumnProfile
+            The profile itself.
+
+        Raises
+        ------
+        TypeError
+            Raises when the column is numeric in a profile and not in the
+            other one, unless one of them has only missing values.
+        ValueError
+            Raises when only one of the profiles is approximate.
+        """
+        if other.approximate != self.approximate:
+            raise ValueError(
+                "Cannot merge an approximate profile with an exact one."
+            )
+        if other.dtype is None:
+            return self
+        if self.dtype is None:
+            self.dtype, self.numeric = other.dtype, other.numeric
+        else:
+            # A chunk of missing values only does not decide the kind
+            if self.numeric != other.numeric:
+                if self.count and other.count:
+                    raise TypeError(
+                        "Column of dtype {} cannot be merged with one of "
+                        "dtype {}.".format(self.dtype, other.dtype)
+                    )
+                if other.count:
+                    self.numeric = other.numeric
+            self.dtype = _merge_dtypes(self.dtype, other.dtype, self.numeric)
+        self.missing += other.missing
+
+        # Chan et al. parallel update of the mean and squared deviations
+        n = self.count + other.count
+        if n:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / n
+            self.m2 += other.m2 + delta ** 2 * self.count * other.count / n
+        self.count = n
+
+        if len(other.values):
+            self._add(other.values, other.mins, other.counts)
+        if self.approximate:
+            self.distinct.merge(other.distinct)
+            self.top_values.merge(other.top_values)
+        if not len(self.value_counts):
+            self.value_counts = other.value_counts
+        elif len(other.value_counts):
+            # Values are kept in the order first seen, which breaks ties of
+            # the top value as in approximate mode
+            index = self.value_counts.index.union(
+                other.value_counts.index, sort=False
+            )
+            self.value_counts = self.value_counts.reindex(
+                index, fill_value=0
+            ) + other.value_counts.reindex(index, fill_value=0)
+        return self
+
+    def _add(self, values, mins, counts):
+        if not len(self.values):
+            self.values, self.mins, self.counts = values, mins, counts
+            return
+        values = np.concatenate([self.values, values])
+        mins = np.concatenate([self.mins, mins])
+        counts = np.concatenate([self.counts, counts])
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        unique_mins = unique_values.copy()
+        np.minimum.at(unique_mins, inverse, mins)
+        self.values, self.mins = unique_values, unique_mins
+        self.counts = np.bincount(inverse, weights=counts).astype(np.int64)
+        if len(self.values) > self.max_size:
+            self._compress()
+
+    def _compress(self):
+        """Merge adjacent buckets into about ``max_size / 2`` buckets."""
+        step = self.counts.sum() / max(self.max_size // 2, 1)
+        group = np.floor((np.cumsum(self.counts) - self.counts) / step)
+        starts = np.flatnonzero(np.diff(group, prepend=-1) > 0)
+        ends = np.append(starts[1:], len(self.values)) - 1
+        self.mins = np.minimum.reduceat(self.mins, starts)
+        self.values = self.values[ends]
+        self.counts = np.add.reduceat(self.counts, starts)
+
+    @property
+    def std(self):
+        """Sample standard deviation of a numeric column."""
+        if self.count < 2:
+            return np.nan
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def _value_at(self, rank):
+        """Return the value of rank `rank` in the sorted values, interpolated
+        within buckets of several values."""
+        ends = np.cumsum(self.counts)
+        i = int(np.searchsorted(ends, rank, side="right"))
+        lo, hi, size = self.mins[i], self.values[i], self.counts[i]
+        if lo == hi:
+            return hi
+        return lo + (hi - lo) * (rank - (ends[i] - size)) / max(size - 1, 1)
+
+    def quantile(self, q):
+        """Return the `q` quantile of a numeric column, interpolated linearly
+        between values as :meth:`pandas.Series.quantile` does."""
+        if self.count == 0:
+            return np.nan
+        h = (self.count - 1) * q
+        lo = int(np.floor(h))
+        a = self._value_at(lo)
+        b = self._value_at(min(lo + 1, self.count - 1))
+        return a if a == b else _lerp(a, b, h - lo)
+
+    def describe(self, percentiles):
+        """Return statistics of the column as :meth:`pandas.Series.describe`
+        does, followed in approximate mode by the standard error of the
+        number of distinct values and the largest overestimation of the
+        frequency of the top value for columns which are not numeric."""
+        if self.numeric:
+            if self.count:
+                stats = [self.mins[0]]
+                stats += [self.quantile(q) for q in percentiles]
+                stats.append(self.values[-1])
+            else:
+                stats = [np.nan] * (len(percentiles) + 2)
+            mean = self.mean if self.count else np.nan
+            return [float(self.count), mean, self.std] + stats
+        if self.approximate:
+            unique = int(round(self.distinct.estimate()))
+            top, freq, freq_error = self.top_values.top()
+            unique_error = unique * self.distinct.relative_error
+            return [self.count, unique, top, freq, unique_error, freq_error]
+        if len(self.value_counts):
+            top = self.value_counts.idxmax()
+            freq = int(self.value_counts[top])
+        else:
+            top, freq = np.nan, np.nan
+        return [self.count, len(self.value_counts), top, freq]
+
+
+class DataProfile:
+    """Mergeable one pass summary of the columns of data.
+
+    A profile is built by :func:`profile_data` and gives missing values and
+    descriptive statistics of all the columns, as
+    :func:`yasc.eda.missing_stat` and :func:`yasc.eda.describe` do, without
+    reading data again.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of buckets of values of every numeric column, see
+        :class:`ColumnProfile`, by default 2000
+    approximate : bool, optional
+        Whether to summarize columns which are not numeric with sketches,
+        see :class:`ColumnProfile`, by default False
+
+    Attributes
+    ----------
+    n_rows : int
+        Number of rows seen.
+    columns : dict
+        A dictionary mapping each column to its :class:`ColumnProfile`.
+    """
+
+    def __init__(self, max_size=2000, approximate=False):
+        self.max_size = max_size
+        self.approximate = approximate
+        self.n_rows = 0
+        self.columns = {}
+
+    def update(self, data):
+        """Add a chunk of data.
+
+        Parameters
+        ----------
+        data : DataFrame
+            A chunk of data.
+
+        Returns
+        -------
+        DataProfile
+            The profile itself.
+        """
+        other = DataProfile(self.max_size, self.approximate)
+        other.n_rows = len(data)
+        other.columns = _profile_columns(
+            data, self.max_size, self.approximate
+        )
+        return self.merge(other)
+
+    def merge(self, other):
+        """Merge another profile, e.g. of another chunk.
+
+        Parameters
+        ----------
+        other : DataProfile
+            The profile to merge.
+
+        Returns
+        -------
+        DataProfile
+            The profile itself.
+        """
+        self.n_rows += other.n_rows
+        for col, column in other.columns.items():
+            if col in self.columns:
+                self.columns[col].merge(column)
+            else:
+                self.columns[col] = column
+        return self
+
+    def missing_stat(self, only_missing_columns=False):
+        """Return missing values' statistics, as :func:`missing_stat`."""
+        missing = pd.Series(
+            {col: column.missing for col, column in self.columns.items()},
+            dtype=np.int64,
+        )
+        return _missing_table(missing, self.n_rows, only_missing_columns)
+
+    def _stats(self, numeric, percentiles):
+        percentiles = _check_percentiles(percentiles)
+        categorical = ["unique", "top", "freq"]
+        if self.approximate:
+            categorical += ["unique_error", "freq_error"]
+        index = ["count"] + categorical + ["mean", "std", "min"]
+        index += format_percentiles(percentiles) + ["max"]
+        result = {}
+        for col, column in self.columns.items():
+            if numeric is not None and column.numeric != numeric:
+                continue
+            stats = column.describe(percentiles)
+            if column.numeric:
+                stats = stats[:1] + [np.nan] * len(categorical) + stats[1:]
+            else:
+                stats = stats + [np.nan] * (len(index) - len(stats))
+            result[col] = pd.Series(stats, index=index)
+        desc = pd.DataFrame(result, index=index)
+        kinds = {column.numeric for column in self.columns.values()}
+        if numeric is not None:
+            kinds = {numeric}
+        if True not in kinds:
+            desc = desc.iloc[: len(categorical) + 1]
+        elif False not in kinds:
+            desc = desc.drop(index=categorical)
+        return desc
+
+    def numeric_stat(self, percentiles=None):
+        """Describe numeric columns, as :func:`numeric_stat`."""
+        return self._stats(True, percentiles).astype(np.float64)
+
+    def categorical_stat(self):
+        """Describe other columns, as :func:`categorical_stat`."""
+        return self._stats(False, None)
+
+    def describe(self, percentiles=None):
+        """Generate descriptive statistics, as :func:`describe`."""
+        dtypes = pd.Series(
+            {col: column.dtype for col, column in self.columns.items()},
+            dtype=object,
+        )
+
+        def get_type(dtype):
+            if is_numeric_dtype(dtype):
+                return "numeric"
+            elif is_object_dtype(dtype):
+                return "categorical"
+            else:
+                return str(dtype)
+
+        missing = np.array([c.missing for c in self.columns.values()])
+        head = pd.DataFrame(
+            [
+                dtypes,
+                dtypes.apply(get_type),
+                pd.Series(missing, index=dtypes.index),
+                pd.Series(missing / self.n_rows, index=dtypes.index),
+            ],
+            index=["dtype", "type", "#missing", "missing_rate"],
+        )
+        return pd.concat([head, self._stats(None, percentiles)])
+
+
+def _missing_table(missing, n_rows, only_missing_columns=False):
+    """Make the table of :func:`missing_stat` of missing counts."""
+    stat_df = pd.DataFrame(missing).reset_index()
+    stat_df.columns = ["column", "#missing"]
+    if only_missing_columns:
+        stat_df = stat_df[stat_df["#missing"] > 0]
+    stat_df["missing_rate"] = stat_df["#missing"] / n_rows
+    return stat_df.sort_values(by="#missing")
+
+
+def _check_percentiles(percentiles):
+    """Add the median to percentiles and sort them, as
+    :meth:`pandas.DataFrame.describe` does."""
+    if percentiles is None:
+        percentiles = [0.25, 0.5, 0.75]
+    percentiles = list(percentiles)
+    if not all(0 <= q <= 1 for q in percentiles):
+        raise ValueError("percentiles should all be in the interval [0, 1]")
+    if 0.5 not in percentiles:
+        percentiles.append(0.5)
+    return sorted(set(percentiles))
+
+
+def _profile_columns(data, max_size, approximate=False):
+    return {
+        col: ColumnProfile(max_size, approximate).update(data[col])
+        for col in data.columns
+    }
+
+
+def profile_data(
+    data, columns=None, n_jobs=None, max_size=2000, approximate=False
+):
+    """Profile columns of data in one pass.
+
+    Every column is read once to count its missing values and compute its
+    mean and variance, minimum, maximum, percentiles and most frequent
+    value, which are then given by the returned profile for any of
+    :func:`describe`, :func:`missing_stat`, :func:`numeric_stat` and
+    :func:`categorical_stat`. Data may be read chunk by chunk, profiles of
+    chunks being merged, and columns are profiled on a pool of processes.
+
+    Parameters
+    ----------
+    data : DataFrame or iterable of DataFrame
+        Observed data, or chunks of it, e.g. returned by
+        :func:`pandas.read_csv` with `chunksize`.
+    columns : list, optional
+        Names of the columns to profile. Defaults to ``None``, meaning all
+        columns of the first chunk.
+    n_jobs : int, optional
+        Number of processes to use, ``-1`` means using all CPUs. Defaults to
+        ``None``, meaning 1.
+    max_size : int, optional
+        Maximum number of buckets of values of every numeric column, see
+        :class:`ColumnProfile`, by default 2000
+    approximate : bool, optional
+        Whether to summarize columns which are not numeric with sketches of
+        bounded memory, e.g. for columns of millions of distinct strings,
+        by default False. Statistics then include the standard error
+        ``unique_error`` of the number of distinct values and the largest
+        overestimation ``freq_error`` of the frequency of the top value.
+
+    Returns
+    -------
+    DataProfile
+        The profile of the data.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.eda import profile_data
+        >>> data = german_data()
+        >>> profile = profile_data(data)
+        >>> profile.numeric_stat().loc["mean", "DurationInMonth"]
+        20.903
+
+    """
+    chunks = iter([data] if isinstance(data, pd.DataFrame) else data)
+    first = next(chunks)
+    if columns is None:
+        columns = list(first.columns)
+    profile = DataProfile(max_size, approximate)
+    n_jobs = effective_n_jobs(n_jobs, len(columns))
+    if n_jobs == 1:
+        for chunk in itertools.chain([first], chunks):
+            profile.update(chunk[columns])
+        return profile
+
+    # Contiguous slices of the list, labels of mixed types are kept as is
+    size = -(-len(columns) // n_jobs)
+    groups = [columns[i : i + size] for i in range(0, len(columns), size)]
+    with ProcessPoolExecutor(n_jobs) as executor:
+        for chunk in itertools.chain([first], chunks):
+            partial = DataProfile(max_size, approximate)
+            partial.n_rows = len(chunk)
+            for part in executor.map(
+                _profile_columns,
+                [chunk[group] for group in groups],
+                itertools.repeat(max_size),
+                itertools.repeat(approximate),
+            ):
+                partial.columns.update(part)
+            profile.merge(partial)
+    return profile
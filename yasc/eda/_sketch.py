@@ -0,0 +1,193 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+
+__all__ = ["HyperLogLog", "SpaceSaving"]
+
+
+def _bit_length(x):
+    """Return the number of bits of unsigned 64-bit integers `x`."""
+    # Halves of 32 bits are converted to floats exactly
+    hi = (x >> np.uint64(32)).astype(np.float64)
+    lo = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, np.frexp(hi)[1] + 32, np.frexp(lo)[1])
+
+
+class HyperLogLog:
+    """Mergeable estimate of the number of distinct values.
+
+    Values are hashed to 64 bits with :func:`pandas.util.hash_array`. The
+    first `precision` bits of a hash pick one of ``m = 2 ** precision``
+    registers, which keeps the largest position of the first set bit of
+    the rest of the hashes. The estimate has a relative standard error of
+    about ``1.04 / sqrt(m)``, 0.8% by default, whatever the number of
+    values, with registers of ``m`` bytes.
+
+    Parameters
+    ----------
+    precision : int, optional
+        Number of bits indexing the registers, from 4 to 18, by default 14
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision should be in [4, 18]")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        """Relative standard error of the estimate."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        """Add values.
+
+        Parameters
+        ----------
+        values : array-like
+            Values, but missing ones.
+
+        Returns
+        -------
+        HyperLogLog
+            The sketch itself.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind in "SU":
+            values = values.astype(object)
+        if not len(values):
+            return self
+        # Without categorizing, which would build a table of distinct values
+        hashes = pd.util.hash_array(values, categorize=False)
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+        rest = hashes << p
+        # Position of the first set bit, at most 65 - precision
+        rank = 64 - self.precision + 1 - np.maximum(
+            _bit_length(rest) - self.precision, 0
+        )
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other):
+        """Merge another sketch of the same precision.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            The sketch to merge.
+
+        Returns
+        -------
+        HyperLogLog
+            The sketch itself.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precisions.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self):
+        """Return the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        powers = np.ldexp(1.0, -self.registers.astype(np.int64))
+        estimate = alpha * m * m / powers.sum()
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for few values
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+
+class SpaceSaving:
+    """Mergeable summary of the most frequent values.
+
+    At most `capacity` values are counted. Every count is an upper bound of
+    the frequency of its value and comes with an error, so that the
+    frequency is at least the count minus the error. Values which are not
+    counted occur at most `floor` times. Values are added chunk by chunk:
+    the exact counts of a chunk are merged into the summary, as in the
+    mergeable version of the Space-Saving algorithm, and only the
+    `capacity` largest counts are kept. Errors are at most about
+    ``2 * n / capacity`` for ``n`` values.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of values counted, by default 2000
+    """
+
+    def __init__(self, capacity=2000):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.floor = 0
+
+    def update(self, values):
+        """Add values.
+
+        Parameters
+        ----------
+        values : Series
+            Values, but missing ones.
+
+        Returns
+        -------
+        SpaceSaving
+            The summary itself.
+        """
+        other = SpaceSaving(self.capacity)
+        # In the order first seen, so that ties of top() go to the first
+        other.counts = pd.Series(values).value_counts(sort=False)
+        other.errors = pd.Series(0, index=other.counts.index)
+        other._truncate()
+        return self.merge(other)
+
+    def merge(self, other):
+        """Merge another summary.
+
+        Parameters
+        ----------
+        other : SpaceSaving
+            The summary to merge.
+
+        Returns
+        -------
+        SpaceSaving
+            The summary itself.
+        """
+        index = self.counts.index.union(other.counts.index, sort=False)
+
+        def aligned(series, default):
+            return series.reindex(index, fill_value=default)
+
+        self.counts = aligned(self.counts, self.floor) + aligned(
+            other.counts, other.floor
+        )
+        self.errors = aligned(self.errors, self.floor) + aligned(
+            other.errors, other.floor
+        )
+        self.floor += other.floor
+        self._truncate()
+        return self
+
+    def _truncate(self):
+        if len(self.counts) > self.capacity:
+            order = np.argsort(-self.counts.values, kind="stable")
+            dropped = self.counts.values[order[self.capacity :]]
+            self.floor = max(self.floor, int(dropped.max()))
+            self.counts = self.counts.iloc[order[: self.capacity]]
+            self.errors = self.errors.iloc[order[: self.capacity]]
+
+    def top(self):
+        """Return the most frequent value, its count and error.
+
+        Of values of equal counts, the first seen is returned.
+        """
+        if not len(self.counts):
+            return np.nan, np.nan, np.nan
+        top = self.counts.idxmax()
+        return top, int(self.counts[top]), int(self.errors[top])
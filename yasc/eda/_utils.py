@@ -1,9 +1,17 @@
 # Author: Liqiang Du <keris.du@gmail.com>
 import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-from pandas.api.types import is_numeric_dtype, is_object_dtype
+from pandas.api.types import is_numeric_dtype
+
+from ._corr import corr_pairs
+from ._profile import DataProfile, _missing_table, profile_data
+
+
+def _profile(data, approximate=False):
+    """Return the profile of data, or the given profile."""
+    if isinstance(data, DataProfile):
+        return data
+    return profile_data(data, approximate=approximate)
 
 
 def missing_stat(
@@ -13,8 +21,8 @@ def missing_stat(
 
     Parameters
     ----------
-    data : :class:`DataFrame`
-        Observed data.
+    data : :class:`DataFrame` or :class:`DataProfile`
+        Observed data, or its profile as returned by :func:`profile_data`.
     columns : :class:`str` or :class:`list`, optional
         A column name or a list of column names. Defaults to ``None``.
     show_print : bool, optional
@@ -47,37 +55,47 @@ def missing_stat(
     Check missing statistics of a single column:
 
         >>> missing_stat(df, "a")
-        Column a of dtype float64, 2 missings (0.67)
+        Column a of dtype float64, 2 missing(s) (0.67)
+        'Column a of dtype float64, 2 missing(s) (0.67)'
 
     """
-    _len = len(data)
-    if columns is None:
-        s = data.isnull().sum()  # Series
-    else:
-        s = data[columns].isnull().sum()
-    if isinstance(s, np.int64):  # columns is passed as a str
-        print(
-            "Column {} of dtype {}, {} missing(s) ({:.2f})".format(
-                columns, data[columns].dtype, s, s / _len
-            )
+    if isinstance(data, DataProfile):
+        n_rows = data.n_rows
+        missing = pd.Series(
+            {col: column.missing for col, column in data.columns.items()},
+            dtype=np.int64,
+        )
+        dtypes = pd.Series(
+            {col: column.dtype for col, column in data.columns.items()},
+            dtype=object,
         )
     else:
-        stat_df = pd.DataFrame(s).reset_index()
-        stat_df.rename(columns={"index": "column", 0: "#missing"}, inplace=True)
-        if only_missing_columns:
-            stat_df = stat_df[stat_df["#missing"] > 0]
-        stat_df["missing_rate"] = stat_df["#missing"] / _len
-        n_missing_columns = len(stat_df[stat_df["#missing"] > 0])
+        # Counting missing values needs no profile of the data
+        n_rows = len(data)
+        missing = data.isnull().sum()
+        dtypes = data.dtypes
+    if isinstance(columns, str):  # columns is passed as a str
+        s = missing[columns]
+        message = "Column {} of dtype {}, {} missing(s) ({:.2f})".format(
+            columns, dtypes[columns], s, s / n_rows
+        )
         if show_print:
-            if n_missing_columns:
-                print(
-                    "{} columns, of which {} columns with missing values".format(
-                        len(data.columns), n_missing_columns
-                    )
+            print(message)
+        return message
+    if columns is not None:
+        missing = missing[columns]
+    stat_df = _missing_table(missing, n_rows, only_missing_columns)
+    n_missing_columns = len(stat_df[stat_df["#missing"] > 0])
+    if show_print:
+        if n_missing_columns:
+            print(
+                "{} columns, of which {} columns with missing values".format(
+                    len(dtypes), n_missing_columns
                 )
-            else:
-                print("No missing values")
-        return stat_df.sort_values(by="#missing")
+            )
+        else:
+            print("No missing values")
+    return stat_df
 
 
 def numeric_stat(data, percentiles=None):
@@ -85,8 +103,8 @@ def numeric_stat(data, percentiles=None):
 
     Parameters
     ----------
-    data : DataFrame
-        Observed data.
+    data : DataFrame or DataProfile
+        Observed data, or its profile as returned by :func:`profile_data`.
     percentils : list-like of numbers, optional
         The percentiles to include in the ouput.
 
@@ -96,39 +114,62 @@ def numeric_stat(data, percentiles=None):
         A descriptive statistics for numeric columns.
 
     """
-    desc = data.describe(percentiles, include=np.number)
-    return desc
+    return _profile(data).numeric_stat(percentiles)
 
 
-def categorical_stat(data):
+def categorical_stat(data, approximate=False):
     """Generate descriptive statistics for categorical columns.
 
-    Categorical columns here are columns of dtype `dtype('O')`.
+    Categorical columns here are columns which are not numeric, e.g. of
+    dtype `dtype('O')`, or boolean.
 
     Parameters
     ----------
-    data : DataFrame
-        Observed Data.
+    data : DataFrame or DataProfile
+        Observed data, or its profile as returned by :func:`profile_data`.
+    approximate : bool, optional
+        Whether to estimate statistics with sketches of bounded memory, see
+        :func:`profile_data`. Defaults to ``False``.
 
     Returns
     -------
     desc : DataFrame
         A descriptive statistics for categorical columns.
 
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.eda import categorical_stat
+        >>> data = german_data()
+        >>> categorical_stat(data, approximate=True)["Purpose"]
+        count                       1000
+        unique                        10
+        top             radio/television
+        freq                         280
+        unique_error             0.08125
+        freq_error                     0
+        Name: Purpose, dtype: object
+
     """
-    desc = data.describe(include=np.object)
-    return desc
+    return _profile(data, approximate).categorical_stat()
 
 
-def describe(data, percentiles=None):
+def describe(data, percentiles=None, approximate=False):
     """Generate descriptive statistics.
 
+    The data are profiled by :func:`profile_data` in one pass, which
+    gives their types, missing values and statistics at once.
+
     Parameters
     ----------
-    data : DataFrame
-        Observed data
+    data : DataFrame or DataProfile
+        Observed data, or its profile as returned by :func:`profile_data`.
     percentiles : list-like of numbers, optional
         The percentiles to include in the output. Defaults to ``None``.
+    approximate : bool, optional
+        Whether to estimate statistics of categorical columns with sketches
+        of bounded memory, see :func:`profile_data`. Defaults to ``False``.
 
     Returns
     -------
@@ -136,37 +177,25 @@ def describe(data, percentiles=None):
         Descriptive statistics including numeric columns, categorical columns
         and missing values.
     """
-    col_dtypes = pd.DataFrame(data.dtypes)
-    col_dtypes.rename(columns={0: "dtype"}, inplace=True)
-
-    def get_type(dtype):
-        if is_numeric_dtype(dtype):
-            return "numeric"
-        elif is_object_dtype(dtype):
-            return "categorical"
-        else:
-            return str(dtype)
-
-    col_dtypes["type"] = col_dtypes.dtype.apply(get_type)
-    desc = data.describe(percentiles, include="all")
-    result_df = pd.DataFrame(columns=desc.columns)
-    missing_desc = (
-        missing_stat(data, show_print=False).sort_index().set_index("column")
-    )
-    result_df = result_df.append(col_dtypes.dtype)
-    result_df = result_df.append(col_dtypes.type)
-    result_df = result_df.append(missing_desc["#missing"])
-    result_df = result_df.append(missing_desc.missing_rate)
-    result_df = result_df.append(desc)
-
-    return result_df
+    return _profile(data, approximate).describe(percentiles)
 
 
 def corr_analysis(
-    data, tight_layout=False, show_plot=False, title=None, rot=None, **kwargs
+    data,
+    tight_layout=False,
+    show_plot=False,
+    title=None,
+    rot=None,
+    max_features=50,
+    **kwargs,
 ):
     """Correlation analysis.
 
+    With more than `max_features` numeric columns, only the columns of the
+    strongest correlated pairs, found by :func:`corr_pairs`, are analysed,
+    ordered by hierarchical clustering so that correlated columns are next
+    to each other.
+
     Parameters
     ----------
     data : DataFrame
@@ -179,13 +208,17 @@ def corr_analysis(
         Title of heatmap of correlation matrix. Defautls to ``None``.
     rot : int
         Degrees of rotation for `xticklabels`.
+    max_features : int, optional
+        Maximum number of columns of the heatmap, by default 50
     kwargs : Keyword arguments
         All keyword arguments that are passed to :func:`seaborn.heatmap`.
+        Cells are annotated by default when there are at most 20 columns.
 
     Returns
     -------
     :class:`tuple`
-        Returns correlation matrix and axes object with the heatmap.
+        Returns correlation matrix of the columns of the heatmap and axes
+        object with the heatmap.
 
     Examples
     --------
@@ -198,6 +231,9 @@ def corr_analysis(
         >>> corr, ax = corr_analysis(data)
 
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     if title is None:
         title = "Heatmap of correlation matrix"
     if rot is None:
@@ -205,14 +241,16 @@ def corr_analysis(
     numeric_cols = [
         col for col in data.columns if is_numeric_dtype(data[col].dtype)
     ]
+    if len(numeric_cols) > max_features:
+        numeric_cols = _clustered_subset(data, numeric_cols, max_features)
     corr = data[numeric_cols].corr()
+    kwargs.setdefault("annot", len(numeric_cols) <= 20)
     fig, ax = plt.subplots()
     ax = sns.heatmap(
         corr,
         vmin=-1,
         vmax=1,
         center=0,
-        annot=True,
         cmap="YlGnBu",
         ax=ax,
         **kwargs,
@@ -226,3 +264,27 @@ def corr_analysis(
     if show_plot:
         plt.show()
     return corr, ax
+
+
+def _clustered_subset(data, columns, max_features):
+    """Select columns of the strongest correlated pairs, ordered by
+    hierarchical clustering of their absolute correlations."""
+    from scipy.cluster.hierarchy import leaves_list, linkage
+    from scipy.spatial.distance import squareform
+
+    pairs = corr_pairs(data, top_k=1, columns=columns)
+    pairs = pairs.iloc[np.argsort(-pairs["corr"].abs().values, kind="stable")]
+    selected = []
+    for var1, var2 in zip(pairs.var1, pairs.var2):
+        selected += [var for var in (var1, var2) if var not in selected]
+        if len(selected) >= max_features:
+            break
+    selected = selected[:max_features]
+    if len(selected) < 3:
+        return selected
+    distance = 1 - data[selected].corr().abs().fillna(0).values
+    np.fill_diagonal(distance, 0)
+    order = leaves_list(
+        linkage(squareform(distance, checks=False), method="average")
+    )
+    return [selected[i] for i in order]
@@ -1,7 +1,6 @@
 # Author: Liqiang Du <keris.du@gmail.com>
 import warnings
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
 from pandas.api.types import is_numeric_dtype
 
 
@@ -45,6 +44,8 @@ def rf_fill_missing(data, column, target=None, n_digits=0, **kwargs):
     X = df_known.loc[:, df_known.columns != column]
     y = df_known.loc[:, column]
 
+    from sklearn.ensemble import RandomForestRegressor
+
     # Create a random forest regressor
     rf = RandomForestRegressor(**kwargs)
     rf.fit(X, y)
@@ -1,3 +1,32 @@
 # Author: Liqiang Du <keris.du@gmail.com>
-from ._bin import mono_bin
-from .util import check_target, rocplot, ksplot, woebinplot
\ No newline at end of file
+from ._artifact import load_artifact, save_artifact
+from ._bin import mono_bin, mono_bin_counts, mono_bin_frame
+from ._categorical import CategoricalBinning
+from ._chimerge import chimerge_bin
+from ._fine import FineClassing
+from ._scorecard import Scorecard
+from ._screen import screen_iv
+from ._server import ScoringEngine, serve, start_server
+from ._sql import scorecard_sql, verify_sql
+from ._sketch import BinningSketch, mono_bin_chunks
+from ._woe import WoeTransformer
+from .util import check_target
+
+# Plotting functions of util are imported on first use
+_PLOTS = ["plot_report", "rocplot", "ksplot", "woebinplot"]
+
+
+def __getattr__(name):
+    if name in _PLOTS:
+        from . import util
+
+        value = getattr(util, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PLOTS))
@@ -0,0 +1,256 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import json
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import is_numeric_dtype
+
+from ._scorecard import Scorecard
+
+
+__all__ = ["save_artifact", "load_artifact"]
+
+_MAGIC = b"YASCART\x00"
+_VERSION = 1
+# Arrays start on multiples of this many bytes
+_ALIGN = 64
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(
+            type(obj).__name__
+        )
+    )
+
+
+class _Writer:
+    """Collect arrays of an artifact and lay them out in one buffer.
+
+    Arrays added under the same key and of the same type are concatenated,
+    so that many small arrays, e.g. columns of binning results of hundreds
+    of variables, are stored as a few contiguous ones.
+    """
+
+    def __init__(self):
+        self.arrays = {}
+        self.sizes = {}
+
+    def add(self, key, arr):
+        """Append `arr` to the array `key` and return where it is."""
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype.hasobject:
+            raise TypeError("Cannot store an array of objects.")
+        name = "{}:{}".format(key, arr.dtype.str)
+        start = self.sizes.get(name, 0)
+        self.arrays.setdefault(name, []).append(arr.reshape(-1))
+        self.sizes[name] = start + arr.size
+        return [name, start, arr.size]
+
+    def write(self, path, header):
+        arrays = {
+            name: np.concatenate(chunks)
+            for name, chunks in self.arrays.items()
+        }
+        # Offsets of arrays are relative to the end of the header
+        specs = {}
+        offset = 0
+        for name, arr in arrays.items():
+            offset = -(-offset // _ALIGN) * _ALIGN
+            specs[name] = [arr.dtype.str, arr.size, offset]
+            offset += arr.nbytes
+        header = dict(header, arrays=specs)
+        header = json.dumps(header, default=_json_default).encode()
+        start = -(-(16 + len(header)) // _ALIGN) * _ALIGN
+        buf = np.zeros(start + offset, dtype=np.uint8)
+        buf[:8] = np.frombuffer(_MAGIC, dtype=np.uint8)
+        buf[8:16] = np.array([len(header)], dtype="<u8").view(np.uint8)
+        buf[16 : 16 + len(header)] = np.frombuffer(header, dtype=np.uint8)
+        for (_, _, offset), arr in zip(specs.values(), arrays.values()):
+            buf[start + offset : start + offset + arr.nbytes] = arr.view(
+                np.uint8
+            )
+        with open(path, "wb") as f:
+            np.save(f, buf)
+
+
+def _dump_bin_stat(writer, bin_stat):
+    columns = {}
+    for col, values in bin_stat.items():
+        if is_numeric_dtype(values.dtype):
+            columns[col] = {"array": writer.add(col, values.values)}
+        elif values.nunique() <= 1 and len(values) > 0:
+            # e.g. edges, which mono_bin repeats on every row
+            columns[col] = {"value": values.iloc[0]}
+        else:
+            columns[col] = {"values": values.tolist()}
+
+    index = pd.CategoricalIndex(bin_stat.index)
+    categories = index.categories
+    spec = {
+        "name": index.name,
+        "ordered": bool(index.ordered),
+        "codes": writer.add("codes", index.codes),
+    }
+    if isinstance(categories, pd.IntervalIndex):
+        spec["left"] = writer.add("left", categories.left.values)
+        spec["right"] = writer.add("right", categories.right.values)
+        spec["closed"] = categories.closed
+    else:
+        spec["categories"] = categories.tolist()
+    return {"columns": columns, "index": spec}
+
+
+def _load_bin_stat(spec, array):
+    index = spec["index"]
+    if "closed" in index:
+        categories = pd.IntervalIndex.from_arrays(
+            array(index["left"]), array(index["right"]), closed=index["closed"]
+        )
+    else:
+        categories = pd.Index(index["categories"])
+    codes = array(index["codes"])
+    index = pd.CategoricalIndex(
+        pd.Categorical.from_codes(codes, categories, ordered=index["ordered"]),
+        name=index["name"],
+    )
+    data = {}
+    for col, column in spec["columns"].items():
+        if "array" in column:
+            data[col] = array(column["array"])
+        else:
+            data[col] = np.empty(len(index), dtype=object)
+            data[col][:] = column.get("values", column.get("value"))
+    return pd.DataFrame(data, index=index)
+
+
+def _dump_scorecard(writer, card):
+    variables = []
+    for var in card.variables:
+        spec = {
+            "name": var,
+            "coef": card.coef[var],
+            "points": writer.add("points", card.points[var]),
+        }
+        if var in card.levels:
+            spec["levels"] = card.levels[var].tolist()
+        else:
+            spec["cuts"] = writer.add("cuts", card.cuts[var])
+        variables.append(spec)
+    return {
+        "intercept": card.intercept,
+        "dtype": card.dtype.str,
+        "factor": card.factor,
+        "base_points": card.base_points,
+        "variables": variables,
+    }
+
+
+def _load_scorecard(header, array):
+    card = Scorecard.__new__(Scorecard)
+    card.variables = [spec["name"] for spec in header["variables"]]
+    card.coef = {spec["name"]: spec["coef"] for spec in header["variables"]}
+    card.intercept = header["intercept"]
+    card.dtype = np.dtype(header["dtype"])
+    card.factor = header["factor"]
+    card.base_points = card._round(header["base_points"])
+    card.cuts = {}
+    card.levels = {}
+    card.points = {}
+    for spec in header["variables"]:
+        var = spec["name"]
+        card.points[var] = array(spec["points"])
+        if "levels" in spec:
+            card.levels[var] = pd.Index(spec["levels"], dtype=object)
+        else:
+            card.cuts[var] = array(spec["cuts"])
+    return card
+
+
+def save_artifact(obj, path):
+    """Save a score card or binning results to a compact artifact file.
+
+    The file is a ``.npy`` array of bytes: a small JSON header describing
+    the artifact, followed by the edges, WOE values, points and so on as
+    contiguous aligned arrays. Loading it with :func:`load_artifact`
+    memory-maps the file, so that processes scoring with the same artifact
+    start fast and share its pages.
+
+    Parameters
+    ----------
+    obj : Scorecard or dict
+        A score card, or a dictionary mapping variables to their statistics
+        of binning, as returned by :func:`mono_bin_frame`.
+    path : str
+        Path of the file to write.
+    """
+    writer = _Writer()
+    if isinstance(obj, Scorecard):
+        header = {"kind": "scorecard", **_dump_scorecard(writer, obj)}
+    elif isinstance(obj, dict):
+        header = {
+            "kind": "bin_stats",
+            "variables": [
+                {"name": var, **_dump_bin_stat(writer, bin_stat)}
+                for var, bin_stat in obj.items()
+            ],
+        }
+    else:
+        raise TypeError(
+            "Expected a Scorecard or a dict of binning results, got {}.".format(
+                type(obj).__name__
+            )
+        )
+    writer.write(path, {"format": "yasc", "version": _VERSION, **header})
+
+
+def load_artifact(path, mmap_mode="r"):
+    """Load an artifact saved by :func:`save_artifact`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the artifact.
+    mmap_mode : {None, "r", "c"}, optional
+        Passed to :func:`numpy.load`. By default "r", the arrays of the
+        artifact are read-only views of the memory-mapped file. ``None``
+        reads the file into memory.
+
+    Returns
+    -------
+    Scorecard or dict
+        The saved score card or binning results.
+    """
+    buf = np.load(path, mmap_mode=mmap_mode)
+    if buf.dtype != np.uint8 or buf[:8].tobytes() != _MAGIC:
+        raise ValueError("{} is not a yasc artifact.".format(path))
+    size = int(buf[8:16].view("<u8")[0])
+    header = json.loads(buf[16 : 16 + size].tobytes())
+    if header["version"] > _VERSION:
+        raise ValueError(
+            "Artifact version {} is newer than the supported {}.".format(
+                header["version"], _VERSION
+            )
+        )
+    start = -(-(16 + size) // _ALIGN) * _ALIGN
+
+    arrays = {}
+    for name, (dtype, size, offset) in header["arrays"].items():
+        dtype = np.dtype(dtype)
+        data = buf[start + offset : start + offset + dtype.itemsize * size]
+        arrays[name] = np.asarray(data).view(dtype)
+
+    def array(spec):
+        name, first, size = spec
+        return arrays[name][first : first + size]
+
+    if header["kind"] == "scorecard":
+        return _load_scorecard(header, array)
+    return {
+        spec["name"]: _load_bin_stat(spec, array)
+        for spec in header["variables"]
+    }
@@ -1,17 +1,419 @@
 # Author: Liqiang Du <keris.du@gmail.com>
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-from scipy import stats
+from pandas.api.types import is_numeric_dtype
 
+from ..exception import LabelCountError
 from ..scorecard.util._check import check_target
+from ..scorecard.util._parallel import (
+    effective_n_jobs,
+    load_shared,
+    shared_array,
+)
+
+
+__all__ = ["mono_bin", "mono_bin_counts", "mono_bin_frame"]
+
+_labels = None  # Labels shared with worker processes of mono_bin_frame
+
+
+def _sorted_quantile(xs, q, cum_total=None):
+    """Compute quantiles of an already sorted array.
+
+    This mirrors the linear interpolation of :func:`numpy.quantile`, which is
+    what :func:`pandas.qcut` uses, without partitioning the data again. If
+    `cum_total` is given, `xs` holds distinct values and `cum_total` their
+    cumulative counts, and quantiles are those of the values repeated as
+    many times as they are counted.
+    """
+    q = np.asarray(q, dtype=float)
+    size = len(xs) if cum_total is None else cum_total[-1]
+    virtual = q * (size - 1)
+    lower = np.floor(virtual).astype(np.int64)
+    upper = np.minimum(lower + 1, size - 1)
+    gamma = virtual - lower
+    if cum_total is not None:
+        lower = np.searchsorted(cum_total, lower, side="right")
+        upper = np.searchsorted(cum_total, upper, side="right")
+    a = xs[lower].astype(float)
+    b = xs[upper].astype(float)
+    diff = b - a
+    result = a + diff * gamma
+    high = gamma >= 0.5
+    result[high] = b[high] - diff[high] * (1 - gamma[high])
+    return result
+
+
+def _quantile_edges(xs, n, duplicates="raise", cum_total=None, lowest=None):
+    """Return bin edges of sorted `xs` as :func:`pandas.qcut` would.
+
+    `lowest` replaces the minimum of `xs` when `xs` are not exact values.
+    """
+    if np.ndim(n) == 0:
+        quantiles = np.linspace(0, 1, n + 1)
+    else:
+        quantiles = np.asarray(n, dtype=float)
+    edges = _sorted_quantile(xs, quantiles, cum_total=cum_total)
+    if lowest is not None and quantiles[0] == 0:
+        edges[0] = lowest
+    unique_edges = np.unique(edges)
+    if len(unique_edges) < len(edges) and len(edges) != 2:
+        if duplicates == "raise":
+            raise ValueError(
+                "Bin edges must be unique: {}.\n"
+                "You can drop duplicate edges by setting the 'duplicates' "
+                "kwarg".format(repr(edges))
+            )
+        edges = unique_edges
+    return edges
+
+
+def _is_monotonic(bad, total):
+    """Whether bad rates of buckets are strictly monotonic.
+
+    Returns ``None`` when Spearman's rho of the buckets is undefined, i.e.
+    there are less than two buckets, a bucket is empty or all the bad rates
+    are equal, in which case the search for monotonic bins stops.
+    """
+    if len(total) < 2 or (total == 0).any():
+        return None
+    diff = np.diff(bad / total)
+    if (diff == 0).all():
+        return None
+    return bool((diff > 0).all() or (diff < 0).all())
+
+
+def _sorted_xy(y, X):
+    """Sort non-missing values of `X`, and separately those of bad cases.
+
+    Cumulative total and bad counts up to any edge are then given by binary
+    searches on the two sorted arrays, which avoids an indirect sort.
+    """
+    x = np.asarray(X)
+    mask = pd.notnull(x)
+    x, y = x[mask], y[mask]
+    xs = np.sort(x)
+    xs_bad = np.sort(x[y == 1])
+    return xs, xs_bad
+
+
+def _bucket_bounds(xs, edges):
+    """Locate buckets given by `edges` in sorted `xs`.
+
+    Buckets are right-closed and the first one includes its left edge.
+    Returns the start and end positions of every bucket.
+    """
+    ends = np.searchsorted(xs, edges, side="right")
+    starts = np.concatenate(
+        [np.searchsorted(xs, edges[:1], side="left"), ends[1:-1]]
+    )
+    return starts, ends[1:]
+
+
+def _bucket_counts(xs, xs_bad, edges):
+    """Count all and bad cases of sorted values `xs` in buckets."""
+    starts, ends = _bucket_bounds(xs, edges)
+    bad_starts, bad_ends = _bucket_bounds(xs_bad, edges)
+    return starts, ends, ends - starts, bad_ends - bad_starts
+
+
+def _table_bucket_counts(values, cum_total, cum_bad, edges):
+    """Count all and bad cases of a table of sorted distinct values.
+
+    `cum_total` and `cum_bad` are cumulative counts starting with 0.
+    """
+    starts, ends = _bucket_bounds(values, edges)
+    return (
+        starts,
+        ends,
+        cum_total[ends] - cum_total[starts],
+        cum_bad[ends] - cum_bad[starts],
+    )
+
+
+def _search_mono_bins(
+    xs, n, duplicates, bucket_counts, cum_total=None, lowest=None
+):
+    """Search the largest number of quantiles giving monotonous bins.
+
+    Candidates from `n` downwards are evaluated on sorted values `xs` (see
+    :func:`_quantile_edges` for `cum_total` and `lowest`) with
+    `bucket_counts`, which maps edges to start and end positions, total and
+    bad counts of buckets.
+    """
+    searched = set()
+    candidates = [n] if np.ndim(n) else range(n, 0, -1)
+    for k in candidates:
+        edges = _quantile_edges(
+            xs, k, duplicates=duplicates, cum_total=cum_total, lowest=lowest
+        )
+        if edges.tobytes() in searched:
+            continue
+        searched.add(edges.tobytes())
+        starts, ends, total, bad = bucket_counts(edges)
+        is_mono = _is_monotonic(bad, total)
+        if is_mono is None or is_mono:
+            break
+    return edges, starts, ends, total, bad
+
+
+def _bucket_min_max(mins, maxs, starts, ends, total):
+    """Return minimums and maximums of buckets, NaN for empty ones."""
+    nonempty = total > 0
+    bucket_mins = np.where(
+        nonempty, mins[np.minimum(starts, len(mins) - 1)], np.nan
+    )
+    bucket_maxs = np.where(nonempty, maxs[np.maximum(ends - 1, 0)], np.nan)
+    if nonempty.all():
+        bucket_mins = bucket_mins.astype(mins.dtype)
+        bucket_maxs = bucket_maxs.astype(maxs.dtype)
+    return bucket_mins, bucket_maxs
+
+
+def _fine_classes(
+    xs, n, bucket_counts, cum_total=None, mins=None, maxs=None
+):
+    """Split sorted values into `n` fine quantile buckets.
+
+    Arguments are those of :func:`_search_mono_bins`, `mins` and `maxs` the
+    minimums and maximums behind `xs`. Empty buckets are merged into their
+    right neighbour. Returns edges, minimums, maximums, total and bad counts
+    of the buckets.
+    """
+    edges = _quantile_edges(
+        xs,
+        n,
+        duplicates="drop",
+        cum_total=cum_total,
+        lowest=None if mins is None else mins[0],
+    )
+    starts, ends, total, bad = bucket_counts(edges)
+    keep = total > 0
+    kept_edges = np.concatenate([edges[:1], edges[1:][keep]])
+    kept_edges[-1] = edges[-1]
+    mins, maxs = _bucket_min_max(
+        xs if mins is None else mins,
+        xs if maxs is None else maxs,
+        starts[keep],
+        ends[keep],
+        total[keep],
+    )
+    return kept_edges, mins, maxs, total[keep], bad[keep]
 
 
-__all__ = ["mono_bin"]
+def _fine_classes_xy(y, X, n):
+    """Split `X` into fine quantile buckets against labels `y`."""
+    xs, xs_bad = _sorted_xy(y, X)
+    return _fine_classes(
+        xs, n, lambda edges: _bucket_counts(xs, xs_bad, edges)
+    )
 
 
-def mono_bin(Y, X, n=20, precision=3, duplicates="raise"):
+def _fine_classes_table(values, total, bad, n, mins=None):
+    """Split a table of sorted distinct values into fine quantile buckets."""
+    cum_total = np.concatenate([[0], np.cumsum(total)])
+    cum_bad = np.concatenate([[0], np.cumsum(bad)])
+    return _fine_classes(
+        values,
+        n,
+        lambda edges: _table_bucket_counts(values, cum_total, cum_bad, edges),
+        cum_total=cum_total[1:],
+        mins=mins,
+    )
+
+
+def _pool_adjacent_violators(bad, total, increasing=True):
+    """Merge adjacent buckets until bad rates are strictly monotonic.
+
+    Returns the end positions (exclusive) of the merged buckets.
+    """
+    sign = 1 if increasing else -1
+    stack = []  # [bad, total, end] of merged buckets
+    for i, (b, t) in enumerate(zip(bad, total)):
+        stack.append([b, t, i + 1])
+        while len(stack) > 1 and sign * (
+            stack[-1][0] * stack[-2][1] - stack[-2][0] * stack[-1][1]
+        ) <= 0:
+            b, t, end = stack.pop()
+            stack[-1][0] += b
+            stack[-1][1] += t
+            stack[-1][2] = end
+    return np.array([end for _, _, end in stack], dtype=np.intp)
+
+
+def _optimal_breaks(bad, total, total_bad, total_good, max_bins, min_size):
+    """Group buckets into monotonic bins maximizing IV.
+
+    A dynamic programming over the buckets finds, among the groupings into
+    at most `max_bins` bins of consecutive buckets, each holding at least
+    `min_size` of the cases and bad and good cases, with strictly monotonic
+    bad rates, one of largest IV. Its state is the last bin, so that a bin
+    only follows bins of lower, or higher, bad rate. For every end of the
+    last bin, previous bins are sorted by bad rate once and their running
+    maximum IV is searched for every next bin, in O(max_bins * m ** 2 *
+    log(m)) for m buckets. Returns the end positions (exclusive) of the
+    bins among the buckets.
+    """
+    m = len(total)
+    best_iv, best_breaks = -np.inf, np.array([m])
+    min_total = min_size * total.sum()
+    cum_bad = np.concatenate([[0], np.cumsum(bad)])
+    cum_total = np.concatenate([[0], np.cumsum(total)])
+    # iv[i, j] is the IV of a bin made of buckets i to j - 1
+    bins_bad = cum_bad[None, :] - cum_bad[:, None]
+    bins_total = cum_total[None, :] - cum_total[:, None]
+    bad_rate = bins_bad / total_bad
+    good_rate = (bins_total - bins_bad) / total_good
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iv = (bad_rate - good_rate) * np.log(bad_rate / good_rate)
+        rate = bins_bad / bins_total
+    valid = (
+        (bins_total >= min_total)
+        & (bins_bad > 0)
+        & (bins_bad < bins_total)
+        & np.triu(np.ones(bins_total.shape, dtype=bool), 1)
+    )
+    iv = np.where(valid, iv, -np.inf)
+
+    for sign in (1, -1):
+        keys = sign * rate
+        # best[l][i, j] is the largest IV of l + 1 bins made of the first j
+        # buckets, the last one starting at i, pointers[l][i, j] the start
+        # of the bin before it
+        best = [np.where(np.arange(m + 1)[:, None] == 0, iv, -np.inf)]
+        pointers = [None]
+        for _ in range(1, min(max_bins, m)):
+            layer = np.full((m + 1, m + 1), -np.inf)
+            pointer = np.zeros((m + 1, m + 1), dtype=np.intp)
+            for j in range(1, m):
+                starts = np.flatnonzero(best[-1][:j, j] > -np.inf)
+                ends = j + 1 + np.flatnonzero(iv[j, j + 1:] > -np.inf)
+                if not len(starts) or not len(ends):
+                    continue
+                starts = starts[np.argsort(keys[starts, j], kind="stable")]
+                values = best[-1][starts, j]
+                running = np.maximum.accumulate(values)
+                argmax = np.maximum.accumulate(
+                    np.where(values == running, np.arange(len(values)), 0)
+                )
+                # Number of previous bins of strictly lower key
+                found = np.searchsorted(
+                    keys[starts, j], keys[j, ends], side="left"
+                )
+                ends, found = ends[found > 0], found[found > 0] - 1
+                layer[j, ends] = running[found] + iv[j, ends]
+                pointer[j, ends] = starts[argmax[found]]
+            best.append(layer)
+            pointers.append(pointer)
+
+        last = np.array([layer[:, m] for layer in best])
+        n_bins, start = np.unravel_index(np.argmax(last), last.shape)
+        if last[n_bins, start] <= best_iv:
+            continue
+        best_iv = last[n_bins, start]
+        bounds, end = [m], m
+        for layer in range(n_bins, 0, -1):
+            bounds.append(start)
+            start, end = pointers[layer][start, end], start
+        best_breaks = np.array(bounds[::-1])
+    return best_breaks
+
+
+def _coarse_bin_stat(
+    edges, mins, maxs, total, bad, breaks, total_bad, total_good, precision
+):
+    """Build the statistics of bins made of consecutive fine buckets.
+
+    `breaks` are the end positions (exclusive) of the bins among the fine
+    buckets described by the other arrays, see :func:`_fine_classes`.
+    """
+    starts = np.concatenate([[0], breaks[:-1]])
+    return _bin_stat(
+        _interval_labels(edges[np.concatenate([[0], breaks])]),
+        mins[starts],
+        maxs[breaks - 1],
+        np.add.reduceat(bad, starts),
+        np.add.reduceat(total, starts),
+        total_bad,
+        total_good,
+        precision=precision,
+    )
+
+
+def _bin_stat(
+    labels, mins, maxs, bad, total, total_bad, total_good, precision=3,
+    bins=None,
+):
+    """Build the descriptive statistics of binning from bucket counts.
+
+    `bins` describes the binning as a whole, by default the bucket maximums
+    between infinite bounds.
+    """
+    bin_stat = pd.DataFrame(
+        index=pd.CategoricalIndex(labels, ordered=True, name="Bucket")
+    )
+    bin_stat["min"] = mins
+    bin_stat["max"] = maxs
+    bin_stat["bad_count"] = bad
+    bin_stat["good_count"] = total - bad
+    bin_stat["total"] = total
+    bin_stat["bad_rate"] = bin_stat["bad_count"] / total_bad
+    bin_stat["good_rate"] = bin_stat["good_count"] / total_good
+    bin_stat["woe"] = np.log(bin_stat["bad_rate"] / bin_stat["good_rate"])
+    bin_stat["iv"] = (bin_stat["bad_rate"] - bin_stat["good_rate"]) * bin_stat[
+        "woe"
+    ]
+    bin_stat["iv_sum"] = bin_stat["iv"].sum()
+    if bins is None:
+        bins = list(bin_stat["max"].round(precision))
+        bins.insert(0, float("-inf"))
+        bins.append(float("inf"))
+    bin_stat["bins"] = str(bins)
+    return bin_stat
+
+
+def _check_duplicates(duplicates):
+    if duplicates not in ["raise", "drop"]:
+        raise ValueError(
+            "invalid value for 'duplicates' parameter, "
+            "valid options are: raise, drop"
+        )
+
+
+def _check_method(method):
+    if method not in ["quantile", "optimal"]:
+        raise ValueError(
+            "invalid value for 'method' parameter, "
+            "valid options are: quantile, optimal"
+        )
+
+
+def _interval_labels(edges):
+    """Return the interval labels :func:`pandas.qcut` assigns to `edges`."""
+    return pd.cut(edges[:1], edges, include_lowest=True).categories
+
+
+def mono_bin(
+    Y, X, n=20, precision=3, duplicates="raise", method="quantile",
+    min_size=0.05, n_fine=100,
+):
     """Generate monotonous bins.
 
+    With the default ``method="quantile"``, the number of quantiles is
+    lowered from `n` until the bad rates of buckets are monotonous. `X` is
+    sorted only once; every candidate number of quantiles is then evaluated
+    with binary searches of its edges on the sorted values, so no pass over
+    the data is made per candidate.
+
+    With ``method="optimal"``, `X` is split into `n_fine` quantile buckets,
+    and the grouping of buckets into at most `n` bins of at least `min_size`
+    of the cases with monotonic bad rates and the largest IV is found by
+    dynamic programming. Bins are not thrown away because a single pair of
+    them violates monotonicity.
+
     Parameters
     ----------
     Y : Series
@@ -19,17 +421,33 @@ def mono_bin(Y, X, n=20, precision=3, duplicates="raise"):
     X : Series
         The series to bin, it should be of numeric type.
     n : int or list-like of int, optional
-        Number of quantiles, by default 20
+        Number of quantiles, by default 20. A list-like of quantiles is used
+        as is, without searching for monotonous bins. With
+        ``method="optimal"``, the maximum number of bins.
     precision : int, optional
         The precision at which to store and display the bins labels, by default 3
     duplicates : str, optional
         Argument used by :func:`pandas.qcut()`, by default "raise"
+    method : str, optional
+        Either "quantile" or "optimal", by default "quantile"
+    min_size : float, optional
+        Minimum share of non-missing cases in a bin with ``method="optimal"``,
+        by default 0.05
+    n_fine : int, optional
+        Number of quantile buckets to group with ``method="optimal"``, by
+        default 100
 
     Returns
     -------
     DataFrame
         Descriptive statistics of binning.
 
+    Raises
+    ------
+    ValueError
+        Raises when `n` is a list-like of quantiles with
+        ``method="optimal"``.
+
     Examples
     --------
 
@@ -51,32 +469,307 @@ def mono_bin(Y, X, n=20, precision=3, duplicates="raise"):
         (24.0, 72.0]   0.620240  0.097466  0.168117  [-inf, 12, 24, 72, inf]
 
     """
+    _check_duplicates(duplicates)
+    _check_method(method)
+    if method == "optimal" and np.ndim(n) != 0:
+        raise ValueError(
+            "'n' should be a maximum number of bins with method='optimal'"
+        )
     check_target(Y, inplace=True)
     total_bad = Y.sum()
     total_good = Y.count() - total_bad
-    rho = 0
-    while np.abs(rho) < 1:
-        df = pd.DataFrame(
-            {"X": X, "Y": Y, "Bucket": pd.qcut(X, n, duplicates=duplicates)}
+    return _mono_bin(
+        np.asarray(Y, dtype=np.int64),
+        X,
+        total_bad,
+        total_good,
+        n=n,
+        precision=precision,
+        duplicates=duplicates,
+        method=method,
+        min_size=min_size,
+        n_fine=n_fine,
+    )
+
+
+def _mono_bin(
+    y, X, total_bad, total_good, n, precision, duplicates, method="quantile",
+    min_size=0.05, n_fine=100,
+):
+    """Bin `X` against already validated labels `y`."""
+    if method == "optimal":
+        fine = _fine_classes_xy(y, X, n_fine)
+        breaks = _optimal_breaks(
+            fine[4], fine[3], total_bad, total_good, n, min_size
         )
-        gb = df.groupby("Bucket", as_index=True)
-        rho, pval = stats.spearmanr(gb.mean().X, gb.mean().Y)
-        n = n - 1
-    bin_stat = pd.DataFrame()
-    bin_stat["min"] = gb.min().X
-    bin_stat["max"] = gb.max().X
-    bin_stat["bad_count"] = gb.sum().Y
-    bin_stat["good_count"] = gb.count().Y - gb.sum().Y
-    bin_stat["total"] = gb.count().Y
-    bin_stat["bad_rate"] = bin_stat["bad_count"] / total_bad
-    bin_stat["good_rate"] = bin_stat["good_count"] / total_good
-    bin_stat["woe"] = np.log(bin_stat["bad_rate"] / bin_stat["good_rate"])
-    bin_stat["iv"] = (bin_stat["bad_rate"] - bin_stat["good_rate"]) * bin_stat[
-        "woe"
-    ]
-    bin_stat["iv_sum"] = bin_stat["iv"].sum()
-    bins = list(bin_stat["max"].round(precision))
-    bins.insert(0, float("-inf"))
-    bins.append(float("inf"))
-    bin_stat["bins"] = str(bins)
-    return bin_stat
+        return _coarse_bin_stat(
+            *fine, breaks, total_bad, total_good, precision=precision
+        )
+    xs, xs_bad = _sorted_xy(y, X)
+    edges, starts, ends, total, bad = _search_mono_bins(
+        xs,
+        n,
+        duplicates,
+        lambda edges: _bucket_counts(xs, xs_bad, edges),
+    )
+    mins, maxs = _bucket_min_max(xs, xs, starts, ends, total)
+    return _bin_stat(
+        _interval_labels(edges),
+        mins,
+        maxs,
+        bad,
+        total,
+        total_bad,
+        total_good,
+        precision=precision,
+    )
+
+
+def _mono_bin_table(
+    values, total, bad, total_bad, total_good, n, precision, duplicates,
+    mins=None,
+):
+    """Bin a table of sorted distinct `values` with their counts.
+
+    Quantiles and counts are those of the values repeated as many times as
+    they are counted, so the result is the same as binning the raw data.
+    `mins` are the minimums behind every value if the values are maximums of
+    summarized ranges rather than exact values.
+    """
+    cum_total = np.concatenate([[0], np.cumsum(total)])
+    cum_bad = np.concatenate([[0], np.cumsum(bad)])
+    edges, starts, ends, total, bad = _search_mono_bins(
+        values,
+        n,
+        duplicates,
+        lambda edges: _table_bucket_counts(values, cum_total, cum_bad, edges),
+        cum_total=cum_total[1:],
+        lowest=None if mins is None else mins[0],
+    )
+    mins, maxs = _bucket_min_max(
+        values if mins is None else mins, values, starts, ends, total
+    )
+    return _bin_stat(
+        _interval_labels(edges),
+        mins,
+        maxs,
+        bad,
+        total,
+        total_bad,
+        total_good,
+        precision=precision,
+    )
+
+
+def mono_bin_counts(
+    X, bad_count, good_count, n=20, precision=3, duplicates="raise"
+):
+    """Generate monotonous bins from a table of counts.
+
+    The table holds counts of bad and good cases per value, e.g. the result
+    of a ``GROUP BY`` in a database, and may hold weighted counts. Binning
+    takes O(number of values) instead of O(number of rows) and gives the same
+    result as :func:`mono_bin` on the rows behind the table.
+
+    Parameters
+    ----------
+    X : Series
+        Values, it should be of numeric type. A missing value counts the
+        cases where the value is missing.
+    bad_count : Series
+        Number of bad cases per value.
+    good_count : Series
+        Number of good cases per value.
+    n : int or list-like of int, optional
+        Number of quantiles, by default 20
+    precision : int, optional
+        The precision at which to store and display the bins labels, by default 3
+    duplicates : str, optional
+        Argument used by :func:`pandas.qcut()`, by default "raise"
+
+    Returns
+    -------
+    DataFrame
+        Descriptive statistics of binning.
+
+    Raises
+    ------
+    ValueError
+        Raises when a count is negative.
+    LabelCountError
+        Raises when there are no bad cases or no good cases.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import mono_bin_counts
+        >>> data = german_data()
+        >>> table = (
+        ...     data.groupby("DurationInMonth")
+        ...     .Creditability.value_counts()
+        ...     .unstack(fill_value=0)
+        ...     .reset_index()
+        ... )
+        >>> bin_stat = mono_bin_counts(
+        ...     table.DurationInMonth, table.bad, table.good, duplicates="drop"
+        ... )
+        >>> bin_stat.bins.iloc[0]
+        '[-inf, 12, 24, 72, inf]'
+
+    """
+    _check_duplicates(duplicates)
+    values, total, bad, total_bad, total_good = _count_table(
+        X, bad_count, good_count
+    )
+    return _mono_bin_table(
+        values,
+        total,
+        bad,
+        total_bad,
+        total_good,
+        n=n,
+        precision=precision,
+        duplicates=duplicates,
+    )
+
+
+def _count_table(X, bad_count, good_count):
+    """Validate a table of counts and sum it up by sorted distinct values.
+
+    Returns the values, their total and bad counts, and the overall bad and
+    good counts including those of missing values.
+    """
+    x = np.asarray(X)
+    bad = np.asarray(bad_count)
+    total = bad + np.asarray(good_count)
+    if (bad < 0).any() or (total < bad).any():
+        raise ValueError("counts should not be negative")
+    total_bad = bad.sum()
+    total_good = total.sum() - total_bad
+    if total_bad == 0 or total_good == 0:
+        raise LabelCountError("unique count of labels expects to be 2")
+
+    mask = pd.notnull(x)
+    values, inverse = np.unique(x[mask], return_inverse=True)
+    if len(values) < mask.sum():
+        total = np.bincount(inverse, weights=total[mask]).astype(total.dtype)
+        bad = np.bincount(inverse, weights=bad[mask]).astype(bad.dtype)
+    else:
+        order = np.argsort(x[mask], kind="mergesort")
+        total, bad = total[mask][order], bad[mask][order]
+    return values, total, bad, total_bad, total_good
+
+
+def _init_worker(path):
+    global _labels
+    _labels = load_shared(path)
+
+
+def _bin_column(column, X, total_bad, total_good, kwargs, y=None):
+    """Bin a single column, timing it."""
+    if y is None:
+        y = _labels
+    start = time.perf_counter()
+    bin_stat = _mono_bin(y, X, total_bad, total_good, **kwargs)
+    return column, bin_stat, time.perf_counter() - start
+
+
+def mono_bin_frame(
+    data, target, columns=None, n_jobs=None, n=20, precision=3,
+    duplicates="raise",
+):
+    """Generate monotonous bins for many columns of a data frame.
+
+    The target is validated and counted only once. With more than one job,
+    columns are binned on a process pool and the labels are shared with the
+    workers through a memory-mapped file rather than pickled per column.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Observed data including the target column.
+    target : str
+        Name of the target column, see :func:`check_target`.
+    columns : list, optional
+        Names of the columns to bin. Defaults to ``None``, meaning all numeric
+        columns but `target`.
+    n_jobs : int, optional
+        Number of processes to use, ``-1`` means using all CPUs. Defaults to
+        ``None``, meaning 1.
+    n : int or list-like of int, optional
+        Passed to :func:`mono_bin`, by default 20
+    precision : int, optional
+        Passed to :func:`mono_bin`, by default 3
+    duplicates : str, optional
+        Passed to :func:`mono_bin`, by default "raise"
+
+    Returns
+    -------
+    bin_stats : dict
+        A dictionary mapping each column to its statistics of binning as
+        returned by :func:`mono_bin`.
+    timings : Series
+        Seconds spent binning each column.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import mono_bin_frame
+        >>> data = german_data()
+        >>> bin_stats, timings = mono_bin_frame(
+        ...     data, "Creditability", duplicates="drop", n_jobs=2
+        ... )
+        >>> bin_stats["DurationInMonth"].iv_sum.iloc[0]
+        0.16811738682685928
+
+    """
+    _check_duplicates(duplicates)
+    Y = data[target].copy()
+    check_target(Y, inplace=True)
+    y = np.asarray(Y, dtype=np.int8)
+    total_bad = Y.sum()
+    total_good = Y.count() - total_bad
+    if columns is None:
+        columns = [
+            col
+            for col in data.columns
+            if col != target and is_numeric_dtype(data[col].dtype)
+        ]
+    kwargs = {"n": n, "precision": precision, "duplicates": duplicates}
+    return _bin_columns(
+        data, columns, y, total_bad, total_good, n_jobs, kwargs
+    )
+
+
+def _bin_columns(data, columns, y, total_bad, total_good, n_jobs, kwargs):
+    """Bin `columns` of `data` against validated labels `y`."""
+    n_jobs = effective_n_jobs(n_jobs, len(columns))
+    if n_jobs == 1:
+        results = [
+            _bin_column(col, data[col].values, total_bad, total_good, kwargs, y)
+            for col in columns
+        ]
+    else:
+        with shared_array(y) as path, ProcessPoolExecutor(
+            n_jobs, initializer=_init_worker, initargs=(path,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _bin_column,
+                    col,
+                    data[col].values,
+                    total_bad,
+                    total_good,
+                    kwargs,
+                )
+                for col in columns
+            ]
+            results = [future.result() for future in futures]
+
+    bin_stats = {col: bin_stat for col, bin_stat, _ in results}
+    timings = pd.Series(
+        {col: seconds for col, _, seconds in results}, name="seconds"
+    )
+    return bin_stats, timings
@@ -0,0 +1,219 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from ._bin import _bin_stat, _optimal_breaks
+from ..scorecard.util._check import check_target
+
+
+__all__ = ["CategoricalBinning"]
+
+
+def _bucket_label(levels, max_levels=3):
+    """Describe a bucket of levels, listing only the first few of them."""
+    label = ", ".join(str(level) for level in levels[:max_levels])
+    if len(levels) > max_levels:
+        label += ", ... (+{})".format(len(levels) - max_levels)
+    return label
+
+
+class CategoricalBinning:
+    """Bin a categorical column into monotonous groups of levels.
+
+    Levels are factorized once into integer codes and their bad and good
+    counts are computed with :func:`numpy.bincount`. Levels with less than
+    `min_level_size` of the cases are pooled into a single rare level. The
+    levels are sorted by their smoothed bad rate, cut into `n_fine` groups of
+    about equal counts and grouped into the bins maximizing IV as by
+    :func:`mono_bin` with ``method="optimal"``, so bad rates of the bins are
+    monotonous.
+
+    The WOE of every level is kept in an array indexed by level code, so
+    transforming is one hash lookup of the levels followed by one gather.
+
+    Parameters
+    ----------
+    Y : Series
+        A series of labels, see :func:`check_target`.
+    X : Series
+        The categorical series to bin.
+    max_bins : int, optional
+        Maximum number of bins, by default 10
+    min_size : float, optional
+        Minimum share of non-missing cases in a bin, by default 0.05
+    min_level_size : float, optional
+        Levels with a smaller share of non-missing cases are pooled, by
+        default 0.001
+    smoothing : float, optional
+        Weight of the overall bad rate when smoothing the bad rates of levels
+        to sort them, by default 1.0
+    n_fine : int, optional
+        Number of groups of levels to bin, by default 100
+
+    Attributes
+    ----------
+    levels : Index
+        Levels which are not pooled.
+    level_bins : ndarray
+        Bin of every level, the rare pool coming last.
+    woe : ndarray
+        WOE of every level, then of rare or unseen levels.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import CategoricalBinning
+        >>> data = german_data()
+        >>> cb = CategoricalBinning(data.Creditability, data.Purpose)
+        >>> cb.bin_stat()[["total", "woe"]]
+                                                  total       woe
+        Bucket
+        retraining, car (used)                      112 -0.805625
+        radio/television                            280 -0.410063
+        furniture/equipment, domestic appliances    193  0.099235
+        business, repairs                           119  0.241162
+        car (new)                                   234  0.359200
+        others, education                            62  0.587787
+        >>> cb.transform(["car (new)", "unknown", None])
+        array([0.35920049, 0.        , 0.        ])
+
+    """
+
+    def __init__(
+        self, Y, X, max_bins=10, min_size=0.05, min_level_size=0.001,
+        smoothing=1.0, n_fine=100,
+    ):
+        Y = pd.Series(Y).copy()
+        check_target(Y, inplace=True)
+        y = np.asarray(Y, dtype=np.int64)
+        self.total_bad = y.sum()
+        self.total_good = len(y) - self.total_bad
+
+        codes, levels = pd.factorize(np.asarray(X, dtype=object))
+        levels = pd.Index(levels, dtype=object)
+        mask = codes >= 0
+        total = np.bincount(codes[mask], minlength=len(levels))
+        bad = np.bincount(
+            codes[mask], weights=y[mask], minlength=len(levels)
+        ).astype(np.int64)
+
+        # Pool rare levels, which then have the last code
+        rare = total < min_level_size * total.sum()
+        self.levels = levels[~rare]
+        total = np.append(total[~rare], total[rare].sum())
+        bad = np.append(bad[~rare], bad[rare].sum())
+
+        # Sort levels by smoothed bad rate and cut them into fine groups
+        prior = self.total_bad / len(y)
+        rate = (bad + smoothing * prior) / (total + smoothing)
+        order = np.argsort(rate, kind="mergesort")
+        order = order[total[order] > 0]
+        step = total.sum() / n_fine
+        group = np.floor((np.cumsum(total[order]) - total[order]) / step)
+        starts = np.flatnonzero(np.diff(group, prepend=-1) > 0)
+        fine_bad = np.add.reduceat(bad[order], starts)
+        fine_total = np.add.reduceat(total[order], starts)
+        breaks = _optimal_breaks(
+            fine_bad,
+            fine_total,
+            self.total_bad,
+            self.total_good,
+            max_bins,
+            min_size,
+        )
+
+        # Map fine groups, then levels, to bins
+        fine_bins = np.repeat(
+            np.arange(len(breaks)), np.diff(np.concatenate([[0], breaks]))
+        )
+        sorted_bins = fine_bins[
+            np.searchsorted(starts, np.arange(len(order)), side="right") - 1
+        ]
+        self.level_bins = np.full(len(total), -1, dtype=np.intp)
+        self.level_bins[order] = sorted_bins
+        self._order = order
+        self._bad = np.bincount(
+            sorted_bins, weights=bad[order], minlength=len(breaks)
+        ).astype(np.int64)
+        self._total = np.bincount(
+            sorted_bins, weights=total[order], minlength=len(breaks)
+        ).astype(np.int64)
+        with np.errstate(divide="ignore"):
+            bin_woe = np.log(
+                (self._bad / self.total_bad)
+                / ((self._total - self._bad) / self.total_good)
+            )
+        self.woe = np.where(
+            self.level_bins >= 0, bin_woe[self.level_bins], 0.0
+        )
+
+    def bin_stat(self, precision=3):
+        """Return descriptive statistics of binning.
+
+        Buckets are labelled with their first few levels, ``min`` and
+        ``max`` are the levels with the smallest and largest bad rates of
+        every bucket. As for :func:`mono_bin`, ``bins`` describes the
+        binning as a whole and is the same on every row: the string of the
+        list of the numbers of levels of all the buckets, e.g.
+        ``"[2, 1, 2]"``, not the levels themselves.
+
+        Parameters
+        ----------
+        precision : int, optional
+            Unused, for compatibility with :func:`mono_bin`.
+
+        Returns
+        -------
+        DataFrame
+            Descriptive statistics of binning, as returned by
+            :func:`mono_bin`.
+        """
+        names = np.append(np.asarray(self.levels, dtype=object), "(rare)")
+        sorted_bins = self.level_bins[self._order]
+        bounds = np.flatnonzero(np.diff(sorted_bins, prepend=-1, append=-2))
+        buckets = [
+            names[self._order[start:end]]
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        return _bin_stat(
+            [_bucket_label(list(levels)) for levels in buckets],
+            [levels[0] for levels in buckets],
+            [levels[-1] for levels in buckets],
+            self._bad,
+            self._total,
+            self.total_bad,
+            self.total_good,
+            bins=[len(levels) for levels in buckets],
+        )
+
+    def transform(self, X, fill_value=0.0, dtype=np.float64):
+        """Map levels to their WOE.
+
+        Parameters
+        ----------
+        X : array-like
+            Levels to transform.
+        fill_value : float, optional
+            WOE of missing values, and of unseen levels if no rare levels
+            were pooled, by default 0.0
+        dtype : dtype, optional
+            Data type of the result, by default ``np.float64``
+
+        Returns
+        -------
+        ndarray
+            WOE values of `X`.
+        """
+        # The table ends with the rare, then missing value slots, which the
+        # codes -2 and -1 of unseen and missing values point to.
+        table = np.append(self.woe[:-1], [self.woe[-1], fill_value])
+        if self.level_bins[-1] < 0:
+            table[-2] = fill_value
+        table = table.astype(dtype)
+        x = np.asarray(X, dtype=object)
+        codes = self.levels.get_indexer(x)
+        unseen = codes < 0
+        if unseen.any():
+            codes[unseen & pd.notnull(x)] = -2
+        return table.take(codes)
@@ -0,0 +1,176 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import heapq
+
+import pandas as pd
+import numpy as np
+
+from ._bin import _coarse_bin_stat, _fine_classes_xy
+from ..scorecard.util._check import check_target
+
+
+__all__ = ["chimerge_bin"]
+
+
+def _chi2(bad1, good1, bad2, good2):
+    """Chi-square statistic of two adjacent buckets."""
+    total1, total2 = bad1 + good1, bad2 + good2
+    denominator = total1 * total2 * (bad1 + bad2) * (good1 + good2)
+    if denominator == 0:
+        return 0.0
+    diff = bad1 * good2 - bad2 * good1
+    return (total1 + total2) * diff * diff / denominator
+
+
+def _chimerge_breaks(bad, total, max_bins=10, min_size=0.05, significance=0.05):
+    """Merge adjacent buckets by ChiMerge.
+
+    Chi-square values of adjacent pairs are kept in a heap. Merging a pair
+    only recomputes the values of its two neighbouring pairs, entries of
+    pairs changed since are skipped when popped, so that merging m buckets
+    takes O(m log m). Pairs are merged while there are more than `max_bins`
+    bins or they are not significantly different at level `significance`.
+    Then bins with less than `min_size` of the cases are merged into the
+    neighbour they are the least different from. Returns the end positions
+    (exclusive) of the bins among the buckets.
+    """
+    from scipy import stats
+
+    m = len(total)
+    bad = np.asarray(bad, dtype=float).copy()
+    good = np.asarray(total, dtype=float) - bad
+    size = bad + good
+    prev = np.arange(-1, m - 1)
+    nxt = np.arange(1, m + 1)
+    nxt[-1] = -1
+    version = np.zeros(m, dtype=np.int64)
+    alive = np.ones(m, dtype=bool)
+    n_bins = m
+    threshold = stats.chi2.ppf(1 - significance, df=1)
+    min_total = min_size * size.sum()
+
+    def pair_chi2(i):
+        j = nxt[i]
+        return _chi2(bad[i], good[i], bad[j], good[j])
+
+    def entry(i):
+        return (pair_chi2(i), i, version[i], version[nxt[i]])
+
+    def is_stale(i, version_i, version_j):
+        return (
+            not alive[i]
+            or nxt[i] < 0
+            or version[i] != version_i
+            or version[nxt[i]] != version_j
+        )
+
+    def merge_next(i):
+        """Merge bucket nxt[i] into bucket i and return entries to push."""
+        nonlocal n_bins
+        j = nxt[i]
+        bad[i] += bad[j]
+        good[i] += good[j]
+        size[i] += size[j]
+        alive[j] = False
+        nxt[i] = nxt[j]
+        if nxt[j] >= 0:
+            prev[nxt[j]] = i
+        version[i] += 1
+        n_bins -= 1
+        return [entry(k) for k in (prev[i], i) if k >= 0 and nxt[k] >= 0]
+
+    heap = [entry(i) for i in range(m - 1)]
+    heapq.heapify(heap)
+    while heap and n_bins > 1:
+        chi2, i, version_i, version_j = heapq.heappop(heap)
+        if is_stale(i, version_i, version_j):
+            continue
+        if chi2 >= threshold and n_bins <= max_bins:
+            break
+        for item in merge_next(i):
+            heapq.heappush(heap, item)
+
+    small = [(size[i], i, version[i]) for i in np.flatnonzero(alive)]
+    small = [item for item in small if item[0] < min_total]
+    heapq.heapify(small)
+    while small and n_bins > 1:
+        _, i, version_i = heapq.heappop(small)
+        if not alive[i] or version[i] != version_i:
+            continue
+        left, right = prev[i], nxt[i]
+        if right < 0 or (
+            left >= 0 and pair_chi2(left) <= pair_chi2(i)
+        ):
+            merge_next(left)
+            i = left
+        else:
+            merge_next(i)
+        if size[i] < min_total:
+            heapq.heappush(small, (size[i], i, version[i]))
+
+    starts = np.flatnonzero(alive)
+    return np.append(starts[1:], m)
+
+
+def chimerge_bin(
+    Y, X, max_bins=10, min_size=0.05, significance=0.05, n_fine=100,
+    precision=3,
+):
+    """Generate bins by ChiMerge.
+
+    `X` is first split into `n_fine` quantile buckets, which are then merged
+    bottom-up, the pair of adjacent buckets with the smallest chi-square
+    statistic first.
+
+    Parameters
+    ----------
+    Y : Series
+        A series of labels.
+    X : Series
+        The series to bin, it should be of numeric type.
+    max_bins : int, optional
+        Maximum number of bins, by default 10
+    min_size : float, optional
+        Minimum share of non-missing cases in a bin, by default 0.05
+    significance : float, optional
+        Adjacent bins are merged unless their bad rates differ at this
+        significance level, by default 0.05
+    n_fine : int, optional
+        Number of quantile buckets to start from, by default 100
+    precision : int, optional
+        The precision at which to store and display the bins labels, by default 3
+
+    Returns
+    -------
+    DataFrame
+        Descriptive statistics of binning, as returned by :func:`mono_bin`.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import chimerge_bin
+        >>> data = german_data()
+        >>> chimerge_bin(data.Creditability, data.AgeInYears)[["total", "woe"]]
+                        total       woe
+        Bucket
+        (18.999, 25.0]    190  0.528844
+        (25.0, 34.0]      358  0.060465
+        (34.0, 52.0]      356 -0.407272
+        (52.0, 75.0]       96  0.009901
+
+    """
+    Y = pd.Series(Y).copy()
+    check_target(Y, inplace=True)
+    total_bad = Y.sum()
+    total_good = Y.count() - total_bad
+    fine = _fine_classes_xy(np.asarray(Y, dtype=np.int8), X, n_fine)
+    breaks = _chimerge_breaks(
+        fine[4],
+        fine[3],
+        max_bins=max_bins,
+        min_size=min_size,
+        significance=significance,
+    )
+    return _coarse_bin_stat(
+        *fine, breaks, total_bad, total_good, precision=precision
+    )
@@ -0,0 +1,290 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from ._bin import (
+    _coarse_bin_stat,
+    _count_table,
+    _fine_classes_table,
+    _fine_classes_xy,
+    _optimal_breaks,
+    _pool_adjacent_violators,
+)
+from ..scorecard.util._check import check_target
+
+
+__all__ = ["FineClassing"]
+
+
+class FineClassing:
+    """Fine classing of a numeric column to derive coarse classes from.
+
+    The column is split once into `n` fine quantile buckets whose counts are
+    cached. Coarse classes are unions of adjacent fine buckets, so merging,
+    splitting, cutting at custom points, enforcing monotonicity and computing
+    WOE and IV take O(number of buckets) and never access the data again.
+
+    Parameters
+    ----------
+    Y : Series
+        A series of labels, see :func:`check_target`.
+    X : Series
+        The series to bin, it should be of numeric type.
+    n : int, optional
+        Number of fine quantiles, by default 100
+
+    Attributes
+    ----------
+    edges : ndarray
+        Edges of the fine buckets, which are right-closed.
+    breaks : ndarray
+        End positions (exclusive) of the coarse classes among fine buckets.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import FineClassing
+        >>> data = german_data()
+        >>> fc = FineClassing(data.Creditability, data.AgeInYears)
+        >>> fc.cut([25, 35, 45]).bin_stat()[["total", "woe"]]
+                        total       woe
+        Bucket
+        (18.999, 25.0]    190  0.528844
+        (25.0, 35.0]      398 -0.016807
+        (35.0, 45.0]      226 -0.287033
+        (45.0, 75.0]      186 -0.237028
+        >>> fc.monotonize().bin_stat()[["total", "woe"]]
+                        total       woe
+        Bucket
+        (18.999, 25.0]    190  0.528844
+        (25.0, 35.0]      398 -0.016807
+        (35.0, 75.0]      412 -0.264302
+
+    """
+
+    def __init__(self, Y, X, n=100):
+        Y = pd.Series(Y).copy()
+        check_target(Y, inplace=True)
+        self.total_bad = Y.sum()
+        self.total_good = Y.count() - self.total_bad
+        self._set_buckets(*_fine_classes_xy(np.asarray(Y, dtype=np.int8), X, n))
+
+    @classmethod
+    def from_counts(cls, X, bad_count, good_count, n=100):
+        """Create a fine classing from a table of counts.
+
+        Parameters
+        ----------
+        X : Series
+            Values, see :func:`mono_bin_counts`.
+        bad_count : Series
+            Number of bad cases per value.
+        good_count : Series
+            Number of good cases per value.
+        n : int, optional
+            Number of fine quantiles, by default 100
+
+        Returns
+        -------
+        FineClassing
+            The fine classing.
+        """
+        values, total, bad, total_bad, total_good = _count_table(
+            X, bad_count, good_count
+        )
+        fc = cls.__new__(cls)
+        fc.total_bad = total_bad
+        fc.total_good = total_good
+        fc._set_buckets(*_fine_classes_table(values, total, bad, n))
+        return fc
+
+    def _set_buckets(self, edges, mins, maxs, total, bad):
+        self.edges = edges
+        self.mins = mins
+        self.maxs = maxs
+        self.total = total
+        self.bad = bad
+        self.reset()
+
+    def reset(self):
+        """Make every fine bucket a coarse class."""
+        self.breaks = np.arange(1, len(self.total) + 1)
+        return self
+
+    @property
+    def n_fine(self):
+        """Number of fine buckets."""
+        return len(self.total)
+
+    def _starts(self):
+        return np.concatenate([[0], self.breaks[:-1]])
+
+    def _coarse_counts(self):
+        starts = self._starts()
+        return (
+            np.add.reduceat(self.bad, starts),
+            np.add.reduceat(self.total, starts),
+        )
+
+    def merge(self, start, stop=None):
+        """Merge adjacent coarse classes.
+
+        Parameters
+        ----------
+        start : int
+            Position of the first coarse class to merge.
+        stop : int, optional
+            Position of the last coarse class to merge. Defaults to ``None``,
+            meaning ``start + 1``.
+
+        Returns
+        -------
+        FineClassing
+            The fine classing itself.
+        """
+        if stop is None:
+            stop = start + 1
+        if not 0 <= start < stop < len(self.breaks):
+            raise IndexError(
+                "coarse classes to merge should be in [0, {})".format(
+                    len(self.breaks)
+                )
+            )
+        self.breaks = np.delete(self.breaks, np.arange(start, stop))
+        return self
+
+    def _snap(self, points):
+        """Return fine bucket positions right after cut `points`."""
+        positions = np.searchsorted(
+            self.edges[1:-1], np.atleast_1d(points), side="right"
+        )
+        return positions[(positions > 0) & (positions < self.n_fine)]
+
+    def split(self, value):
+        """Split the coarse class containing `value` right after it.
+
+        The cut is made at the largest fine edge not greater than `value`.
+
+        Returns
+        -------
+        FineClassing
+            The fine classing itself.
+        """
+        self.breaks = np.union1d(self.breaks, self._snap(value))
+        return self
+
+    def cut(self, points):
+        """Make coarse classes from custom cut points.
+
+        Every cut point is moved to the largest fine edge not greater than it.
+
+        Parameters
+        ----------
+        points : list-like of numbers
+            Cut points, a class holds values ``x`` with ``a < x <= b`` for
+            consecutive cut points ``a`` and ``b``.
+
+        Returns
+        -------
+        FineClassing
+            The fine classing itself.
+        """
+        self.breaks = np.union1d(self._snap(points), [self.n_fine])
+        return self
+
+    def monotonize(self, increasing=None):
+        """Merge adjacent coarse classes until their bad rates are monotonic.
+
+        Parameters
+        ----------
+        increasing : bool, optional
+            Whether bad rates should increase. Defaults to ``None``, meaning
+            the direction giving the larger IV.
+
+        Returns
+        -------
+        FineClassing
+            The fine classing itself.
+        """
+        bad, total = self._coarse_counts()
+        if increasing is None:
+            candidates = [
+                _pool_adjacent_violators(bad, total, True),
+                _pool_adjacent_violators(bad, total, False),
+            ]
+            ivs = []
+            for ends in candidates:
+                self.breaks, breaks = self.breaks[ends - 1], self.breaks
+                ivs.append(self.iv)
+                self.breaks = breaks
+            ends = candidates[int(np.argmax(ivs))]
+        else:
+            ends = _pool_adjacent_violators(bad, total, increasing)
+        self.breaks = self.breaks[ends - 1]
+        return self
+
+    def optimize(self, max_bins=20, min_size=0.05):
+        """Make the monotonic coarse classes maximizing IV.
+
+        See :func:`mono_bin` with ``method="optimal"``.
+
+        Parameters
+        ----------
+        max_bins : int, optional
+            Maximum number of coarse classes, by default 20
+        min_size : float, optional
+            Minimum share of non-missing cases in a coarse class, by
+            default 0.05
+
+        Returns
+        -------
+        FineClassing
+            The fine classing itself.
+        """
+        self.breaks = _optimal_breaks(
+            self.bad,
+            self.total,
+            self.total_bad,
+            self.total_good,
+            max_bins,
+            min_size,
+        )
+        return self
+
+    @property
+    def iv(self):
+        """Information value of the coarse classes."""
+        bad, total = self._coarse_counts()
+        bad_rate = bad / self.total_bad
+        good_rate = (total - bad) / self.total_good
+        with np.errstate(divide="ignore", invalid="ignore"):
+            iv = (bad_rate - good_rate) * np.log(bad_rate / good_rate)
+        return iv.sum()
+
+    def bin_stat(self, precision=3):
+        """Return descriptive statistics of the coarse classes.
+
+        Parameters
+        ----------
+        precision : int, optional
+            The precision at which to store and display the bins labels, by
+            default 3
+
+        Returns
+        -------
+        DataFrame
+            Descriptive statistics of binning, as returned by
+            :func:`mono_bin`.
+        """
+        return _coarse_bin_stat(
+            self.edges,
+            self.mins,
+            self.maxs,
+            self.total,
+            self.bad,
+            self.breaks,
+            self.total_bad,
+            self.total_good,
+            precision=precision,
+        )
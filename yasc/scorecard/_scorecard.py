@@ -0,0 +1,229 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+
+from ._woe import _compile_bin_stat
+
+
+__all__ = ["Scorecard"]
+
+
+class Scorecard:
+    """A score card compiled into lookup arrays of points.
+
+    Points are scaled so that a score of `base_score` means good:bad odds of
+    `base_odds` and that the odds double every `pdo` points. With the WOE of
+    a variable defined as in :func:`mono_bin` and the coefficients of a
+    logistic regression of bad cases on the WOE, a bin of WOE ``w`` of a
+    variable of coefficient ``b`` is worth ``-factor * b * w`` points, where
+    ``factor = pdo / log(2)``.
+
+    Each numeric variable is compiled into its cut points, with ``inf``
+    appended, and the points of its bins followed by the points of missing
+    values. Since :func:`numpy.searchsorted` puts ``NaN`` after ``inf``,
+    scoring a variable is one binary search and one gather, missing values
+    included. Categorical variables are compiled into their levels and an
+    array of points indexed by level code.
+
+    Parameters
+    ----------
+    bin_stats : dict
+        A dictionary mapping variables to their statistics of binning, as
+        returned by :func:`mono_bin`, or to a :class:`CategoricalBinning`.
+    coef : dict or list-like
+        Logistic regression coefficients of the variables, in the order of
+        `bin_stats` if not a dictionary.
+    intercept : float, optional
+        Intercept of the logistic regression, by default 0.0
+    base_score : float, optional
+        Score of odds `base_odds`, by default 600
+    base_odds : float, optional
+        Good:bad odds at `base_score`, by default 50
+    pdo : float, optional
+        Points to double the odds, by default 20
+    fill_value : float, optional
+        WOE of missing values, by default 0.0
+    dtype : dtype, optional
+        Data type of points and scores, by default ``np.float64``. With an
+        integer type, e.g. ``np.int16``, points are rounded and scores are
+        accumulated in that type, which must be wide enough for the scores.
+
+    Attributes
+    ----------
+    variables : list
+        Names of the variables.
+    base_points : number
+        Points every score starts with.
+    cuts : dict
+        Cut points of numeric variables, ``inf`` being the last one.
+    levels : dict
+        Levels of categorical variables.
+    points : dict
+        Points of the bins of each variable, then of missing values.
+
+    Raises
+    ------
+    ValueError
+        Raises when points are not finite, i.e. a bin has an infinite WOE
+        because it holds no bad or no good cases. Its WOE is to be smoothed
+        or the bin merged with a neighbour before building the card, since
+        such points cannot be rounded to an integer type.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> import numpy as np
+        >>> from yasc.scorecard import Scorecard, WoeTransformer
+        >>> data = german_data()
+        >>> X = data[["DurationInMonth", "AgeInYears"]]
+        >>> woe = WoeTransformer().fit(X, data.Creditability)
+        >>> card = Scorecard.from_woe_transformer(
+        ...     woe, [0.9, 0.8], -0.85, dtype=np.int16
+        ... )
+        >>> card.score(X[:3])
+        array([528, 489, 528], dtype=int16)
+
+    """
+
+    def __init__(
+        self,
+        bin_stats,
+        coef,
+        intercept=0.0,
+        base_score=600,
+        base_odds=50,
+        pdo=20,
+        fill_value=0.0,
+        dtype=np.float64,
+    ):
+        self.variables = list(bin_stats)
+        if not isinstance(coef, dict):
+            coef = dict(zip(self.variables, coef))
+        self.coef = coef
+        self.intercept = intercept
+        self.dtype = np.dtype(dtype)
+        self.factor = pdo / np.log(2)
+        offset = base_score - self.factor * np.log(base_odds)
+        self.base_points = self._round(offset - self.factor * intercept)
+        self.cuts = {}
+        self.levels = {}
+        self.points = {}
+        for var, binning in bin_stats.items():
+            scale = -self.factor * coef[var]
+            if isinstance(binning, pd.DataFrame):
+                cuts, woe = _compile_bin_stat(binning)
+                self.cuts[var] = np.append(cuts, np.inf)
+                woe = np.append(woe, fill_value)
+            else:
+                # Levels, then rare or unseen levels, then missing values
+                self.levels[var] = binning.levels
+                woe = np.append(binning.woe, fill_value)
+                if binning.level_bins[-1] < 0:
+                    woe[-2] = fill_value
+            points = scale * woe
+            if not np.isfinite(points).all():
+                raise ValueError(
+                    "points of variable {!r} are not finite, a bin has no "
+                    "bad or no good cases, smooth its WOE or merge it".format(
+                        var
+                    )
+                )
+            self.points[var] = np.ascontiguousarray(self._round(points))
+
+    @classmethod
+    def from_woe_transformer(cls, transformer, coef, intercept=0.0, **kwargs):
+        """Create a score card from a fitted :class:`WoeTransformer`.
+
+        Parameters
+        ----------
+        transformer : WoeTransformer
+            The fitted transformer.
+        coef : dict or list-like
+            Coefficients of the columns of the transformer.
+        intercept : float, optional
+            Intercept of the logistic regression, by default 0.0
+        kwargs : Keyword arguments
+            Other arguments passed to :class:`Scorecard`. The WOE of missing
+            values defaults to the one of the transformer.
+
+        Returns
+        -------
+        Scorecard
+            The score card.
+        """
+        kwargs.setdefault("fill_value", transformer.fill_value)
+        bin_stats = {
+            col: transformer.categorical_.get(col, bin_stat)
+            for col, bin_stat in transformer.bin_stats_.items()
+        }
+        return cls(bin_stats, coef, intercept, **kwargs)
+
+    def _round(self, points):
+        if self.dtype.kind in "iu":
+            return np.round(points).astype(self.dtype)
+        return np.asarray(points, dtype=self.dtype)
+
+    def _codes(self, var, x):
+        """Return the position of every value of `x` in points of `var`."""
+        if var in self.levels:
+            x = np.asarray(x, dtype=object)
+            codes = self.levels[var].get_indexer(x)
+            unseen = codes < 0
+            if unseen.any():
+                # -1 points to missing values, -2 to rare or unseen levels
+                codes[unseen & pd.notnull(x)] = -2
+            return codes
+        return np.searchsorted(
+            self.cuts[var], np.asarray(x, dtype=np.float64), side="left"
+        )
+
+    def variable_points(self, var, x):
+        """Return points of values `x` of variable `var`."""
+        return self.points[var].take(self._codes(var, x))
+
+    def score(self, X):
+        """Score data.
+
+        Parameters
+        ----------
+        X : DataFrame or ndarray
+            Data including all the variables, a 2-D array having them as
+            columns in the order of :attr:`variables`.
+
+        Returns
+        -------
+        ndarray
+            Scores of the rows of `X`.
+        """
+        if isinstance(X, pd.DataFrame):
+            columns = [X[var].values for var in self.variables]
+        else:
+            columns = np.asarray(X).T
+        scores = np.full(len(X), self.base_points, dtype=self.dtype)
+        for var, x in zip(self.variables, columns):
+            scores += self.variable_points(var, x)
+        return scores
+
+    def points_table(self):
+        """Return points of every bin of every variable.
+
+        Returns
+        -------
+        DataFrame
+            A data frame with columns ``variable``, ``bin`` and ``points``,
+            bins being the upper bounds of numeric bins or the levels of
+            categorical variables.
+        """
+        frames = []
+        for var in self.variables:
+            if var in self.levels:
+                bins = list(self.levels[var]) + ["(rare)", "(missing)"]
+                points = self.points[var]
+            else:
+                bins = list(self.cuts[var]) + ["(missing)"]
+                points = self.points[var]
+            frames.append(
+                pd.DataFrame({"variable": var, "bin": bins, "points": points})
+            )
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,230 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import asyncio
+import bisect
+import functools
+import heapq
+import json
+
+import numpy as np
+
+from ._artifact import load_artifact
+
+
+__all__ = ["ScoringEngine", "start_server", "serve"]
+
+# Longest request line accepted, large enough for batches of many records
+_LIMIT = 2 ** 24
+
+
+class ScoringEngine:
+    """Score records with a :class:`Scorecard` at low latency.
+
+    Lookup structures are precomputed once as plain Python objects: sorted
+    lists of cut points searched with :mod:`bisect` for numeric variables and
+    dictionaries of points for categorical variables. A single record is then
+    scored without NumPy or pandas overhead, while larger batches are scored
+    column-wise by the score card.
+
+    Reason codes of a record are the variables where it lost the most points
+    compared to the best bin of the variable.
+
+    Parameters
+    ----------
+    scorecard : Scorecard
+        The score card.
+    n_reasons : int, optional
+        Number of reason codes to return, by default 3
+    batch_size : int, optional
+        Batches of at least this number of records are scored with NumPy, by
+        default 64
+
+    Examples
+    --------
+
+        >>> engine = ScoringEngine(card)
+        >>> score, reasons = engine.score_record(
+        ...     {"DurationInMonth": 48, "AgeInYears": 23}
+        ... )
+        >>> reasons
+        ['StatusOfExistingCheckingAccount', 'DurationInMonth', 'Purpose']
+
+    """
+
+    def __init__(self, scorecard, n_reasons=3, batch_size=64):
+        self.scorecard = scorecard
+        self.n_reasons = n_reasons
+        self.batch_size = batch_size
+        self.base_points = scorecard.base_points.item()
+        self._lookups = []
+        self._best = []
+        for var in scorecard.variables:
+            points = scorecard.points[var].tolist()
+            if var in scorecard.levels:
+                levels = list(scorecard.levels[var])
+                lookup = (dict(zip(levels, points)), points[-2], points[-1])
+            else:
+                lookup = scorecard.cuts[var].tolist()
+            self._lookups.append((var, var in scorecard.levels, lookup, points))
+            self._best.append(max(points))
+
+    def score_record(self, record):
+        """Score a single record.
+
+        Parameters
+        ----------
+        record : dict
+            Values of the variables, missing ones may be absent, ``None`` or
+            NaN.
+
+        Returns
+        -------
+        score : number
+            The score.
+        reasons : list
+            Reason codes, the variables costing the most points.
+        """
+        score = self.base_points
+        losses = []
+        for i, ((var, categorical, lookup, points), best) in enumerate(
+            zip(self._lookups, self._best)
+        ):
+            x = record.get(var)
+            if categorical:
+                table, rare, missing = lookup
+                # NaN, as given by DataFrame.to_dict, is missing too
+                p = missing if x is None or x != x else table.get(x, rare)
+            elif x is None or x != x:
+                p = points[-1]
+            else:
+                p = points[bisect.bisect_left(lookup, x)]
+            score += p
+            if best > p:
+                # Ties go to the first variable, as in score_records
+                losses.append((best - p, -i, var))
+        reasons = [
+            var for _, _, var in heapq.nlargest(self.n_reasons, losses)
+        ]
+        return score, reasons
+
+    def score_records(self, records):
+        """Score a micro-batch of records.
+
+        Parameters
+        ----------
+        records : list of dict
+            The records.
+
+        Returns
+        -------
+        scores : list
+            The scores.
+        reasons : list
+            Reason codes of every record.
+        """
+        if len(records) < self.batch_size:
+            results = [self.score_record(record) for record in records]
+            return [s for s, _ in results], [r for _, r in results]
+        card = self.scorecard
+        points = np.column_stack([
+            card.variable_points(
+                var, [record.get(var, np.nan) for record in records]
+            )
+            for var in card.variables
+        ])
+        scores = self.base_points + points.sum(axis=1)
+        losses = np.asarray(self._best) - points
+        top = np.argsort(-losses, axis=1, kind="mergesort")[:, :self.n_reasons]
+        reasons = [
+            [card.variables[j] for j in row if losses[i, j] > 0]
+            for i, row in enumerate(top)
+        ]
+        return scores.tolist(), reasons
+
+
+async def _handle(engine, reader, writer):
+    """Answer newline-delimited JSON requests of a connection."""
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError as e:
+            writer.write(json.dumps({"error": str(e)}).encode() + b"\n")
+            break
+        if not line:
+            break
+        try:
+            request = json.loads(line)
+            if "records" in request:
+                scores, reasons = engine.score_records(request["records"])
+                response = {"scores": scores, "reasons": reasons}
+            else:
+                score, reasons = engine.score_record(request["record"])
+                response = {"score": score, "reasons": reasons}
+            if "id" in request:
+                response["id"] = request["id"]
+        except Exception as e:
+            # Any failure of a request, e.g. OverflowError of a huge integer,
+            # is answered without ending the connection
+            response = {"error": "{}: {}".format(type(e).__name__, e)}
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+    writer.close()
+
+
+def _load(scorecard):
+    if isinstance(scorecard, str):
+        return load_artifact(scorecard)
+    return scorecard
+
+
+async def start_server(
+    scorecard, path=None, host="127.0.0.1", port=8765, n_reasons=3
+):
+    """Start a scoring server in the running event loop.
+
+    The server speaks newline-delimited JSON. A request is either
+    ``{"record": {...}}``, answered with ``{"score": ..., "reasons": [...]}``,
+    or ``{"records": [...]}``, answered with ``{"scores": [...], "reasons":
+    [...]}``. An ``"id"`` of a request is sent back with its response and
+    invalid requests are answered with ``{"error": ...}``.
+
+    Parameters
+    ----------
+    scorecard : Scorecard or str
+        The score card, or the path of one saved by :func:`save_artifact`,
+        which is memory-mapped so that servers share its pages.
+    path : str, optional
+        Path of a Unix socket to listen on. Defaults to ``None``, meaning
+        listening on TCP.
+    host : str, optional
+        Host to listen on over TCP, by default "127.0.0.1"
+    port : int, optional
+        Port to listen on over TCP, by default 8765
+    n_reasons : int, optional
+        Number of reason codes per record, by default 3
+
+    Returns
+    -------
+    asyncio.AbstractServer
+        The started server.
+    """
+    engine = ScoringEngine(_load(scorecard), n_reasons=n_reasons)
+    handler = functools.partial(_handle, engine)
+    if path is not None:
+        return await asyncio.start_unix_server(
+            handler, path=path, limit=_LIMIT
+        )
+    return await asyncio.start_server(handler, host, port, limit=_LIMIT)
+
+
+def serve(scorecard, path=None, host="127.0.0.1", port=8765, n_reasons=3):
+    """Run a scoring server until interrupted.
+
+    See :func:`start_server` for the parameters and the protocol.
+    """
+
+    async def main():
+        server = await start_server(scorecard, path, host, port, n_reasons)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
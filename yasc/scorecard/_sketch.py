@@ -0,0 +1,249 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import itertools
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import is_numeric_dtype
+
+from ._bin import _check_duplicates, _mono_bin_table
+from ..exception import LabelCountError
+from ..scorecard.util._check import binary_labels
+
+
+__all__ = ["BinningSketch", "mono_bin_chunks"]
+
+
+class BinningSketch:
+    """Mergeable summary of a numeric column with bad and good counts.
+
+    The sketch keeps a sorted table of at most `max_size` buckets, each with
+    its minimum, maximum, total and bad counts. Distinct values are counted
+    exactly until there are more than `max_size` of them. Then adjacent
+    buckets are merged into buckets of about equal counts, so every bucket
+    but those made of a single value holds at most about
+    ``2 * count / max_size`` rows, which bounds the rank error of the
+    quantiles derived from the sketch. Memory stays bounded whatever the
+    number of rows.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of buckets to keep, by default 2000
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import BinningSketch
+        >>> from yasc.scorecard.util import check_target
+        >>> data = german_data()
+        >>> check_target(data.Creditability, inplace=True)
+        >>> sketch = BinningSketch()
+        >>> for chunk in (data[:500], data[500:]):
+        ...     sketch.update(chunk.DurationInMonth, chunk.Creditability)
+        >>> sketch.mono_bin().bins.iloc[0]
+        '[-inf, 12, 24, 72, inf]'
+
+    """
+
+    def __init__(self, max_size=2000):
+        self.max_size = max_size
+        self.values = None
+        self.mins = None
+        self.total = np.empty(0, dtype=np.int64)
+        self.bad = np.empty(0, dtype=np.int64)
+        self.missing_total = 0
+        self.missing_bad = 0
+
+    @property
+    def count(self):
+        """Number of rows seen, including missing values."""
+        return int(self.total.sum()) + self.missing_total
+
+    def update(self, X, Y):
+        """Add a chunk of values and labels to the sketch.
+
+        Parameters
+        ----------
+        X : Series or array
+            Values of the column.
+        Y : Series or array
+            Labels, either in ['bad', 'good'] or in [0, 1].
+
+        Returns
+        -------
+        BinningSketch
+            The sketch itself.
+        """
+        return self._update(X, binary_labels(Y).astype(np.int8))
+
+    def _update(self, X, y):
+        """Add a chunk of values and already validated labels `y` in
+        [0, 1]."""
+        x = np.asarray(X)
+        missing = pd.isnull(x)
+        self.missing_total += int(missing.sum())
+        self.missing_bad += int(y[missing].sum())
+        values, inverse = np.unique(x[~missing], return_inverse=True)
+        total = np.bincount(inverse, minlength=len(values))
+        bad = np.bincount(inverse, weights=y[~missing], minlength=len(values))
+        self._add(values, values, total, bad.astype(np.int64))
+        return self
+
+    def merge(self, other):
+        """Merge another sketch, e.g. of another shard, into this one.
+
+        Parameters
+        ----------
+        other : BinningSketch
+            The sketch to merge.
+
+        Returns
+        -------
+        BinningSketch
+            The sketch itself.
+        """
+        self.missing_total += other.missing_total
+        self.missing_bad += other.missing_bad
+        if other.values is not None:
+            self._add(other.values, other.mins, other.total, other.bad)
+        return self
+
+    def _add(self, values, mins, total, bad):
+        if self.values is not None:
+            values = np.concatenate([self.values, values])
+            mins = np.concatenate([self.mins, mins])
+            total = np.concatenate([self.total, total])
+            bad = np.concatenate([self.bad, bad])
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        if len(unique_values) < len(values):
+            unique_mins = unique_values.copy()
+            np.minimum.at(unique_mins, inverse, mins)
+            total = np.bincount(inverse, weights=total).astype(np.int64)
+            bad = np.bincount(inverse, weights=bad).astype(np.int64)
+            values, mins = unique_values, unique_mins
+        elif len(values):
+            order = np.argsort(values, kind="mergesort")
+            values, mins = values[order], mins[order]
+            total, bad = total[order], bad[order]
+        self.values, self.mins, self.total, self.bad = values, mins, total, bad
+        if len(self.values) > self.max_size:
+            self._compress()
+
+    def _compress(self):
+        """Merge adjacent buckets into about ``max_size / 2`` buckets."""
+        step = self.total.sum() / max(self.max_size // 2, 1)
+        group = np.floor((np.cumsum(self.total) - self.total) / step)
+        starts = np.flatnonzero(np.diff(group, prepend=-1) > 0)
+        ends = np.append(starts[1:], len(self.values)) - 1
+        self.mins = np.minimum.reduceat(self.mins, starts)
+        self.values = self.values[ends]
+        self.total = np.add.reduceat(self.total, starts)
+        self.bad = np.add.reduceat(self.bad, starts)
+
+    def mono_bin(self, n=20, precision=3, duplicates="drop"):
+        """Generate monotonous bins from the sketch.
+
+        Parameters
+        ----------
+        n : int or list-like of int, optional
+            Number of quantiles, by default 20
+        precision : int, optional
+            The precision at which to store and display the bins labels, by
+            default 3
+        duplicates : str, optional
+            Whether to raise or drop duplicate edges, by default "drop"
+
+        Returns
+        -------
+        DataFrame
+            Descriptive statistics of binning, as returned by
+            :func:`mono_bin`.
+
+        Raises
+        ------
+        LabelCountError
+            Raises when not both bad and good cases have been seen.
+        """
+        _check_duplicates(duplicates)
+        total_bad = int(self.bad.sum()) + self.missing_bad
+        total_good = self.count - total_bad
+        if total_bad == 0 or total_good == 0:
+            raise LabelCountError("unique count of labels expects to be 2")
+        return _mono_bin_table(
+            self.values,
+            self.total,
+            self.bad,
+            total_bad,
+            total_good,
+            n=n,
+            precision=precision,
+            duplicates=duplicates,
+            mins=self.mins,
+        )
+
+
+def mono_bin_chunks(
+    chunks, target, columns=None, n=20, precision=3, duplicates="drop",
+    max_size=2000,
+):
+    """Generate monotonous bins from data read chunk by chunk.
+
+    Every column is summarized by a :class:`BinningSketch`, so only one chunk
+    and the sketches are held in memory. Columns with at most `max_size`
+    distinct values are binned exactly as by :func:`mono_bin`, others
+    approximately.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        Chunks of observed data including the target column, e.g. returned
+        by :func:`pandas.read_csv` with `chunksize`.
+    target : str
+        Name of the target column.
+    columns : list, optional
+        Names of the columns to bin. Defaults to ``None``, meaning all numeric
+        columns but `target` of the first chunk.
+    n : int or list-like of int, optional
+        Number of quantiles, by default 20
+    precision : int, optional
+        The precision at which to store and display the bins labels, by
+        default 3
+    duplicates : str, optional
+        Whether to raise or drop duplicate edges, by default "drop"
+    max_size : int, optional
+        Maximum number of buckets of each sketch, by default 2000
+
+    Returns
+    -------
+    dict
+        A dictionary mapping each column to its statistics of binning.
+
+    Examples
+    --------
+
+        >>> import pandas as pd
+        >>> from yasc.scorecard import mono_bin_chunks
+        >>> chunks = pd.read_csv("german.csv", chunksize=100)
+        >>> bin_stats = mono_bin_chunks(chunks, "Creditability")
+
+    """
+    _check_duplicates(duplicates)
+    chunks = iter(chunks)
+    first = next(chunks)
+    if columns is None:
+        columns = [
+            col
+            for col in first.columns
+            if col != target and is_numeric_dtype(first[col].dtype)
+        ]
+    sketches = {col: BinningSketch(max_size) for col in columns}
+    for chunk in itertools.chain([first], chunks):
+        # Labels are validated once per chunk, not once per column
+        y = binary_labels(chunk[target]).astype(np.int8)
+        for col in columns:
+            sketches[col]._update(chunk[col], y)
+    return {
+        col: sketch.mono_bin(n=n, precision=precision, duplicates=duplicates)
+        for col, sketch in sketches.items()
+    }
@@ -0,0 +1,156 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import sqlite3
+
+import numpy as np
+
+
+__all__ = ["scorecard_sql", "verify_sql"]
+
+
+def _identifier(name):
+    return '"{}"'.format(str(name).replace('"', '""'))
+
+
+def _literal(value):
+    if isinstance(value, str):
+        return "'{}'".format(value.replace("'", "''"))
+    if isinstance(value, (bool, np.bool_)):
+        return str(int(value))
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    # 17 significant digits, shortest representations are not parsed back
+    # exactly by every database, e.g. SQLite 3.40
+    return "%.17g" % value
+
+
+def _variable_sql(scorecard, var):
+    """Return a CASE expression of the points of variable `var`."""
+    column = _identifier(var)
+    points = scorecard.points[var]
+    if not np.isfinite(points).all():
+        # Infinite WOE of a bin of bad or good cases only has no literal
+        raise ValueError(
+            "points of variable {!r} are not finite".format(var)
+        )
+    whens = ["WHEN {} IS NULL THEN {}".format(column, _literal(points[-1]))]
+    if var in scorecard.levels:
+        # Levels of the same points are grouped, the rest are rare or unseen
+        groups = {}
+        for level, p in zip(scorecard.levels[var], points[:-2]):
+            groups.setdefault(p, []).append(_literal(level))
+        for p, levels in groups.items():
+            whens.append(
+                "WHEN {} IN ({}) THEN {}".format(
+                    column, ", ".join(levels), _literal(p)
+                )
+            )
+    else:
+        # Bucket i holds values x with cuts[i - 1] < x <= cuts[i]
+        for cut, p in zip(scorecard.cuts[var][:-1], points[:-2]):
+            whens.append(
+                "WHEN {} <= {} THEN {}".format(
+                    column, _literal(cut), _literal(p)
+                )
+            )
+    default = _literal(points[-2])
+    return "CASE {} ELSE {} END".format(" ".join(whens), default)
+
+
+def scorecard_sql(scorecard, table=None, name="score", view=None):
+    """Generate SQL scoring with a score card.
+
+    Every variable is scored with a ``CASE WHEN`` expression comparing the
+    column to the cut points of its bins, or matching it against the levels
+    of a categorical variable, so that scoring runs in the database. Missing
+    values are ``NULL``. Numeric columns must be stored as numbers, points
+    are written with 17 significant digits to be parsed back exactly.
+
+    Parameters
+    ----------
+    scorecard : Scorecard
+        The score card.
+    table : str, optional
+        Table to score. Defaults to ``None``, meaning only the scoring
+        expression is returned.
+    name : str, optional
+        Name of the score column, by default "score"
+    view : str, optional
+        If given, a statement creating a view of that name is returned.
+
+    Returns
+    -------
+    str
+        The scoring expression, a ``SELECT`` statement scoring `table` or a
+        ``CREATE VIEW`` statement.
+
+    Raises
+    ------
+    ValueError
+        Raises when points of a variable are not finite, which SQL cannot
+        represent.
+
+    Examples
+    --------
+
+        >>> print(scorecard_sql(card, "applications"))
+        SELECT *, (512
+            + CASE WHEN "DurationInMonth" IS NULL THEN 0 WHEN ... END
+            + CASE WHEN "AgeInYears" ... END) AS "score" FROM "applications"
+
+    """
+    terms = [_literal(scorecard.base_points)]
+    terms += [_variable_sql(scorecard, var) for var in scorecard.variables]
+    expr = "({})".format("\n    + ".join(terms))
+    if table is None:
+        return expr
+    sql = "SELECT *, {} AS {} FROM {}".format(
+        expr, _identifier(name), _identifier(table)
+    )
+    if view is not None:
+        sql = "CREATE VIEW {} AS {}".format(_identifier(view), sql)
+    return sql
+
+
+def verify_sql(scorecard, X):
+    """Check the SQL of a score card against :meth:`Scorecard.score`.
+
+    Data are scored in an in-memory SQLite database with the SQL of
+    :func:`scorecard_sql` and with the score card.
+
+    Parameters
+    ----------
+    scorecard : Scorecard
+        The score card.
+    X : DataFrame
+        Data including all the variables.
+
+    Returns
+    -------
+    ndarray
+        Scores of the rows of `X` in SQLite.
+
+    Raises
+    ------
+    AssertionError
+        If SQLite scores differ from the ones of the score card. They must
+        be identical, but for float types narrower than float64, which
+        SQLite does not have, they are compared within rounding errors.
+    """
+    with sqlite3.connect(":memory:") as con:
+        X[scorecard.variables].to_sql("data", con, index=False)
+        rows = con.execute(
+            "SELECT {} FROM data ORDER BY rowid".format(
+                scorecard_sql(scorecard)
+            )
+        ).fetchall()
+    con.close()
+    expected = scorecard.score(X)
+    actual = np.array([row[0] for row in rows]).astype(scorecard.dtype)
+    if scorecard.dtype.kind == "f" and scorecard.dtype.itemsize < 8:
+        eps = np.finfo(scorecard.dtype).eps
+        np.testing.assert_allclose(
+            actual, expected, rtol=eps * (len(scorecard.variables) + 1)
+        )
+    else:
+        np.testing.assert_array_equal(actual, expected)
+    return actual
@@ -0,0 +1,247 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import pandas as pd
+import numpy as np
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+)
+
+from ._bin import _bin_columns, _check_duplicates
+from ._categorical import CategoricalBinning
+from ..scorecard.util._check import check_target
+
+
+__all__ = ["WoeTransformer"]
+
+
+def _compile_bin_stat(bin_stat, dtype=np.float64):
+    """Compile a binning result into cut points and WOE values.
+
+    Bucket ``i`` holds values ``x`` with ``cuts[i - 1] < x <= cuts[i]``, where
+    the cut points are the maximums of the buckets, as in the `bins` column
+    of :func:`mono_bin`. The first and last buckets are open-ended.
+    """
+    bin_stat = bin_stat[bin_stat["total"] > 0]
+    cuts = np.asarray(bin_stat["max"], dtype=np.float64)[:-1]
+    woe = np.asarray(bin_stat["woe"], dtype=dtype)
+    return np.ascontiguousarray(cuts), np.ascontiguousarray(woe)
+
+
+class WoeTransformer:
+    """Transform columns into their weight of evidence (WOE).
+
+    Numeric columns are binned with :func:`mono_bin` when fitting. Only the
+    cut points and WOE values of every column are kept, as compact arrays, so
+    that transforming is a binary search of the cut points followed by a
+    gather of WOE values, column by column. Other columns are binned with
+    :class:`CategoricalBinning`, whose WOE values are gathered by level code.
+
+    Parameters
+    ----------
+    columns : list, optional
+        Names of the columns to transform. Defaults to ``None``, meaning all
+        numeric, object and categorical columns of the data passed to
+        :meth:`fit`.
+    n : int, optional
+        Passed to :func:`mono_bin`, by default 20
+    precision : int, optional
+        Passed to :func:`mono_bin`, by default 3
+    duplicates : str, optional
+        Passed to :func:`mono_bin`, by default "drop"
+    dtype : dtype, optional
+        Data type of the WOE values, by default ``np.float64``. Use
+        ``np.float32`` to halve the memory of the output.
+    fill_value : float, optional
+        WOE of missing values, by default 0.0
+    n_jobs : int, optional
+        Number of processes used for fitting, see :func:`mono_bin_frame`.
+        Defaults to ``None``, meaning 1.
+
+    Attributes
+    ----------
+    bin_stats_ : dict
+        Statistics of binning of each column, as returned by :func:`mono_bin`.
+    cuts_ : dict
+        Cut points of the buckets of each column.
+    woe_ : dict
+        WOE values of the buckets of each numeric column.
+    categorical_ : dict
+        Binning of each non-numeric column.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import WoeTransformer
+        >>> data = german_data()
+        >>> X = data[["DurationInMonth", "AgeInYears"]]
+        >>> woe = WoeTransformer().fit(X, data.Creditability)
+        >>> woe.transform(X).head(3)
+           DurationInMonth  AgeInYears
+        0        -0.467416   -0.185717
+        1         0.620240    0.294733
+        2        -0.467416   -0.185717
+
+    """
+
+    def __init__(
+        self,
+        columns=None,
+        n=20,
+        precision=3,
+        duplicates="drop",
+        dtype=np.float64,
+        fill_value=0.0,
+        n_jobs=None,
+    ):
+        self.columns = columns
+        self.n = n
+        self.precision = precision
+        self.duplicates = duplicates
+        self.dtype = dtype
+        self.fill_value = fill_value
+        self.n_jobs = n_jobs
+
+    @classmethod
+    def from_bin_stats(cls, bin_stats, **kwargs):
+        """Create a fitted transformer from existing binning results.
+
+        Parameters
+        ----------
+        bin_stats : dict
+            A dictionary mapping column names to data frames returned by
+            :func:`mono_bin`.
+        kwargs : Keyword arguments
+            Other arguments passed to :class:`WoeTransformer`.
+
+        Returns
+        -------
+        WoeTransformer
+            The fitted transformer.
+        """
+        transformer = cls(columns=list(bin_stats), **kwargs)
+        transformer._compile(bin_stats)
+        return transformer
+
+    def _compile(self, bin_stats, categorical=None):
+        self.bin_stats_ = dict(bin_stats)
+        self.categorical_ = {} if categorical is None else categorical
+        self.cuts_ = {}
+        self.woe_ = {}
+        for col, bin_stat in self.bin_stats_.items():
+            if col not in self.categorical_:
+                self.cuts_[col], self.woe_[col] = _compile_bin_stat(
+                    bin_stat, dtype=self.dtype
+                )
+
+    def fit(self, X, y):
+        """Bin the columns of `X` and compute their WOE.
+
+        Parameters
+        ----------
+        X : DataFrame
+            Observed data.
+        y : Series
+            Labels, see :func:`check_target`.
+
+        Returns
+        -------
+        WoeTransformer
+            The fitted transformer itself.
+        """
+        _check_duplicates(self.duplicates)
+        Y = pd.Series(y).copy()
+        check_target(Y, inplace=True)
+        total_bad = Y.sum()
+        total_good = Y.count() - total_bad
+        columns = self.columns
+        if columns is None:
+            columns = [
+                col
+                for col in X.columns
+                if is_numeric_dtype(X[col].dtype)
+                or is_object_dtype(X[col].dtype)
+                or is_categorical_dtype(X[col].dtype)
+            ]
+        numeric_columns = [
+            col for col in columns if is_numeric_dtype(X[col].dtype)
+        ]
+        categorical = {
+            col: CategoricalBinning(Y, X[col])
+            for col in columns
+            if col not in numeric_columns
+        }
+        kwargs = {
+            "n": self.n,
+            "precision": self.precision,
+            "duplicates": self.duplicates,
+        }
+        bin_stats, _ = _bin_columns(
+            X,
+            numeric_columns,
+            np.asarray(Y, dtype=np.int8),
+            total_bad,
+            total_good,
+            self.n_jobs,
+            kwargs,
+        )
+        for col, binning in categorical.items():
+            bin_stats[col] = binning.bin_stat()
+        self._compile(
+            {col: bin_stats[col] for col in columns}, categorical=categorical
+        )
+        return self
+
+    def transform_column(self, column, x):
+        """Map values of a single column to their WOE.
+
+        Parameters
+        ----------
+        column : str
+            Name of a fitted column.
+        x : array-like
+            Values to transform.
+
+        Returns
+        -------
+        ndarray
+            WOE values of `x`.
+        """
+        if column in self.categorical_:
+            return self.categorical_[column].transform(
+                x, fill_value=self.fill_value, dtype=self.dtype
+            )
+        x = np.asarray(x, dtype=np.float64)
+        woe = self.woe_[column].take(
+            np.searchsorted(self.cuts_[column], x, side="left")
+        )
+        missing = np.isnan(x)
+        if missing.any():
+            woe[missing] = self.fill_value
+        return woe
+
+    def transform(self, X):
+        """Transform the fitted columns of `X` into their WOE.
+
+        Parameters
+        ----------
+        X : DataFrame
+            Data including all the fitted columns.
+
+        Returns
+        -------
+        DataFrame
+            WOE of the fitted columns, indexed like `X`.
+        """
+        return pd.DataFrame(
+            {
+                col: self.transform_column(col, X[col])
+                for col in self.bin_stats_
+            },
+            index=X.index,
+        )
+
+    def fit_transform(self, X, y):
+        """Fit to `X` and `y`, then transform `X`."""
+        return self.fit(X, y).transform(X)
@@ -1,3 +1,39 @@
 # Author: Liqiang Du
+import importlib
+
+from ._bootstrap import bootstrap_iv, bootstrap_metrics
 from ._check import check_target
-from ._plot import rocplot, ksplot, woebinplot
\ No newline at end of file
+from ._metrics import MetricAccumulator, compare_models, segment_metrics
+
+# Plotting pulls in matplotlib and scikit-learn, so its modules are only
+# imported when one of their functions is first used (PEP 562).
+_LAZY = {
+    "rocplot": "._plot",
+    "ksplot": "._plot",
+    "woebinplot": "._plot",
+    "plot_report": "._report",
+}
+
+__all__ = [
+    "bootstrap_iv",
+    "bootstrap_metrics",
+    "check_target",
+    "MetricAccumulator",
+    "compare_models",
+    "segment_metrics",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,233 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import numpy as np
+
+from ._check import binary_labels
+from ._metrics import _ks_auc, _runs
+from ._parallel import effective_n_jobs, load_shared, shared_array
+
+
+__all__ = ["bootstrap_metrics", "bootstrap_iv"]
+
+# Replicates drawn per task, fixed so that results do not depend on n_jobs
+_CHUNK_SIZE = 50
+
+_counts = None  # Counts shared with worker processes of _bootstrap
+
+
+def _ks_auc_gini(bad, good):
+    _, _, ks, auc = _ks_auc(bad, good)
+    return ks, auc, 2 * auc - 1
+
+
+def _iv(bad, good):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bad_rate = bad / bad.sum()
+        good_rate = good / good.sum()
+        iv = (bad_rate - good_rate) * np.log(bad_rate / good_rate)
+    return (np.where(bad + good > 0, iv, 0).sum(),)
+
+
+_STATISTICS = {"metrics": _ks_auc_gini, "iv": _iv}
+
+
+def _init_worker(path):
+    global _counts
+    _counts = load_shared(path)
+
+
+def _replicates(statistic, seed, size, counts=None):
+    """Compute `statistic` of `size` bootstrap replicates of `counts`.
+
+    Resampling rows with replacement makes the counts of bad and good cases
+    of every cell, i.e. run of equal scores or bucket, multinomial, so that
+    a replicate is drawn in a time linear in the number of cells rather
+    than of rows. With about as many cells as rows, drawing rows and
+    counting them by cell is faster and draws the same counts.
+    """
+    if counts is None:
+        counts = _counts
+    rng = np.random.default_rng(seed)
+    n = int(counts.sum())
+    n_cells = counts.shape[1]
+    # Only nonempty cells are drawn, e.g. half of them for distinct scores
+    nonempty = np.flatnonzero(counts.ravel())
+    pvals = counts.ravel()[nonempty] / n
+    func = _STATISTICS[statistic]
+    draw = np.zeros(2 * n_cells, dtype=np.int64)
+    rows = None
+    if 4 * len(nonempty) > n:
+        rows = np.repeat(nonempty, counts.ravel()[nonempty])
+    results = []
+    for _ in range(size):
+        if rows is None:
+            draw[nonempty] = rng.multinomial(n, pvals)
+        else:
+            sample = rows[rng.integers(0, n, n)]
+            draw = np.bincount(sample, minlength=2 * n_cells)
+        results.append(func(draw[:n_cells], draw[n_cells:]))
+    return np.array(results, dtype=np.float64)
+
+
+def _bootstrap(statistic, counts, names, n_boot, alpha, n_jobs, random_state):
+    """Bootstrap a statistic of bad and good counts of cells."""
+    counts = np.ascontiguousarray(counts, dtype=np.int64)
+    sizes = [_CHUNK_SIZE] * (n_boot // _CHUNK_SIZE)
+    if n_boot % _CHUNK_SIZE:
+        sizes.append(n_boot % _CHUNK_SIZE)
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    n_jobs = effective_n_jobs(n_jobs, len(sizes))
+    if n_jobs == 1:
+        chunks = [
+            _replicates(statistic, seed, size, counts)
+            for seed, size in zip(seeds, sizes)
+        ]
+    else:
+        with shared_array(counts) as path, ProcessPoolExecutor(
+            n_jobs, initializer=_init_worker, initargs=(path,)
+        ) as executor:
+            chunks = list(
+                executor.map(
+                    _replicates, [statistic] * len(sizes), seeds, sizes
+                )
+            )
+    replicates = np.concatenate(chunks)
+    # Non-finite replicates, e.g. infinite IVs, are left out and counted
+    finite = np.isfinite(replicates)
+    replicates = np.where(finite, replicates, np.nan)
+    estimate = _STATISTICS[statistic](counts[0], counts[1])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pd.DataFrame(
+            {
+                "estimate": estimate,
+                "lower": np.nanpercentile(
+                    replicates, 100 * alpha / 2, axis=0
+                ),
+                "upper": np.nanpercentile(
+                    replicates, 100 * (1 - alpha / 2), axis=0
+                ),
+                "std": np.nanstd(replicates, axis=0, ddof=1),
+                "n_dropped": (~finite).sum(axis=0),
+            },
+            index=names,
+        )
+
+
+def bootstrap_metrics(
+    preds,
+    labels,
+    n_boot=1000,
+    alpha=0.05,
+    ascending=False,
+    n_jobs=None,
+    random_state=None,
+):
+    """Bootstrap confidence intervals of KS, AUC and Gini.
+
+    Predictions are sorted only once. Every replicate then draws how many
+    times each row is resampled, which amounts to multinomial bad and good
+    counts of every run of equal predictions, and computes the metrics with
+    cumulative sums of those counts, without resampling any data frame.
+    Replicates are computed in chunks on a pool of processes, each chunk
+    with its own seed spawned from `random_state`, so that results are the
+    same whatever the number of jobs.
+
+    Parameters
+    ----------
+    preds : array, shape=[n_samples]
+        Predicted values, either scores or probabilities.
+    labels : array, shape=[n_samples]
+        Labels, either in ['bad', 'good'] or in [0, 1].
+    n_boot : int, optional
+        Number of bootstrap replicates, by default 1000
+    alpha : float, optional
+        The intervals are ``1 - alpha`` percentile intervals, by default
+        0.05
+    ascending : bool, optional
+        Whether low predictions are the riskiest, as for points of a score
+        card, by default False, as for probabilities of being bad.
+    n_jobs : int, optional
+        Number of processes, as in :func:`mono_bin_frame`, by default
+        ``None`` meaning 1.
+    random_state : int, optional
+        Seed of the replicates. Defaults to ``None``, meaning a fresh seed.
+
+    Returns
+    -------
+    DataFrame
+        ``estimate``, ``lower`` and ``upper`` bounds and ``std`` of ``ks``,
+        ``auc`` and ``gini``, and the number ``n_dropped`` of replicates
+        left out because a metric is not finite, e.g. when a replicate has
+        no bad cases.
+
+    Examples
+    --------
+
+        >>> import numpy as np
+        >>> from yasc.scorecard.util import bootstrap_metrics
+        >>> rng = np.random.RandomState(0)
+        >>> labels = rng.randint(0, 2, 1000)
+        >>> preds = labels + rng.randn(1000)
+        >>> bootstrap_metrics(preds, labels, random_state=0).round(3)
+              estimate  lower  upper    std  n_dropped
+        ks       0.470  0.426  0.526  0.026          0
+        auc      0.796  0.769  0.820  0.013          0
+        gini     0.591  0.538  0.641  0.027          0
+
+    """
+    preds = np.asarray(preds, dtype=np.float64)
+    y = binary_labels(labels).astype(np.int64)
+    _, run_bad, run_good = _runs(preds if ascending else -preds, y)
+    return _bootstrap(
+        "metrics",
+        [run_bad, run_good],
+        ["ks", "auc", "gini"],
+        n_boot,
+        alpha,
+        n_jobs,
+        random_state,
+    )
+
+
+def bootstrap_iv(
+    bin_stat, n_boot=1000, alpha=0.05, n_jobs=None, random_state=None
+):
+    """Bootstrap a confidence interval of the IV of a binning.
+
+    The bins are kept as they are, only bad and good counts of buckets are
+    resampled, see :func:`bootstrap_metrics`. A replicate leaving a bucket
+    without bad or without good cases has an infinite IV: such replicates
+    are left out of the bounds and of the standard deviation, and counted
+    in ``n_dropped``. Many of them mean that buckets are too small for the
+    interval to be trusted.
+
+    Parameters
+    ----------
+    bin_stat : DataFrame
+        Statistics of binning, as returned by :func:`mono_bin`.
+    n_boot : int, optional
+        Number of bootstrap replicates, by default 1000
+    alpha : float, optional
+        The interval is a ``1 - alpha`` percentile interval, by default 0.05
+    n_jobs : int, optional
+        Number of processes, by default ``None`` meaning 1.
+    random_state : int, optional
+        Seed of the replicates. Defaults to ``None``, meaning a fresh seed.
+
+    Returns
+    -------
+    DataFrame
+        ``estimate``, ``lower`` and ``upper`` bounds and ``std`` of ``iv``,
+        and the number ``n_dropped`` of infinite replicates left out.
+    """
+    return _bootstrap(
+        "iv",
+        [bin_stat["bad_count"].values, bin_stat["good_count"].values],
+        ["iv"],
+        n_boot,
+        alpha,
+        n_jobs,
+        random_state,
+    )
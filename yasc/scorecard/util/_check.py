@@ -1,4 +1,7 @@
 # Author: Liqiang Du <keris.du@gmail.com>
+import numpy as np
+import pandas as pd
+
 from ...exception import LabelCountError, LabelValueError
 
 
@@ -100,3 +103,35 @@ def check_target(Y, inplace=False):
         return Y.replace({"bad": 1, "good": 0}, inplace=inplace)
     else:
         return None  # Y is already valid
+
+
+def binary_labels(Y):
+    """Convert a chunk of labels into an array of 0 and 1.
+
+    Unlike :func:`check_target`, a chunk may contain only one of the labels,
+    as when the target is read piece by piece.
+
+    Parameters
+    ----------
+    Y : Series or array
+        Labels, either in ['bad', 'good'] or in [0, 1].
+
+    Returns
+    -------
+    ndarray
+        An array of dtype int8 with 1 for bad cases and 0 for good cases.
+
+    Raises
+    ------
+    LabelValueError
+        Raises when label values are not valid.
+    """
+    Y = pd.Series(np.asarray(Y))
+    label_values = set(Y.unique())
+    if label_values <= {"bad", "good"}:
+        return Y.map({"bad": 1, "good": 0}).to_numpy(dtype=np.int8)
+    if label_values <= {0, 1}:
+        return Y.to_numpy(dtype=np.int8)
+    raise LabelValueError(
+        "label values are either in ['bad', 'good'] or in [0, 1]"
+    )
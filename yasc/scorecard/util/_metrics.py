@@ -0,0 +1,554 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import numpy as np
+
+from ._check import binary_labels
+from ._parallel import effective_n_jobs
+from ._util import (
+    _decimate,
+    _ks_lift_table,
+    _stable_argsort,
+    _ties,
+    _tile_ids,
+)
+
+
+__all__ = ["MetricAccumulator", "segment_metrics", "compare_models"]
+
+
+class MetricAccumulator:
+    """Mergeable accumulator of KS, AUC and lift of scores and labels.
+
+    Chunks of scores and labels are counted into a histogram of bad and good
+    cases by score, so that metrics of billions of rows spread over shards
+    are computed in bounded memory. Accumulators of shards merge into one.
+
+    With ``integer=True``, scores must be integers, e.g. points of a score
+    card, and are counted exactly, one bin per score, so that metrics are
+    exact, ties counting half in the AUC. Otherwise scores are counted in
+    `bins` bins of equal width over `range`, scores out of `range` falling
+    into the first or last bin, and :meth:`error_bounds` bounds the error of
+    metrics due to the binning. Missing scores are counted apart.
+
+    Parameters
+    ----------
+    bins : int, optional
+        Number of bins of the histogram, by default 1000
+    range : tuple, optional
+        Lower and upper bounds of the histogram, by default (0.0, 1.0)
+    integer : bool, optional
+        Whether to count integer scores exactly, by default False
+    ascending : bool, optional
+        Whether low scores are the riskiest, as for points of a score card,
+        by default False, as for probabilities of being bad.
+
+    Attributes
+    ----------
+    bad : ndarray
+        Bad counts of bins, in increasing order of scores.
+    good : ndarray
+        Good counts of bins.
+    missing_bad : int
+        Bad count of missing scores.
+    missing_good : int
+        Good count of missing scores.
+
+    Examples
+    --------
+
+        >>> import numpy as np
+        >>> from yasc.scorecard.util import MetricAccumulator
+        >>> rng = np.random.RandomState(0)
+        >>> preds = rng.rand(10000)
+        >>> labels = (rng.rand(10000) < preds).astype(int)
+        >>> acc = MetricAccumulator()
+        >>> for start in range(0, 10000, 2500):
+        ...     stop = start + 2500
+        ...     acc.update(preds[start:stop], labels[start:stop])
+        >>> round(acc.auc(), 4)
+        0.8325
+
+    """
+
+    def __init__(
+        self, bins=1000, range=(0.0, 1.0), integer=False, ascending=False
+    ):
+        self.integer = integer
+        self.ascending = ascending
+        if integer:
+            self.offset = 0
+            self.edges = None
+            size = 0
+        else:
+            self.offset = None
+            self.edges = np.linspace(range[0], range[1], bins + 1)
+            size = bins
+        self.bad = np.zeros(size, dtype=np.int64)
+        self.good = np.zeros(size, dtype=np.int64)
+        self.missing_bad = 0
+        self.missing_good = 0
+
+    @property
+    def count(self):
+        """Number of cases counted, including missing scores."""
+        return int(
+            self.bad.sum() + self.good.sum()
+            + self.missing_bad + self.missing_good
+        )
+
+    def _bin(self, scores):
+        if self.integer:
+            bins = scores.astype(np.int64)
+            if (bins != scores).any():
+                raise ValueError("Scores must be integers with integer=True.")
+            if len(bins):
+                self._grow(bins.min(), bins.max())
+            return bins - self.offset
+        lo, hi = self.edges[0], self.edges[-1]
+        bins = np.floor((scores - lo) * (len(self.bad) / (hi - lo)))
+        return np.clip(bins, 0, len(self.bad) - 1).astype(np.int64)
+
+    def _grow(self, lo, hi):
+        """Extend bins of integer scores to cover scores `lo` to `hi`."""
+        if not len(self.bad):
+            self.offset = lo
+        before = max(self.offset - lo, 0)
+        after = max(hi - (self.offset + len(self.bad) - 1), 0)
+        if before or after:
+            self.bad = np.pad(self.bad, (before, after))
+            self.good = np.pad(self.good, (before, after))
+            self.offset -= before
+
+    def update(self, scores, labels):
+        """Add a chunk of scores and labels.
+
+        Parameters
+        ----------
+        scores : array
+            Scores or predicted probabilities.
+        labels : array
+            Labels, either in ['bad', 'good'] or in [0, 1].
+
+        Returns
+        -------
+        MetricAccumulator
+            The accumulator itself.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        y = binary_labels(labels)
+        missing = np.isnan(scores)
+        n_bad = int(y[missing].sum())
+        self.missing_bad += n_bad
+        self.missing_good += int(missing.sum()) - n_bad
+        y = y[~missing]
+        bins = self._bin(scores[~missing])
+        bad = np.bincount(bins, weights=y, minlength=len(self.bad))
+        total = np.bincount(bins, minlength=len(self.bad))
+        self.bad += bad.astype(np.int64)
+        self.good += total - bad.astype(np.int64)
+        return self
+
+    def merge(self, other):
+        """Merge another accumulator, e.g. of another shard, into this one.
+
+        Parameters
+        ----------
+        other : MetricAccumulator
+            The accumulator to merge, with the same bins.
+
+        Returns
+        -------
+        MetricAccumulator
+            The accumulator itself.
+
+        Raises
+        ------
+        ValueError
+            Raises when bins of the accumulators differ.
+        """
+        if self.integer != other.integer or (
+            not self.integer and not np.array_equal(self.edges, other.edges)
+        ):
+            raise ValueError("Cannot merge accumulators of different bins.")
+        if self.integer and len(other.bad):
+            self._grow(other.offset, other.offset + len(other.bad) - 1)
+            start = other.offset - self.offset
+            self.bad[start : start + len(other.bad)] += other.bad
+            self.good[start : start + len(other.good)] += other.good
+        elif not self.integer:
+            self.bad += other.bad
+            self.good += other.good
+        self.missing_bad += other.missing_bad
+        self.missing_good += other.missing_good
+        return self
+
+    def _ordered(self):
+        """Return bad and good counts of nonempty bins, riskiest first."""
+        nonempty = (self.bad + self.good) > 0
+        bad, good = self.bad[nonempty], self.good[nonempty]
+        if not self.ascending:
+            bad, good = bad[::-1], good[::-1]
+        return bad, good
+
+    def roc_curve(self):
+        """Compute points of the ROC curve at bin boundaries.
+
+        Returns
+        -------
+        fpr : ndarray
+            False positive rates, i.e. cumulative shares of good cases.
+        tpr : ndarray
+            True positive rates, i.e. cumulative shares of bad cases.
+        thresholds : ndarray
+            Scores from which cases are predicted bad, lower bounds of
+            bins, or upper bounds if `ascending`.
+        """
+        nonempty = (self.bad + self.good) > 0
+        if self.integer:
+            thresholds = np.arange(len(self.bad)) + float(self.offset)
+        elif self.ascending:
+            thresholds = self.edges[1:]
+        else:
+            thresholds = self.edges[:-1]
+        thresholds = thresholds[nonempty]
+        if not self.ascending:
+            thresholds = thresholds[::-1]
+        bad, good = self._ordered()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fpr = np.append(0, np.cumsum(good)) / good.sum()
+            tpr = np.append(0, np.cumsum(bad)) / bad.sum()
+        return fpr, tpr, thresholds
+
+    def auc(self):
+        """Area under the ROC curve.
+
+        Returns
+        -------
+        float
+            The probability that a bad case is ranked riskier than a good
+            case, cases of the same bin counting half.
+        """
+        fpr, tpr, _ = self.roc_curve()
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    def gini(self):
+        """Gini coefficient, i.e. ``2 * auc - 1``."""
+        return 2 * self.auc() - 1
+
+    def ks(self):
+        """KS statistics, the maximum distance between cumulative shares
+        of bad and good cases."""
+        fpr, tpr, _ = self.roc_curve()
+        return float(np.max(np.abs(tpr - fpr)))
+
+    def error_bounds(self):
+        """Bound errors of metrics due to binning scores.
+
+        KS is the maximum over thresholds between bins, so the KS of the
+        scores is at least :meth:`ks` and at most that plus the largest share
+        of bad or good cases of a bin. The AUC counts half of pairs of a bad
+        and a good case of the same bin, so the AUC of the scores differs by
+        at most half the share of such pairs. Metrics of integer scores are
+        exact.
+
+        Returns
+        -------
+        dict
+            Maximum absolute errors of ``ks``, ``auc`` and ``gini``.
+        """
+        if self.integer:
+            return {"ks": 0.0, "auc": 0.0, "gini": 0.0}
+        n_bad, n_good = self.bad.sum(), self.good.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ks = max(np.max(self.bad / n_bad), np.max(self.good / n_good))
+            auc = 0.5 * np.sum(self.bad * self.good) / (n_bad * n_good)
+        return {"ks": float(ks), "auc": float(auc), "gini": float(2 * auc)}
+
+    def lift_table(self, tile_num=10):
+        """Compute KS and lift by tiles, as :func:`compute_ks_lift`.
+
+        Bins are never split, so tiles are made of whole bins, as with
+        ``tie_aware=True``.
+
+        Parameters
+        ----------
+        tile_num : int, optional
+            Number of tiles, by default 10
+
+        Returns
+        -------
+        DataFrame
+            Statistics of every nonempty tile, after a first row of zeros.
+        """
+        bad, good = self._ordered()
+        total = bad + good
+        tiles = _tile_ids(np.cumsum(total), tile_num)
+        return _ks_lift_table(
+            tiles, good, bad, tile_num, total=total, share=True
+        )
+
+
+def segment_metrics(preds, labels, by, ascending=False, top=0.1):
+    """Compute KS, AUC and lift of predictions of every segment in one pass.
+
+    Rows are sorted once by segment then prediction, with a radix sort of
+    segment codes. Cumulative bad and good counts of segments are then taken
+    at the ends of runs of equal predictions, found with vectorized group
+    boundaries, so that the time grows linearly with the number of rows
+    whatever the number of segments. Equal predictions are never split, so
+    that metrics are the ones of :func:`sklearn.metrics.roc_curve`, ties
+    counting half in the AUC. Missing predictions are ranked last.
+
+    Parameters
+    ----------
+    preds : array, shape=[n_samples]
+        Predicted values, either scores or probabilities.
+    labels : array, shape=[n_samples]
+        Labels, either in ['bad', 'good'] or in [0, 1].
+    by : array, list of arrays or DataFrame
+        Segments of the rows, e.g. months, channels and products as columns
+        of a data frame.
+    ascending : bool, optional
+        Whether low predictions are the riskiest, as for points of a score
+        card, by default False, as for probabilities of being bad.
+    top : float, optional
+        Share of the riskiest rows of a segment to compute the lift of, by
+        default 0.1
+
+    Returns
+    -------
+    DataFrame
+        Metrics indexed by segment: ``total``, ``bad``, ``bad_rate``,
+        ``ks``, ``auc``, ``gini`` and ``lift``, i.e. the bad rate of the
+        `top` riskiest rows over the one of the segment.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard.util import segment_metrics
+        >>> data = german_data()
+        >>> segment_metrics(
+        ...     data.DurationInMonth, data.Creditability, data.Housing
+        ... )[["total", "ks", "auc"]].round(3)
+                  total     ks    auc
+        Housing
+        for free    108  0.188  0.578
+        own         713  0.174  0.616
+        rent        179  0.306  0.699
+
+    """
+    preds = np.asarray(preds, dtype=np.float64)
+    y = binary_labels(labels).astype(np.int64)
+    n = len(preds)
+    if isinstance(by, pd.DataFrame):
+        by = by.reset_index(drop=True)
+    else:
+        if not isinstance(by, list):
+            by = [by]
+        names = [getattr(b, "name", None) for b in by]
+        if None in names or len(set(names)) < len(names):
+            names = range(len(by))
+        by = pd.DataFrame({k: np.asarray(b) for k, b in zip(names, by)})
+    groups = by.groupby(list(by.columns), sort=True, dropna=False)
+    codes = groups.ngroup().to_numpy()
+    index = groups.size().index
+    n_groups = len(index)
+
+    # Sort by prediction, riskiest first, then by segment with a radix sort
+    keys = preds if ascending else -preds
+    order = _stable_argsort(keys)
+    codes = codes.astype(np.min_scalar_type(n_groups))[order]
+    seg_order = np.argsort(codes, kind="stable")
+    order = order[seg_order]
+    codes, keys, y = codes[seg_order], keys[order], y[order]
+
+    total = np.bincount(codes, minlength=n_groups)
+    bad = np.bincount(codes, weights=y, minlength=n_groups)
+    good = total - bad
+    start = np.cumsum(total) - total
+    cum_bad = np.cumsum(y)
+    cum_good = np.arange(1, n + 1) - cum_bad
+
+    # Ends of runs of equal predictions of a segment
+    same = _ties(keys) & (codes[1:] == codes[:-1])
+    ends = np.flatnonzero(np.append(~same, True))
+    seg = codes[ends].astype(np.int64)
+    run_bad = np.diff(cum_bad[ends], prepend=0)
+    run_good = np.diff(cum_good[ends], prepend=0)
+    # Cumulative counts within segments
+    seg_bad = cum_bad[ends] - (cum_bad[start] - y[start])[seg]
+    seg_good = cum_good[ends] - (cum_good[start] - 1 + y[start])[seg]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff = np.abs(seg_bad / bad[seg] - seg_good / good[seg])
+        ks = np.zeros(n_groups)
+        np.maximum.at(ks, seg, diff)
+        # Bad cases are riskier than good cases of later runs
+        pairs = run_bad * (good[seg] - seg_good) + run_bad * run_good / 2
+        auc = np.bincount(seg, weights=pairs, minlength=n_groups) / (
+            bad * good
+        )
+        n_top = np.maximum(np.ceil(top * total).astype(np.int64), 1)
+        last = np.minimum(start + n_top, start + total) - 1
+        top_bad = cum_bad[last] - cum_bad[start] + y[start]
+        lift = (top_bad / n_top) / (bad / total)
+
+    return pd.DataFrame(
+        {
+            "total": total,
+            "bad": bad.astype(np.int64),
+            "bad_rate": bad / total,
+            "ks": ks,
+            "auc": auc,
+            "gini": 2 * auc - 1,
+            "lift": lift,
+        },
+        index=index,
+    )
+
+
+def _ks_auc(run_bad, run_good):
+    """Compute ROC points, KS and AUC from bad and good counts of runs of
+    equal scores, riskiest first."""
+    cum_bad = np.cumsum(run_bad)
+    cum_good = np.cumsum(run_good)
+    n_bad, n_good = cum_bad[-1], cum_good[-1]
+    fpr = np.append(0, cum_good) / n_good
+    tpr = np.append(0, cum_bad) / n_bad
+    ks = np.max(np.abs(tpr - fpr))
+    # Bad cases are riskier than good cases of later runs
+    pairs = run_bad * (n_good - cum_good) + run_bad * run_good / 2
+    auc = pairs.sum() / (n_bad * n_good)
+    return fpr, tpr, ks, auc
+
+
+def _runs(keys, y):
+    """Sort labels `y` by `keys` and count bad and good cases of runs of
+    equal keys."""
+    order = _stable_argsort(keys)
+    y = y[order]
+    ends = np.flatnonzero(np.append(~_ties(keys[order]), True))
+    run_bad = np.diff(np.cumsum(y)[ends], prepend=0)
+    run_good = np.diff(ends + 1, prepend=0) - run_bad
+    return y, run_bad, run_good
+
+
+def _evaluate(keys, y, tile_num):
+    """Compute ROC points, KS, AUC and the lift table of one model."""
+    y, run_bad, run_good = _runs(keys, y)
+    fpr, tpr, ks, auc = _ks_auc(run_bad, run_good)
+    tiles = _tile_ids(np.arange(1, len(y) + 1, dtype=np.int64), tile_num)
+    table = _ks_lift_table(tiles, y == 0, y == 1, tile_num)
+    return fpr, tpr, ks, auc, table
+
+
+def compare_models(
+    scores,
+    labels,
+    names=None,
+    ascending=False,
+    tile_num=10,
+    n_jobs=None,
+    plot=False,
+):
+    """Compare models, e.g. a champion and challengers, on the same labels.
+
+    Labels are checked once for all models. Models are then
+    evaluated in a pool of threads, sorting and cumulating their scores with
+    NumPy, which releases the GIL, so that models are evaluated in parallel
+    without copying labels or scores to other processes.
+
+    Parameters
+    ----------
+    scores : array, shape=[n_models, n_samples], or DataFrame
+        Scores of every model, or a data frame having models as columns.
+    labels : array, shape=[n_samples]
+        Labels, either in ['bad', 'good'] or in [0, 1].
+    names : list, optional
+        Names of the models. Defaults to ``None``, meaning columns of a data
+        frame, else ``model_0``, ``model_1`` and so on.
+    ascending : bool, optional
+        Whether low scores are the riskiest, as for points of a score card,
+        by default False, as for probabilities of being bad.
+    tile_num : int, optional
+        Number of tiles of lift tables, by default 10
+    n_jobs : int, optional
+        Number of threads, as in :func:`mono_bin_frame`, by default ``None``
+        meaning 1.
+    plot : bool, optional
+        Whether to overlay ROC curves of the models, by default False
+
+    Returns
+    -------
+    table : DataFrame
+        ``ks``, ``auc``, ``gini`` and ``lift``, the lift of the first tile,
+        of every model.
+    lift_tables : dict
+        Tables of every model, as returned by :func:`compute_ks_lift`.
+    ax : matplotlib.axes.Axes
+        Axes object with ROC curves drawn onto it, only if `plot`.
+
+    Examples
+    --------
+
+        >>> import numpy as np
+        >>> from yasc.scorecard.util import compare_models
+        >>> rng = np.random.RandomState(0)
+        >>> labels = rng.randint(0, 2, 1000)
+        >>> scores = labels + rng.randn(3, 1000) * [[1], [2], [4]]
+        >>> table, lift_tables = compare_models(scores, labels)
+        >>> table.auc.round(3)
+        model
+        model_0    0.796
+        model_1    0.642
+        model_2    0.554
+        Name: auc, dtype: float64
+
+    """
+    if isinstance(scores, pd.DataFrame):
+        if names is None:
+            names = list(scores.columns)
+        scores = scores.to_numpy(dtype=np.float64).T
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.ndim == 1:
+        scores = scores[np.newaxis]
+    if names is None:
+        names = ["model_{}".format(i) for i in range(len(scores))]
+    y = binary_labels(labels).astype(np.int64)
+
+    def evaluate(model_scores):
+        keys = model_scores if ascending else -model_scores
+        return _evaluate(keys, y, tile_num)
+
+    n_jobs = effective_n_jobs(n_jobs, len(scores))
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        results = list(executor.map(evaluate, scores))
+
+    table = pd.DataFrame(
+        [(ks, auc, 2 * auc - 1) for _, _, ks, auc, _ in results],
+        index=pd.Index(names, name="model"),
+        columns=["ks", "auc", "gini"],
+    )
+    table["lift"] = [result[4].lift[1] for result in results]
+    lift_tables = {name: result[4] for name, result in zip(names, results)}
+    if not plot:
+        return table, lift_tables
+
+    import matplotlib.pyplot as plt
+    from ._plot import _decorate_roc
+
+    _, ax = plt.subplots()
+    for name, (fpr, tpr, _, auc, _) in zip(names, results):
+        picked = _decimate(fpr, tpr)
+        ax.plot(
+            fpr[picked],
+            tpr[picked],
+            linestyle="-",
+            linewidth=2,
+            label="{} AUC={:.2f}".format(name, auc),
+        )
+    _decorate_roc(ax)
+    return table, lift_tables, ax
@@ -0,0 +1,59 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import os
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+
+
+def effective_n_jobs(n_jobs=None, n_tasks=None):
+    """Return the number of worker processes to use.
+
+    Parameters
+    ----------
+    n_jobs : int, optional
+        Number of jobs. ``None`` means 1 and negative values count back from
+        the number of CPUs, so -1 means using all of them. Defaults to ``None``.
+    n_tasks : int, optional
+        Number of tasks to run, no more jobs than tasks are used.
+
+    Returns
+    -------
+    int
+        Number of worker processes, at least 1.
+    """
+    if n_jobs is None or n_jobs == 0:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    if n_tasks is not None:
+        n_jobs = min(n_jobs, max(n_tasks, 1))
+    return n_jobs
+
+
+@contextmanager
+def shared_array(arr):
+    """Dump an array to a temporary ``.npy`` file for worker processes.
+
+    Workers open the file with :func:`load_shared`, which memory-maps it, so
+    the array is neither pickled per task nor copied per process.
+
+    Parameters
+    ----------
+    arr : array
+        The array to share.
+
+    Yields
+    ------
+    str
+        Path of the ``.npy`` file, removed when leaving the context.
+    """
+    with tempfile.TemporaryDirectory(prefix="yasc-") as tmpdir:
+        path = os.path.join(tmpdir, "shared.npy")
+        np.save(path, np.ascontiguousarray(arr))
+        yield path
+
+
+def load_shared(path):
+    """Memory-map an array shared by :func:`shared_array` as read-only."""
+    return np.load(path, mmap_mode="r")
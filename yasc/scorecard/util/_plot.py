@@ -3,10 +3,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.metrics import roc_curve, auc
 
-from ._util import compute_ks_lift
+from ._util import _decimate, compute_ks_lift
 
 
-def rocplot(y_true, y_preds, equal_aspect=False):
+def rocplot(y_true, y_preds, equal_aspect=False, max_points=1000):
     """Plot a ROC curve.
 
     Parameters
@@ -17,6 +17,10 @@ def rocplot(y_true, y_preds, equal_aspect=False):
         Predicted probability estimates of the positive class.
     equal_aspect : bool, optional
         Whether to make the aspect equal. Defaults to ``False``.
+    max_points : int, optional
+        Maximum number of points of the curve to draw, by default 1000.
+        The curve is simplified within 0.1% of the axes, while the AUC is
+        the one of the full curve. ``None`` means drawing every point.
 
     Returns
     -------
@@ -40,7 +44,15 @@ def rocplot(y_true, y_preds, equal_aspect=False):
     """
     fpr, tpr, thresholds = roc_curve(y_true, y_preds)
     roc_auc = auc(fpr, tpr)
-    fig, ax = plt.subplots()
+    _, ax = plt.subplots()
+    _draw_roc(ax, fpr, tpr, roc_auc, equal_aspect, max_points)
+    return roc_auc, ax
+
+
+def _draw_roc(ax, fpr, tpr, roc_auc, equal_aspect=False, max_points=1000):
+    """Draw a ROC curve of area `roc_auc` onto `ax`."""
+    picked = _decimate(fpr, tpr, max_points)
+    fpr, tpr = fpr[picked], tpr[picked]
     ax.plot(
         fpr,
         tpr,
@@ -49,8 +61,13 @@ def rocplot(y_true, y_preds, equal_aspect=False):
         linewidth=2,
         label="AUC={:.2f}".format(roc_auc),
     )
-    ax.plot([0, 1], [0, 1], color="red", linestyle="--", linewidth=2)
     ax.fill_between(fpr, 0, tpr, color="blue", alpha=0.2)
+    _decorate_roc(ax, equal_aspect)
+
+
+def _decorate_roc(ax, equal_aspect=False):
+    """Draw the diagonal, titles, legend and limits of ROC axes."""
+    ax.plot([0, 1], [0, 1], color="red", linestyle="--", linewidth=2)
     ax.set_title("ROC")
     ax.legend(loc="lower right")
     ax.set_xlim([0.0, 1.0])
@@ -59,10 +76,17 @@ def rocplot(y_true, y_preds, equal_aspect=False):
     ax.set_ylabel("TPR")
     if equal_aspect:
         ax.set_aspect("equal", adjustable="box")
-    return roc_auc, ax
 
 
-def ksplot(preds, labels, data=None, n=50, is_prob=True, equal_aspect=False):
+def ksplot(
+    preds,
+    labels,
+    data=None,
+    n=50,
+    is_prob=True,
+    equal_aspect=False,
+    max_points=1000,
+):
     """Plot distributions of good and bad clients, including an estimate of the KS statistics.
 
     Parameters
@@ -81,6 +105,11 @@ def ksplot(preds, labels, data=None, n=50, is_prob=True, equal_aspect=False):
         If True given, `preds` are probabilities else scores, by default True
     equal_aspect : bool, optional
         Whether to make aspect equal. Defaults to ``False``.
+    max_points : int, optional
+        Maximum number of points of every curve to draw, by default 1000.
+        Curves are simplified within 0.1% of the axes, keeping the point of
+        the KS, which is computed on all the tiles. ``None`` means drawing
+        every point.
 
     Returns
     -------
@@ -111,35 +140,52 @@ def ksplot(preds, labels, data=None, n=50, is_prob=True, equal_aspect=False):
     else:
         df_ks_lift = data.copy()
 
+    _, ax = plt.subplots()
+    _draw_ks(ax, df_ks_lift, equal_aspect, max_points)
+    return df_ks_lift, ax
+
+
+def _draw_ks(ax, df_ks_lift, equal_aspect=False, max_points=1000):
+    """Draw cumulative distributions and KS of a table returned by
+    :func:`compute_ks_lift` onto `ax`."""
     ks_value = df_ks_lift.ks.max()
     ks_pop = df_ks_lift.tile[df_ks_lift.ks.idxmax()]
+    cum_good = df_ks_lift.cum_good[df_ks_lift.ks.idxmax()]
+    cum_bad = df_ks_lift.cum_bad[df_ks_lift.ks.idxmax()]
+    drawn = df_ks_lift
+    if max_points is not None and len(df_ks_lift) > max_points:
+        # Points of the three curves share the budget
+        tile = df_ks_lift.tile.values
+        at_ks = [int(np.argmax(df_ks_lift.ks.values))]
+        picked = [
+            _decimate(tile, df_ks_lift[col].values, max_points // 3, keep=at_ks)
+            for col in ["cum_good", "cum_bad", "ks"]
+        ]
+        drawn = df_ks_lift.iloc[np.unique(np.concatenate(picked))]
 
     # Make the plot
-    _, ax = plt.subplots()
     line_settings = {"linestyle": "-", "linewidth": 2}
     ax.plot(
-        df_ks_lift.tile,
-        df_ks_lift.cum_good,
+        drawn.tile,
+        drawn.cum_good,
         label="cum_good",
         color="blue",
         **line_settings,
     )
     ax.plot(
-        df_ks_lift.tile,
-        df_ks_lift.cum_bad,
+        drawn.tile,
+        drawn.cum_bad,
         label="cum_bad",
         color="red",
         **line_settings,
     )
     ax.plot(
-        df_ks_lift.tile,
-        df_ks_lift.ks,
+        drawn.tile,
+        drawn.ks,
         label="ks",
         color="green",
         **line_settings,
     )
-    cum_good = df_ks_lift.cum_good[df_ks_lift.ks.idxmax()]
-    cum_bad = df_ks_lift.cum_bad[df_ks_lift.ks.idxmax()]
     ax.plot(
         [ks_pop, ks_pop],
         [cum_good, cum_bad],
@@ -159,7 +205,6 @@ def ksplot(preds, labels, data=None, n=50, is_prob=True, equal_aspect=False):
     ax.set_title("KS Statistics")
     if equal_aspect:
         ax.set_aspect("equal", adjustable="box")
-    return df_ks_lift, ax
 
 
 def woebinplot(
@@ -225,6 +270,27 @@ def woebinplot(
         >>> woebinplot(bin_stat, figsize=(8, 6), loc2="lower center")
     """
     fig, (ax1, ax2) = plt.subplots(1, 2, **kwargs)
+    _draw_woebin(ax1, ax2, data, stacked, grouped, width, loc1, loc2)
+    fig.tight_layout()
+    return fig, ax1, ax2
+
+
+def _annotate(ax, bars, ys):
+    """Write values `ys` above `bars` in a single call."""
+    ax.bar_label(bars, labels=["{}".format(y) for y in ys], padding=5)
+
+
+def _draw_woebin(
+    ax1,
+    ax2,
+    data,
+    stacked=False,
+    grouped=True,
+    width=0.2,
+    loc1="best",
+    loc2="best",
+):
+    """Draw counts of a binning onto `ax1` and rates onto `ax2`."""
     if stacked:
         grouped = False
     x1 = np.arange(len(data.index))
@@ -239,7 +305,7 @@ def woebinplot(
             label="good",
             edgecolor="w",
         )
-        ax1.bar(
+        bars = ax1.bar(
             x1,
             data.bad_count,
             bottom=data.good_count,
@@ -250,18 +316,11 @@ def woebinplot(
             tick_label=data.index,
         )
         # Annotate the plot
-        for x, y in zip(x1, data.total):
-            ax1.annotate(
-                "{}".format(y),
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, 5),
-                ha="center",
-            )
+        _annotate(ax1, bars, data.total)
     if grouped:
         x2 = [i + width for i in x1]
         x3 = [i + width for i in x2]
-        ax1.bar(
+        total_bars = ax1.bar(
             x1,
             data.total,
             color="silver",
@@ -269,7 +328,7 @@ def woebinplot(
             label="good + bad",
             edgecolor="w",
         )
-        ax1.bar(
+        good_bars = ax1.bar(
             x2,
             data.good_count,
             color="forestgreen",
@@ -278,7 +337,7 @@ def woebinplot(
             edgecolor="w",
             tick_label=data.index,
         )
-        ax1.bar(
+        bad_bars = ax1.bar(
             x3,
             data.bad_count,
             color="coral",
@@ -287,34 +346,13 @@ def woebinplot(
             edgecolor="w",
         )
         # Annotate the plot
-        for x, y in zip(x1, data.total):
-            ax1.annotate(
-                "{}".format(y),
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, 5),
-                ha="center",
-            )
-        for x, y in zip(x2, data.good_count):
-            ax1.annotate(
-                "{}".format(y),
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, 5),
-                ha="center",
-            )
-        for x, y in zip(x3, data.bad_count):
-            ax1.annotate(
-                "{}".format(y),
-                (x, y),
-                textcoords="offset points",
-                xytext=(0, 5),
-                ha="center",
-            )
+        _annotate(ax1, total_bars, data.total)
+        _annotate(ax1, good_bars, data.good_count)
+        _annotate(ax1, bad_bars, data.bad_count)
     ax1.set_xlabel("Bins")
     ax1.set_ylabel("Count per Bin")
     ax1.legend(loc=loc1)
-    ax1.set_title("iv: {:.4f}".format(data.iv_sum[0]))
+    ax1.set_title("iv: {:.4f}".format(data.iv_sum.iloc[0]))
     ax2.plot(x1, data.bad_rate, marker="o", color="coral", label="bad rate")
     ax2.plot(
         x1,
@@ -343,6 +381,5 @@ def woebinplot(
         )
     ax2.set_xlabel("Bins")
     ax2.legend(loc=loc2)
-    plt.xticks(x1, data.index)
-    fig.tight_layout()
-    return fig, ax1, ax2
+    ax2.set_xticks(x1)
+    ax2.set_xticklabels(data.index)
@@ -0,0 +1,216 @@
+# Author: Liqiang Du <keris.du@gmail.com>
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from sklearn.metrics import roc_curve, auc
+
+from ._check import binary_labels
+from ._parallel import effective_n_jobs
+from ._plot import _draw_ks, _draw_roc, _draw_woebin
+from ._util import _decimate, compute_ks_lift
+
+
+__all__ = ["plot_report"]
+
+# Charts rendered per task
+_CHUNK_SIZE = 25
+
+
+class _Canvas:
+    """Figures reused for every chart of a kind.
+
+    Figures are created without pyplot, so that they are not kept alive by
+    its figure manager, and drawn with the Agg backend whatever backend is
+    in use. Their axes are cleared rather than created again before every
+    chart, and margins are fixed instead of computing a tight layout.
+    """
+
+    def __init__(self, figsize):
+        self.figsize = figsize
+        self.figures = {}
+
+    def axes(self, kind):
+        if kind not in self.figures:
+            fig = Figure(figsize=self.figsize)
+            FigureCanvasAgg(fig)
+            if kind == "woebin":
+                axes = fig.subplots(1, 2)
+                fig.subplots_adjust(
+                    left=0.06, right=0.98, bottom=0.12, top=0.85, wspace=0.15
+                )
+            else:
+                axes = [fig.subplots()]
+                fig.subplots_adjust(left=0.3, right=0.7, bottom=0.12, top=0.9)
+            self.figures[kind] = fig, axes
+        fig, axes = self.figures[kind]
+        for ax in axes:
+            ax.cla()
+        return fig, axes
+
+    def draw(self, name, kind, data, kwargs):
+        fig, axes = self.axes(kind)
+        if kind == "woebin":
+            _draw_woebin(*axes, data, **kwargs)
+            fig.suptitle(name)
+        elif kind == "roc":
+            _draw_roc(axes[0], *data)
+        else:
+            _draw_ks(axes[0], data)
+        return fig
+
+    def close(self):
+        for fig, _ in self.figures.values():
+            fig.clear()
+        self.figures.clear()
+
+
+def _render(charts, directory, figsize, dpi, kwargs):
+    """Render charts to PNG files in `directory`."""
+    canvas = _Canvas(figsize)
+    paths = []
+    try:
+        for filename, name, kind, data in charts:
+            fig = canvas.draw(name, kind, data, kwargs)
+            path = os.path.join(directory, filename + ".png")
+            fig.savefig(path, dpi=dpi)
+            paths.append(path)
+    finally:
+        canvas.close()
+    return paths
+
+
+def _roc(preds, labels, is_prob):
+    """Return the decimated ROC curve of predictions and its AUC."""
+    preds = np.asarray(preds, dtype=np.float64)
+    # Low scores are the riskiest, as in the KS chart
+    fpr, tpr, _ = roc_curve(labels, preds if is_prob else -preds)
+    picked = _decimate(fpr, tpr)
+    return fpr[picked], tpr[picked], auc(fpr, tpr)
+
+
+def _filenames(names):
+    """Make unique file names of chart names."""
+    seen = set()
+    filenames = []
+    for name in names:
+        filename = re.sub(r"[^\w.-]+", "_", name)
+        stem, i = filename, 1
+        while filename in seen:
+            filename = "{}_{}".format(stem, i)
+            i += 1
+        seen.add(filename)
+        filenames.append(filename)
+    return filenames
+
+
+def plot_report(
+    bin_stats,
+    path,
+    preds=None,
+    labels=None,
+    is_prob=True,
+    n_jobs=None,
+    figsize=(12, 4.5),
+    dpi=100,
+    **kwargs,
+):
+    """Render binning, ROC and KS plots of many variables to files.
+
+    Plots are drawn as with :func:`woebinplot`, :func:`rocplot` and
+    :func:`ksplot`, but headless with the Agg backend, onto figures which
+    are reused from one chart to the next and cleared once all are saved,
+    so that memory does not grow with the number of variables. PNG files
+    are rendered in chunks on a pool of processes.
+
+    Parameters
+    ----------
+    bin_stats : dict
+        Mapping of variables to their statistics of binning, as returned by
+        :func:`mono_bin_frame`.
+    path : str
+        Either a ``.pdf`` file, to write all the charts as pages of it, or
+        a directory, created if needed, to write every chart as a PNG file
+        named after its variable.
+    preds : array, shape=[n_samples], optional
+        Predicted values. If given with `labels`, ROC and KS charts are
+        rendered as well.
+    labels : array, shape=[n_samples], optional
+        Labels, either in ['bad', 'good'] or in [0, 1].
+    is_prob : bool, optional
+        If True given, `preds` are probabilities else scores, by default True
+    n_jobs : int, optional
+        Number of processes rendering PNG files, as in
+        :func:`mono_bin_frame`, by default ``None`` meaning 1. Pages of a
+        PDF file are rendered in order by the calling process.
+    figsize : tuple, optional
+        Size of the figures in inches, by default (12, 4.5)
+    dpi : int, optional
+        Resolution of PNG files, by default 100
+    **kwargs
+        Other parameters of :func:`woebinplot`, e.g. `stacked`.
+
+    Returns
+    -------
+    list
+        Paths of the written files.
+
+    Examples
+    --------
+
+        >>> from yasc.data import german_data
+        >>> from yasc.scorecard import mono_bin_frame
+        >>> from yasc.scorecard.util import plot_report
+        >>> data = german_data()
+        >>> bin_stats, _ = mono_bin_frame(data, "Creditability", duplicates="drop")
+        >>> paths = plot_report(bin_stats, "report", n_jobs=-1)
+    """
+    charts = [
+        ("woebin_{}".format(var), str(var), "woebin", bin_stat)
+        for var, bin_stat in bin_stats.items()
+    ]
+    if preds is not None and labels is not None:
+        labels = binary_labels(labels)
+        roc = _roc(preds, labels, is_prob)
+        df_ks_lift = compute_ks_lift(
+            preds, labels, ascending=(not is_prob), tile_num=50
+        )
+        charts += [("roc", "ROC", "roc", roc), ("ks", "KS", "ks", df_ks_lift)]
+    filenames = _filenames([filename for filename, _, _, _ in charts])
+    charts = [
+        (filename, name, kind, data)
+        for filename, (_, name, kind, data) in zip(filenames, charts)
+    ]
+
+    if path.lower().endswith(".pdf"):
+        canvas = _Canvas(figsize)
+        try:
+            with PdfPages(path) as pdf:
+                for _, name, kind, data in charts:
+                    pdf.savefig(canvas.draw(name, kind, data, kwargs))
+        finally:
+            canvas.close()
+        return [path]
+
+    os.makedirs(path, exist_ok=True)
+    chunks = [
+        charts[i : i + _CHUNK_SIZE] for i in range(0, len(charts), _CHUNK_SIZE)
+    ]
+    n_jobs = effective_n_jobs(n_jobs, len(chunks))
+    if n_jobs == 1:
+        return _render(charts, path, figsize, dpi, kwargs)
+    with ProcessPoolExecutor(n_jobs) as executor:
+        results = executor.map(
+            _render,
+            chunks,
+            repeat(path),
+            repeat(figsize),
+            repeat(dpi),
+            repeat(kwargs),
+        )
+        return [path for paths in results for path in paths]
@@ -1,53 +1,190 @@
 # Author: Liqiang Du <keris.du@gmail.com>
+import heapq
+
 import pandas as pd
 import numpy as np
 
 
-def compute_ks_lift(preds, labels, ascending=False, tile_num=None):
-    df = pd.DataFrame(dict(pred=preds, label=labels))
+def _ties(keys):
+    """Return whether every sorted key but the first equals the previous
+    one, missing values being equal."""
+    nan = np.isnan(keys)
+    return (keys[1:] == keys[:-1]) | (nan[1:] & nan[:-1])
+
+
+def _stable_argsort(keys):
+    """Sort like ``np.argsort(keys, kind="stable")``.
+
+    Keys are sorted with quicksort, then only positions of equal keys are
+    sorted again, which is much faster than a stable sort when few keys are
+    equal.
+    """
+    n = len(keys)
+    order = np.argsort(keys)
+    same = _ties(keys[order])
+    if same.any():
+        tied = np.zeros(n, dtype=bool)
+        tied[1:] |= same
+        tied[:-1] |= same
+        runs = np.cumsum(np.append(True, ~same))[tied]
+        order[tied] = np.sort(runs * n + order[tied]) % n
+    return order
+
+
+def _tie_ends(keys):
+    """Return the position of the last element of the run of equal sorted
+    `keys` every element belongs to."""
+    ends = np.flatnonzero(np.append(~_ties(keys), True))
+    return np.repeat(ends, np.diff(ends, prepend=-1))
+
+
+def _max_deviation(x, y, start, end):
+    """Return the largest distance of points strictly between `start` and
+    `end` from the chord joining them, and the position of that point."""
+    if end - start < 2:
+        return 0.0, start
+    dx, dy = x[end] - x[start], y[end] - y[start]
+    px, py = x[start + 1 : end] - x[start], y[start + 1 : end] - y[start]
+    norm = np.hypot(dx, dy)
+    if norm > 0:
+        dist = np.abs(dx * py - dy * px) / norm
+    else:
+        dist = np.hypot(px, py)
+    i = int(np.argmax(dist))
+    return float(dist[i]), start + 1 + i
+
+
+def _decimate(x, y, max_points=1000, tolerance=1e-3, keep=()):
+    """Return positions of points of a curve enough to draw it.
+
+    Points are picked as with the Douglas-Peucker algorithm, splitting
+    first the segment farthest from the curve, until every point left out
+    is within `tolerance` of the drawn curve or `max_points` are picked.
+    Points at positions `keep`, e.g. the one of the KS, are always picked.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+    picked = set(keep) | {0, n - 1}
+    bounds = sorted(picked)
+    heap = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        dist, i = _max_deviation(x, y, start, end)
+        heapq.heappush(heap, (-dist, start, end, i))
+    while heap and len(picked) < max_points:
+        dist, start, end, i = heapq.heappop(heap)
+        if -dist <= tolerance:
+            break
+        picked.add(i)
+        for a, b in [(start, i), (i, end)]:
+            dist, j = _max_deviation(x, y, a, b)
+            heapq.heappush(heap, (-dist, a, b, j))
+    return np.array(sorted(picked))
+
+
+def compute_ks_lift(
+    preds, labels, ascending=False, tile_num=None, tie_aware=False
+):
+    """Compute KS and lift of predictions by tiles.
+
+    Predictions are sorted once, with equal predictions kept in their
+    original order and missing ones last, and split into `tile_num` tiles
+    of nearly equal sizes, tile ids being derived with integer arithmetic.
+    Good and bad clients of tiles are counted with :func:`numpy.bincount`.
+
+    Parameters
+    ----------
+    preds : array, shape=[n_samples]
+        Predicted values, either scores or probabilities.
+    labels : array, shape=[n_samples]
+        True binary labels, 0 indicating a good client and 1 a bad client.
+    ascending : bool, optional
+        Whether to sort predictions ascending, by default False, as for
+        probabilities of being bad.
+    tile_num : int, optional
+        Number of tiles. Defaults to ``None``, meaning a tile per sample.
+    tie_aware : bool, optional
+        If True, equal predictions are never split across tiles: they all
+        go to the tile of the last of them, and the `tile` column is then
+        the share of the population up to the tile. Defaults to False.
+
+    Returns
+    -------
+    DataFrame
+        Statistics of every nonempty tile, after a first row of zeros:
+        ``tile``, ``good``, ``bad``, ``good_distri``, ``bad_distri``,
+        ``bad_rate``, ``cum_bad_rate``, ``lift``, ``cum_good``, ``cum_bad``
+        and ``ks``.
+    """
+    preds = np.asarray(preds, dtype=np.float64)
+    labels = np.asarray(labels)
+    n = len(preds)
     if tile_num is None:
-        tile_num = len(df.index)
-
-    def good(x):
-        return sum(x == 0)
-
-    def bad(x):
-        return sum(x == 1)
-
-    df_ks_lift = (
-        df.sort_values(by="pred", ascending=ascending)
-        .reset_index(drop=True)
-        .assign(
-            tile=lambda x: np.ceil((x.index + 1) / (len(x.index) / tile_num))
-        )
-        .groupby("tile")["label"]
-        .agg([good, bad])
-        .reset_index()
-        .assign(
-            tile=lambda x: (x.index + 1) / len(x.index),
-            good_distri=lambda x: x.good / sum(x.good),
-            bad_distri=lambda x: x.bad / sum(x.bad),
-            bad_rate=lambda x: x.bad / (x.bad + x.good),
-            cum_bad_rate=lambda x: np.cumsum(x.bad) / np.cumsum(x.bad + x.good),
-            lift=lambda x: (np.cumsum(x.bad) / np.cumsum(x.bad + x.good))
-            / (sum(x.bad) / sum(x.bad + x.good)),
-            cum_good=lambda x: np.cumsum(x.good) / sum(x.good),
-            cum_bad=lambda x: np.cumsum(x.bad) / sum(x.bad),
-        )
-        .assign(ks=lambda x: abs(x.cum_bad - x.cum_good))
+        tile_num = n
+
+    keys = preds if ascending else -preds
+    order = _stable_argsort(keys)
+    labels = labels[order]
+    tiles = _tile_ids(np.arange(1, n + 1, dtype=np.int64), tile_num)
+    if tie_aware:
+        tiles = tiles[_tie_ends(keys[order])]
+
+    return _ks_lift_table(
+        tiles, labels == 0, labels == 1, tile_num, share=tie_aware
     )
+
+
+def _tile_ids(cum_total, tile_num):
+    """Return ids from 1 to `tile_num` of tiles of nearly equal sizes ending
+    at cumulative counts `cum_total`."""
+    n = cum_total[-1] if len(cum_total) else 0
+    # ceil(cum_total / (n / tile_num)) without rounding errors
+    return (cum_total * tile_num + n - 1) // max(n, 1)
+
+
+def _ks_lift_table(tiles, good, bad, tile_num, total=None, share=False):
+    """Aggregate good and bad counts by tile into KS and lift statistics.
+
+    `good`, `bad` and `total` are counts, or weights, of positions of tile
+    ids `tiles`, sorted from the riskiest tile. The `tile` column is the
+    share of the population up to the tile if `share`, else the rank of the
+    tile over the number of nonempty tiles.
+    """
+    size = tile_num + 1
+    total = np.bincount(tiles, weights=total, minlength=size)
+    good = np.bincount(tiles, weights=good, minlength=size)
+    bad = np.bincount(tiles, weights=bad, minlength=size)
+    nonempty = total > 0
+    good = good[nonempty].astype(np.int64)
+    bad = bad[nonempty].astype(np.int64)
+    if share:
+        tile = np.cumsum(total[nonempty]) / total.sum()
+    else:
+        tile = np.arange(1, len(good) + 1) / len(good)
+    cum_good = np.cumsum(good)
+    cum_bad = np.cumsum(bad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cum_bad_rate = cum_bad / (cum_good + cum_bad)
+        columns = {
+            "tile": tile,
+            "good": good,
+            "bad": bad,
+            "good_distri": good / cum_good[-1:],
+            "bad_distri": bad / cum_bad[-1:],
+            "bad_rate": bad / (bad + good),
+            "cum_bad_rate": cum_bad_rate,
+            "lift": cum_bad_rate / cum_bad_rate[-1:],
+            "cum_good": cum_good / cum_good[-1:],
+            "cum_bad": cum_bad / cum_bad[-1:],
+        }
+    columns["ks"] = np.abs(columns["cum_bad"] - columns["cum_good"])
     # Prepend 0
-    df_ks_lift = pd.concat(
-        [
-            pd.DataFrame(
-                {
-                    c: 0 if c not in ["cum_bad_rate", "lift"] else np.nan
-                    for c in df_ks_lift.columns
-                },
-                index=np.arange(1),
-            ),
-            df_ks_lift,
-        ],
-        ignore_index=True,
+    df_ks_lift = pd.DataFrame(
+        {
+            c: np.append(np.nan if c in ["cum_bad_rate", "lift"] else 0, v)
+            for c, v in columns.items()
+        }
     )
     return df_ks_lift